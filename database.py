@@ -1,16 +1,21 @@
 """
 Database connection management for Air-Scenting Logger
 """
-from sqlalchemy import create_engine, text
+import sqlite3
+from pathlib import Path
+from sqlalchemy import create_engine, event, text
 import config  # Import module, not the variables
 
-def get_db_url():
+def get_db_url(db_type=None):
     """Get database URL, handling runtime password configuration"""
-    if config.DB_TYPE == "sqlite":
+    if db_type is None:
+        db_type = config.DB_TYPE
+
+    if db_type == "sqlite":
         return config.DB_CONFIG["sqlite"]["url"]
     else:
         # For postgres, supabase, mysql - check if URL has been set at runtime
-        url = config.DB_CONFIG[config.DB_TYPE].get("url")
+        url = config.DB_CONFIG[db_type].get("url")
 
         # print(f"DEBUG URL: {url}") # added by ahg
         # import traceback
@@ -22,31 +27,182 @@ def get_db_url():
             return url
         else:
             # If not set, return template (will fail, but that's expected if password not provided)
-            url_template = config.DB_CONFIG[config.DB_TYPE].get("url_template", "")
+            url_template = config.DB_CONFIG[db_type].get("url_template", "")
             # Return template with placeholder - this will cause an error if used
             return url_template.format(password="PASSWORD_NOT_SET")
 
-# Create engine based on DB_TYPE
-engine = create_engine(
-    get_db_url(),
-    echo=False,  # Set to True to see SQL queries for debugging
-    # SQLite-specific: enable foreign keys (disabled by default)
-    connect_args={"check_same_thread": False} if config.DB_TYPE == "sqlite" else {}
+
+# Applied to every new SQLite connection. WAL lets the list refreshes read while
+# a write is in progress; synchronous=NORMAL is safe in WAL mode and only syncs
+# at checkpoints instead of on every commit.
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",  # disabled by default
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8000",  # KiB (8 MB)
+    "PRAGMA mmap_size = 268435456",
 )
 
-# Track if we've enabled foreign keys for SQLite
-_sqlite_foreign_keys_enabled = False
-
-def get_connection():
-    """Get a new database connection"""
-    global _sqlite_foreign_keys_enabled
-    
-    # Enable foreign keys for SQLite on first connection (creates DB file)
-    if config.DB_TYPE == "sqlite" and not _sqlite_foreign_keys_enabled:
-        conn = engine.connect()
-        conn.execute(text("PRAGMA foreign_keys = ON"))
-        conn.commit()
-        _sqlite_foreign_keys_enabled = True
-        return conn
-    
-    return engine.connect()
+def _configure_sqlite_connection(dbapi_conn, connection_record):
+    """SQLite-specific: enable foreign keys and WAL/cache tuning on every new connection"""
+    cursor = dbapi_conn.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# Number of commits made through any engine in this process. Callers can use
+# it as a cheap "has anything been written since?" stamp for cached reads.
+_commit_count = 0
+
+def _count_commit(conn):
+    global _commit_count
+    _commit_count += 1
+
+def get_commit_count():
+    """Get the number of commits made through this module's engines"""
+    return _commit_count
+
+
+# (url, engine) pairs keyed by db_type, built on first use. Callers pass the
+# db_type they want instead of switching config.DB_TYPE, so each pool lives
+# for the whole session.
+_engines = {}
+
+def get_engine(db_type=None):
+    """
+    Get the engine for a database type (defaults to config.DB_TYPE)
+
+    The engine is created once and cached. If the URL for that type has
+    changed since (password set, SQLite folder moved), the old engine is
+    disposed and a new one built.
+    """
+    if db_type is None:
+        db_type = config.DB_TYPE
+    url = get_db_url(db_type)
+
+    cached_url, cached = _engines.get(db_type, (None, None))
+    if cached is not None:
+        if cached_url == url:
+            return cached
+        cached.dispose()
+
+    if db_type == "sqlite":
+        # Local file - default pool is fine. Open read/write without create so
+        # a missing file fails on connect ("unable to open database file")
+        # instead of leaving an empty database behind; create_database makes it.
+        db_uri = Path(url.replace("sqlite:///", "", 1)).resolve().as_uri() + "?mode=rw"
+        new_engine = create_engine(
+            url,
+            echo=False,  # Set to True to see SQL queries for debugging
+            creator=lambda: sqlite3.connect(db_uri, uri=True, check_same_thread=False)
+        )
+        event.listen(new_engine, "connect", _configure_sqlite_connection)
+    else:
+        # Networked databases - keep a few warm connections so each query is a
+        # pool checkout rather than a fresh TCP/TLS handshake. pre_ping drops
+        # connections the server (or Supabase pooler) has closed; LIFO keeps
+        # reusing the most recently active one.
+        new_engine = create_engine(
+            url,
+            echo=False,  # Set to True to see SQL queries for debugging
+            pool_size=5,
+            max_overflow=5,
+            pool_pre_ping=True,
+            pool_use_lifo=True,
+            pool_recycle=300
+        )
+
+    event.listen(new_engine, "commit", _count_commit)
+
+    _engines[db_type] = (url, new_engine)
+    return new_engine
+
+def dispose_engines():
+    """Close every cached engine's pool; the next get_engine() builds a fresh engine"""
+    for _url, cached in _engines.values():
+        cached.dispose()
+    _engines.clear()
+
+def get_connection(db_type=None):
+    """Get a new database connection (for db_type, defaulting to config.DB_TYPE)"""
+    return get_engine(db_type).connect()
+
+
+# INSERT/DELETE for the name tables, built once and shared by the single-row
+# adds/removes and the bulk restores
+INSERT_NAME = {
+    "dogs": text("INSERT INTO dogs (name, user_name) VALUES (:name, :user_name)"),
+    "training_locations": text("INSERT INTO training_locations (name, user_name) VALUES (:name, :user_name)"),
+    "terrain_types": text("INSERT INTO terrain_types (name, user_name) VALUES (:name, :user_name)"),
+    "distraction_types": text("INSERT INTO distraction_types (name, user_name) VALUES (:name, :user_name)"),
+}
+
+DELETE_NAME = {
+    table: text(f"DELETE FROM {table} WHERE name = :name")
+    for table in INSERT_NAME
+}
+
+# A session's child rows - used by the session save and the backup restore
+INSERT_SELECTED_TERRAIN = text(
+    "INSERT INTO selected_terrains (session_id, terrain_name, user_name) "
+    "VALUES (:session_id, :terrain_name, :user_name)"
+)
+
+INSERT_SUBJECT_RESPONSE = text(
+    "INSERT INTO subject_responses (session_id, subject_number, tfr, refind, user_name) "
+    "VALUES (:session_id, :subject_number, :tfr, :refind, :user_name)"
+)
+
+# "Insert unless the name is taken" for the bulk adds, by dialect name. The SELECT
+# in _add_names already drops known names; this covers one added by another
+# client in between, which would otherwise fail the whole executemany.
+_INSERT_NAME_IGNORE_SQL = {
+    "sqlite": "INSERT OR IGNORE INTO {table} (name, user_name) VALUES (:name, :user_name)",
+    "postgresql": "INSERT INTO {table} (name, user_name) VALUES (:name, :user_name) ON CONFLICT (name) DO NOTHING",
+    "mysql": "INSERT IGNORE INTO {table} (name, user_name) VALUES (:name, :user_name)",
+}
+
+INSERT_NAME_IGNORE = {
+    dialect: {table: text(sql.format(table=table)) for table in INSERT_NAME}
+    for dialect, sql in _INSERT_NAME_IGNORE_SQL.items()
+}
+
+def _add_names(conn, table, names, user_name):
+    """Insert the names not already in table on an open connection; returns rows added"""
+    existing = set(conn.execute(text(f"SELECT name FROM {table}")).scalars())
+    rows = [{"name": name, "user_name": user_name}
+            for name in dict.fromkeys(names) if name and name not in existing]
+    if rows:
+        insert = INSERT_NAME_IGNORE.get(conn.dialect.name, INSERT_NAME)[table]
+        conn.execute(insert, rows)
+    return len(rows)
+
+def bulk_add_names(table, names, user_name, db_type=None):
+    """
+    Add names to dogs/training_locations/terrain_types/distraction_types
+
+    Names already in the table are skipped (one SELECT up front), the rest
+    go in as a single insert-or-ignore executemany in one transaction, so a
+    name another client adds meanwhile doesn't fail the batch.
+
+    Returns:
+        Number of rows added
+    """
+    with get_engine(db_type).begin() as conn:
+        return _add_names(conn, table, names, user_name)
+
+def bulk_add_name_lists(name_lists, user_name, db_type=None):
+    """
+    Add names to several name tables in one transaction
+
+    Same as bulk_add_names, but for a {table: names} mapping - every table
+    shares one connection and one commit.
+
+    Returns:
+        {table: number of rows added}
+    """
+    with get_engine(db_type).begin() as conn:
+        return {table: _add_names(conn, table, names, user_name) if names else 0
+                for table, names in name_lists.items()}
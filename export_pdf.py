@@ -322,7 +322,7 @@ def fetch_sessions_for_export(dog_name, range_type, start_value, end_value, sort
                 text("SELECT terrain_name FROM selected_terrains WHERE session_id = :session_id ORDER BY terrain_name"),
                 {"session_id": session_id}
             )
-            terrains = [t[0] for t in terrain_result.fetchall()]
+            terrains = terrain_result.scalars().all()
             
             # Get subject responses for this session
             subject_result = conn.execute(
@@ -3,15 +3,29 @@ Database schema for Air-Scenting Logger
 Defines tables and creates them in the database
 """
 from sqlalchemy import text
-from database import engine, get_connection
-from config import DB_TYPE
+from database import get_connection
+import config
 
 
-def create_tables():
-    """Create all database tables"""
+def _begin_ddl(conn, db_type):
+    """
+    Open an explicit transaction for a batch of DDL statements on SQLite
+    
+    The sqlite3 driver only starts transactions implicitly before DML, so
+    each CREATE/DROP would otherwise autocommit (and sync the journal) on
+    its own. Postgres/MySQL already run the batch in one transaction.
+    """
+    if db_type == "sqlite":
+        conn.exec_driver_sql("BEGIN")
+
+
+def create_tables(db_type=None):
+    """Create all database tables (for db_type, defaulting to config.DB_TYPE)"""
+    if db_type is None:
+        db_type = config.DB_TYPE
     
     # Auto-increment syntax differs between databases
-    if DB_TYPE == "sqlite":
+    if db_type == "sqlite":
         dog_id_type = "INTEGER PRIMARY KEY AUTOINCREMENT"
         session_id_type = "INTEGER PRIMARY KEY AUTOINCREMENT"
         settings_id_type = "INTEGER PRIMARY KEY AUTOINCREMENT"
@@ -137,31 +151,45 @@ def create_tables():
     )
     """
     
-    with get_connection() as conn:
-        # Create settings table
-        conn.execute(text(settings_table))
-        # Create dogs table
-        conn.execute(text(dogs_table))
-        # Create training_locations table
-        conn.execute(text(locations_table))
-        # Create terrain_types table
-        conn.execute(text(terrain_table))
-        # Create distraction_types table
-        conn.execute(text(distraction_table))
-        # Create training_sessions table
-        conn.execute(text(sessions_table))
-        # Create selected_terrains table
-        conn.execute(text(selected_terrains_table))
-        # Create subject_responses table
-        conn.execute(text(subject_responses_table))
+    # Creation order matters - later tables reference earlier ones
+    statements = (
+        settings_table,
+        dogs_table,
+        locations_table,
+        terrain_table,
+        distraction_table,
+        sessions_table,
+        selected_terrains_table,
+        subject_responses_table,
+    )
+    
+    # name is UNIQUE, so ORDER BY name already walks that index. These cover the
+    # other sorted reads: type lists by sort_order, and a session's terrains /
+    # subject responses (filtered by session_id, ordered by name/number).
+    # MySQL has no CREATE INDEX IF NOT EXISTS, so it keeps sorting at query time.
+    if db_type != "mysql":
+        statements += (
+            "CREATE INDEX IF NOT EXISTS ix_terrain_types_sort ON terrain_types (sort_order, name)",
+            "CREATE INDEX IF NOT EXISTS ix_distraction_types_sort ON distraction_types (sort_order, name)",
+            "CREATE INDEX IF NOT EXISTS ix_selected_terrains_session ON selected_terrains (session_id, terrain_name)",
+            "CREATE INDEX IF NOT EXISTS ix_subject_responses_session ON subject_responses (session_id, subject_number)",
+        )
+    
+    with get_connection(db_type) as conn:
+        _begin_ddl(conn, db_type)
+        for statement in statements:
+            conn.execute(text(statement))
         conn.commit()
         
         print("Database tables created successfully")
 
 
-def drop_tables():
+def drop_tables(db_type=None):
     """Drop all tables (use with caution!)"""
-    with get_connection() as conn:
+    if db_type is None:
+        db_type = config.DB_TYPE
+    with get_connection(db_type) as conn:
+        _begin_ddl(conn, db_type)
         conn.execute(text("DROP TABLE IF EXISTS subject_responses"))
         conn.execute(text("DROP TABLE IF EXISTS selected_terrains"))
         conn.execute(text("DROP TABLE IF EXISTS training_sessions"))
@@ -176,4 +204,8 @@ def drop_tables():
 
 if __name__ == "__main__":
     # Allow running this file directly to create tables
+    if config.DB_TYPE == "sqlite":
+        # The engine only opens existing SQLite files - create it first
+        import sqlite3
+        sqlite3.connect(config.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")).close()
     create_tables()
@@ -14,20 +14,106 @@ Date: 2025-12-31
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
+import gc
 import json
 import os
+import sqlite3
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from getpass import getuser
-from sqlalchemy import text
+from typing import NamedTuple, Optional
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
+import config
+import database
+from schema import create_tables, drop_tables
 import sv  # Import centralized StringVars module
 from ui_database import DatabaseOperations
 from ui_misc_data_ops import MiscDataOperations
 import ui_utils
+from working_dialog import run_with_working_dialog
+
+
+def _is_missing_db_error(e):
+    """True if a query failed because the database/tables haven't been created yet"""
+    # Missing tables/files surface as OperationalError (SQLite, failed connects)
+    # or ProgrammingError (Postgres/MySQL) - any other exception is a real error
+    if not isinstance(e, (OperationalError, ProgrammingError)):
+        return False
+    orig = e.orig
+    if getattr(orig, "pgcode", None) == "42P01":  # Postgres undefined_table
+        return True
+    if orig.args and orig.args[0] == 1146:  # MySQL ER_NO_SUCH_TABLE
+        return True
+    # SQLite reports both cases with generic error codes - check the message
+    message = str(orig).lower()
+    return ("no such table" in message or "does not exist" in message
+            or "unable to open database file" in message)
+
+
+# Database type radiobuttons (label, value)
+DB_CHOICES = (
+    ("SQLite", "sqlite"),
+    ("PostgreSQL", "postgres"),
+    ("Supabase", "supabase"),
+    ("MySQL", "mysql"),
+)
+
+
+def _exec_with_dbtype(db_type, statement, params):
+    """Run one statement against the db_type database in its own transaction"""
+    with database.get_engine(db_type).begin() as conn:
+        conn.execute(statement, params)
+
+
+# Name-list queries, built once and reused by every refresh (see _load_names)
+_SELECT_NAMES = {
+    table: text(f"SELECT name FROM {table} ORDER BY name")
+    for table in ("training_locations", "dogs", "terrain_types", "distraction_types")
+}
+
+
+class _NameList(NamedTuple):
+    """
+    A name list edited on the Setup tab (see SetupTab._add_name/_remove_name)
+    
+    Apart from table and label, the fields are attribute names: new_var on
+    sv, the rest on SetupTab. A list has set_names (listbox, updated in
+    place) or reload (tree, re-read from the database).
+    """
+    table: str
+    label: str                         # For messages ("terrain type")
+    widget: str                        # Listbox or Treeview
+    entry: str
+    new_var: str                       # sv StringVar behind the entry
+    update_states: str                 # Add button state updater
+    remove_button: str
+    set_names: Optional[str] = None    # Listboxes: show a new tuple of names in place
+    reload: Optional[str] = None       # Trees: reload the list from the database
 
 
 class SetupTab:
     """Manages the Setup tab UI and all related operations"""
     
+    # Name lists edited on the Setup tab, for _add_name/_remove_name
+    _NAME_LISTS = {
+        "location": _NameList("training_locations", "location", "s_location_listbox", "s_location_entry",
+                              "new_location", "update_location_button_states", "s_remove_location_btn",
+                              set_names="_set_location_names"),
+        "dog": _NameList("dogs", "dog", "s_dog_listbox", "s_dog_entry",
+                         "new_dog", "update_dog_button_states", "s_remove_dog_btn",
+                         set_names="_set_dog_names"),
+        "terrain": _NameList("terrain_types", "terrain type", "s_terrain_tree", "s_terrain_entry",
+                             "new_terrain", "update_terrain_button_states", "s_remove_terrain_btn",
+                             reload="load_terrain_from_database"),
+        "distraction": _NameList("distraction_types", "distraction type", "s_distraction_type_tree",
+                                 "s_distraction_entry", "new_distraction",
+                                 "update_distraction_type_button_states", "s_remove_distraction_type_btn",
+                                 reload="load_distraction_from_database"),
+    }
+    
     def __init__(self, parent_ui):
         """
         Initialize Setup tab manager
@@ -40,29 +126,49 @@ class SetupTab:
         # Initialize Setup tab widgets (will be created in setup_setup_tab)
         # Note: StringVars are in sv module, not here
         self.s_create_db_btn = None
+        self._last_create_db_state = None
         self.s_location_listbox = None
+        self.s_locations_var = None
+        self.s_location_entry = None
         self.s_add_location_btn = None
         self.s_remove_location_btn = None
         self.s_dog_listbox = None
+        self.s_dogs_var = None
+        self.s_dog_entry = None
         self.s_add_dog_btn = None
         self.s_remove_dog_btn = None
         self.s_terrain_tree = None
+        self.s_terrain_entry = None
         self.s_add_terrain_btn = None
         self.s_remove_terrain_btn = None
         self.s_move_terrain_up_btn = None
         self.s_move_terrain_down_btn = None
         self.s_distraction_type_tree = None
+        self.s_distraction_entry = None
         self.s_add_distraction_type_btn = None
         self.s_remove_distraction_type_btn = None
         self.s_move_distraction_type_up_btn = None
         self.s_move_distraction_type_down_btn = None
+        
+        # Set by the main UI once the Entry tab (and its dog/location/terrain
+        # comboboxes) exists - checked on every list refresh instead of hasattr
+        self.entry_tab_built = False
+        
+        # SQLite name lists, keyed by (db_type, table) - see _load_names
+        self._names_cache = {}
+        # Table names present per db_type, from the inspector: db_type -> (stamp, set)
+        self._tables_present = {}
+        
+        # Worker threads for list queries, and the keys with a query running - see _submit
+        self._db_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="setup-db")
+        self._db_in_flight = {}
+        # Per-table count of in-place list updates - a load started before the
+        # latest one is dropped, see _mark_list_changed
+        self._list_generation = {}
     
     def get_default_distraction_types(self):
         """Get the default distraction type list"""
-        return [
-            "Critter", "Horse", "Loud noise", "Motorcycle", "Hikers", 
-            "Cow", "Vehicle"
-        ]
+        return ui_utils.get_default_distraction_types()
 
 
     def setup_setup_tab(self):
@@ -73,76 +179,87 @@ class SetupTab:
         canvas = tk.Canvas(self.ui.setup_tab)
         scrollbar = ttk.Scrollbar(self.ui.setup_tab, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+
+        # Debounce scrollregion updates - a resize drag fires <Configure> for every
+        # pixel, so only recompute the bbox once the drag has settled (100ms)
+        scroll_after_id = None
+        
+        def update_scrollregion():
+            nonlocal scroll_after_id
+            scroll_after_id = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def on_frame_configure(event):
+            nonlocal scroll_after_id
+            if scroll_after_id:
+                canvas.after_cancel(scroll_after_id)
+            scroll_after_id = canvas.after(100, update_scrollregion)
+
+        scrollable_frame.bind("<Configure>", on_frame_configure)
+
+        window_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Keep inner frame as wide as the canvas (no horizontal scrollregion recompute)
+        canvas.bind("<Configure>", lambda e: canvas.itemconfig(window_id, width=e.width))
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        frame = tk.Frame(scrollable_frame, padx=20, pady=20)
+        # Shared button widths for the management columns (themed widgets take
+        # their width from the style instead of per-widget options)
+        style = ttk.Style()
+        style.configure("Setup.TButton", width=15)
+        style.configure("SetupWide.TButton", width=17)
+        
+        frame = ttk.Frame(scrollable_frame, padding=20)
         frame.pack(fill="both", expand=True)
         
         # Database Type Selection
-        db_type_frame = tk.LabelFrame(frame, text="Database Type", padx=10, pady=5)
+        db_type_frame = ttk.LabelFrame(frame, text="Database Type", padding=(10, 5))
         db_type_frame.pack(fill="x", pady=5)
         
         # REMOVED: sv.db_type = tk.StringVar(value=self.ui.config.get("db_type", "sqlite"))  # StringVar already in sv module
         
-        radio_container = tk.Frame(db_type_frame)
+        radio_container = ttk.Frame(db_type_frame)
         radio_container.pack(pady=5)
         
-        tk.Radiobutton(radio_container, text="SQLite", variable=sv.db_type, 
-                      value="sqlite", command=self.ui.on_db_type_changed).pack(side="left", padx=20)
-        tk.Radiobutton(radio_container, text="PostgreSQL", variable=sv.db_type, 
-                      value="postgres", command=self.ui.on_db_type_changed).pack(side="left", padx=20)
-        tk.Radiobutton(radio_container, text="Supabase", variable=sv.db_type, 
-                      value="supabase", command=self.ui.on_db_type_changed).pack(side="left", padx=20)
-        tk.Radiobutton(radio_container, text="MySQL", variable=sv.db_type, 
-                      value="mysql", command=self.ui.on_db_type_changed).pack(side="left", padx=20)
+        for label, value in DB_CHOICES:
+            ttk.Radiobutton(radio_container, text=label, variable=sv.db_type,
+                          value=value, command=self._on_db_type_click).pack(side="left", padx=20)
         
         # Database Password (for postgres, supabase, mysql)
-        self.s_db_password_frame = tk.Frame(db_type_frame)
+        self.s_db_password_frame = ttk.Frame(db_type_frame)
         self.s_db_password_frame.pack(pady=5)
         
-        tk.Label(self.s_db_password_frame, text="Database Password:").pack(side="left", padx=5)
-        self.s_db_password_entry = tk.Entry(self.s_db_password_frame, textvariable=sv.db_password, 
+        ttk.Label(self.s_db_password_frame, text="Database Password:").pack(side="left", padx=5)
+        self.s_db_password_entry = ttk.Entry(self.s_db_password_frame, textvariable=sv.db_password, 
                                           width=30, show="*")
         self.s_db_password_entry.pack(side="left", padx=5)
         
         # Add right-click context menu for password entry (Cut/Copy/Paste)
         self.ui.add_entry_context_menu(self.s_db_password_entry)
         
-        # Show/Hide password checkbox
-        tk.Checkbutton(self.s_db_password_frame, text="Show", variable=sv.show_password,
-                      command=self.ui.toggle_password_visibility).pack(side="left", padx=5)
-        
-        # Remember Password checkbox
-        tk.Checkbutton(self.s_db_password_frame, text="Remember", variable=sv.remember_password).pack(side="left", padx=5)
+        # Show/Hide and Remember Password checkboxes
+        for label, variable, command in (("Show", sv.show_password, self.ui.toggle_password_visibility),
+                                         ("Remember", sv.remember_password, None)):
+            ttk.Checkbutton(self.s_db_password_frame, text=label, variable=variable,
+                          command=command).pack(side="left", padx=5)
         
         # Forget Password button
-        tk.Button(self.s_db_password_frame, text="Forget Saved Password", 
+        ttk.Button(self.s_db_password_frame, text="Forget Saved Password", 
                  command=self.ui.forget_password, width=18).pack(side="left", padx=5)
         
-        # Add trace to update Create Database button when database type changes
-        sv.db_type.trace_add('write', self.update_create_db_button_state)
-        
-        # Initialize button state and password field visibility
-        self.ui.root.after(100, self.update_create_db_button_state)
-        self.ui.root.after(100, self.ui.on_db_type_changed)
+        # Initialize password field visibility and button state once the tab is built
+        self.ui.root.after_idle(self._on_db_type_click)
         
         # Database folder selection
-        db_frame = tk.LabelFrame(frame, text="Database Folder", padx=10, pady=5)
+        db_frame = ttk.LabelFrame(frame, text="Database Folder", padding=(10, 5))
         db_frame.pack(fill="x", pady=5)
         
-        tk.Entry(db_frame, textvariable=sv.db_path, width=70).pack(side="left", padx=5)
-        tk.Button(db_frame, text="Browse", command=self.ui.file_ops.select_db_folder).pack(side="left", padx=5)
-        self.s_create_db_btn = tk.Button(db_frame, text="Create Database", 
+        ttk.Entry(db_frame, textvariable=sv.db_path, width=70).pack(side="left", padx=5)
+        ttk.Button(db_frame, text="Browse", command=self.ui.file_ops.select_db_folder).pack(side="left", padx=5)
+        self.s_create_db_btn = ttk.Button(db_frame, text="Create Database", 
                                        command=self.create_database, state="disabled")
         self.s_create_db_btn.pack(side="left", padx=5)
         
@@ -150,231 +267,209 @@ class SetupTab:
         sv.db_path.trace_add('write', self.update_create_db_button_state)
         
         # Trail maps folder
-        folder_frame = tk.LabelFrame(frame, text="Trail Maps Storage Folder", padx=10, pady=5)
+        folder_frame = ttk.LabelFrame(frame, text="Trail Maps Storage Folder", padding=(10, 5))
         folder_frame.pack(fill="x", pady=5)
         
-        tk.Entry(folder_frame, textvariable=sv.trail_maps_folder, width=70).pack(side="left", padx=5)
-        tk.Button(folder_frame, text="Browse", command=self.ui.file_ops.select_folder).pack(side="left", padx=5)
+        ttk.Entry(folder_frame, textvariable=sv.trail_maps_folder, width=70).pack(side="left", padx=5)
+        ttk.Button(folder_frame, text="Browse", command=self.ui.file_ops.select_folder).pack(side="left", padx=5)
         
         # Backup folder
-        backup_frame = tk.LabelFrame(frame, text="Backup Folder", padx=10, pady=5)
+        backup_frame = ttk.LabelFrame(frame, text="Backup Folder", padding=(10, 5))
         backup_frame.pack(fill="x", pady=5)
         
-        tk.Entry(backup_frame, textvariable=sv.backup_folder, width=70).pack(side="left", padx=5)
-        tk.Button(backup_frame, text="Browse", command=self.ui.file_ops.select_backup_folder).pack(side="left", padx=5)
-        tk.Button(backup_frame, text="Restore Settings from Backup", 
+        ttk.Entry(backup_frame, textvariable=sv.backup_folder, width=70).pack(side="left", padx=5)
+        ttk.Button(backup_frame, text="Browse", command=self.ui.file_ops.select_backup_folder).pack(side="left", padx=5)
+        ttk.Button(backup_frame, text="Restore Settings from Backup", 
                  command=self.ui.misc_data_ops.restore_settings_from_json).pack(side="left", padx=5)
         
         # Default values
-        defaults_frame = tk.LabelFrame(frame, text="Default Values (Optional)", padx=10, pady=5)
+        defaults_frame = ttk.LabelFrame(frame, text="Default Values (Optional)", padding=(10, 5))
         defaults_frame.pack(fill="x", pady=5)
         
-        tk.Label(defaults_frame, text="Handler Name:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        ttk.Label(defaults_frame, text="Handler Name:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
         # REMOVED: sv.default_handler = tk.StringVar(value=self.ui.config.get("handler_name", ""))  # StringVar already in sv module
-        tk.Entry(defaults_frame, textvariable=sv.default_handler, width=30).grid(row=0, column=1, padx=5, pady=2)
+        ttk.Entry(defaults_frame, textvariable=sv.default_handler, width=30).grid(row=0, column=1, padx=5, pady=2)
         
         # Note about saving
-        tk.Label(defaults_frame, text="(Click 'Save Configuration' button at bottom to save all settings)",
-                font=("Helvetica", 8, "italic"), fg="gray").grid(row=1, column=0, columnspan=2, pady=5)
+        ttk.Label(defaults_frame, text="(Click 'Save Configuration' button at bottom to save all settings)",
+                font=("Helvetica", 8, "italic"), foreground="gray").grid(row=1, column=0, columnspan=2, pady=5)
         
         # Container frame for the management sections (uses grid internally)
-        management_container = tk.Frame(frame)
+        management_container = ttk.Frame(frame)
         management_container.pack(fill="both", expand=True, pady=5)
         
         # Create vertical container for column 0 (Training Locations and Dog Names)
-        column0_container = tk.Frame(management_container)
+        column0_container = ttk.Frame(management_container)
         column0_container.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
         
         # Training Locations Management
-        locations_frame = tk.LabelFrame(column0_container, text="Training Locations", padx=10, pady=5)
+        locations_frame = ttk.LabelFrame(column0_container, text="Training Locations", padding=(10, 5))
         locations_frame.pack(fill="x", pady=(0, 5))
         
-        # Listbox with scrollbar
-        loc_list_frame = tk.Frame(locations_frame)
+        # Listbox with scrollbar (rows come from a Tcl list variable so a reload is a single set())
+        self.s_locations_var = tk.Variable(value=())
+        loc_list_frame, self.s_location_listbox = ui_utils.make_scrollable(
+            locations_frame, tk.Listbox, listvariable=self.s_locations_var, height=4)
         loc_list_frame.pack(side="left", fill="both", expand=True)
         
-        loc_scrollbar = tk.Scrollbar(loc_list_frame)
-        loc_scrollbar.pack(side="right", fill="y")
-        
-        self.s_location_listbox = tk.Listbox(loc_list_frame, yscrollcommand=loc_scrollbar.set, height=4)
-        self.s_location_listbox.pack(side="left", fill="both", expand=True)
-        loc_scrollbar.config(command=self.s_location_listbox.yview)
-        
-        # Populate listbox with locations from database
-        self.load_locations_from_database()
+        # Populate listbox with locations from database (deferred)
+        # NOTE: Not loaded here - populate_setup_tab_lists() fills it once the password is loaded
         
         # Buttons for managing locations
-        loc_button_frame = tk.Frame(locations_frame)
+        loc_button_frame = ttk.Frame(locations_frame)
         loc_button_frame.pack(side="right", padx=(10, 0))
         
-        tk.Label(loc_button_frame, text="Location:").pack(anchor="w")
+        ttk.Label(loc_button_frame, text="Location:").pack(anchor="w")
         # REMOVED: sv.new_location = tk.StringVar()  # StringVar already in sv module
-        location_entry = tk.Entry(loc_button_frame, textvariable=sv.new_location, width=20)
+        self.s_location_entry = location_entry = ttk.Entry(loc_button_frame, textvariable=sv.new_location, width=20)
         location_entry.pack(pady=2)
         location_entry.bind('<Return>', lambda e: self.add_location())
         
-        self.s_add_location_btn = tk.Button(loc_button_frame, text="Add Location", 
-                                         command=self.add_location, width=15, state="disabled")
+        self.s_add_location_btn = ttk.Button(loc_button_frame, text="Add Location", 
+                                         command=self.add_location, style="Setup.TButton", state="disabled")
         self.s_add_location_btn.pack(pady=2)
         
-        self.s_remove_location_btn = tk.Button(loc_button_frame, text="Remove Selected", 
-                                            command=self.remove_location, width=15, state="disabled")
+        self.s_remove_location_btn = ttk.Button(loc_button_frame, text="Remove Selected", 
+                                            command=self.remove_location, style="Setup.TButton", state="disabled")
         self.s_remove_location_btn.pack(pady=2)
         
-        # Add trace and selection binding for locations
-        sv.new_location.trace_add('write', self.update_location_button_states)
+        # Add key binding and selection binding for locations
+        self._bind_add_button_state(location_entry, self.update_location_button_states)
         self.s_location_listbox.bind('<<ListboxSelect>>', self.on_location_select)
         
         # Dog Names Management
-        dogs_frame = tk.LabelFrame(column0_container, text="Dog Names", padx=10, pady=5)
+        dogs_frame = ttk.LabelFrame(column0_container, text="Dog Names", padding=(10, 5))
         dogs_frame.pack(fill="x")
         
         # Listbox with scrollbar
-        list_frame = tk.Frame(dogs_frame)
+        self.s_dogs_var = tk.Variable(value=())
+        list_frame, self.s_dog_listbox = ui_utils.make_scrollable(
+            dogs_frame, tk.Listbox, listvariable=self.s_dogs_var, height=3)
         list_frame.pack(side="left", fill="both", expand=True)
         
-        scrollbar = tk.Scrollbar(list_frame)
-        scrollbar.pack(side="right", fill="y")
-        
-        self.s_dog_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set, height=3)
-        self.s_dog_listbox.pack(side="left", fill="both", expand=True)
-        scrollbar.config(command=self.s_dog_listbox.yview)
-        
-        # Populate listbox with dogs from database
-        self.load_dogs_from_database()
+        # Populate listbox with dogs from database (deferred)
+        # NOTE: Not loaded here - populate_setup_tab_lists() fills it once the password is loaded
         
         # Buttons for managing dogs
-        button_frame = tk.Frame(dogs_frame)
+        button_frame = ttk.Frame(dogs_frame)
         button_frame.pack(side="right", padx=(10, 0))
         
-        tk.Label(button_frame, text="Dog Name:").pack(anchor="w")
+        ttk.Label(button_frame, text="Dog Name:").pack(anchor="w")
         # REMOVED: sv.new_dog = tk.StringVar()  # StringVar already in sv module
-        dog_entry = tk.Entry(button_frame, textvariable=sv.new_dog, width=20)
+        self.s_dog_entry = dog_entry = ttk.Entry(button_frame, textvariable=sv.new_dog, width=20)
         dog_entry.pack(pady=2)
         dog_entry.bind('<Return>', lambda e: self.add_dog())
         
-        self.s_add_dog_btn = tk.Button(button_frame, text="Add Dog", 
-                                     command=self.add_dog, width=15, state="disabled")
+        self.s_add_dog_btn = ttk.Button(button_frame, text="Add Dog", 
+                                     command=self.add_dog, style="Setup.TButton", state="disabled")
         self.s_add_dog_btn.pack(pady=2)
         
-        self.s_remove_dog_btn = tk.Button(button_frame, text="Remove Selected", 
-                                       command=self.remove_dog, width=15, state="disabled")
+        self.s_remove_dog_btn = ttk.Button(button_frame, text="Remove Selected", 
+                                       command=self.remove_dog, style="Setup.TButton", state="disabled")
         self.s_remove_dog_btn.pack(pady=2)
         
-        # Add trace to entry field and bind listbox selection
-        sv.new_dog.trace_add('write', self.update_dog_button_states)
+        # Add key binding to entry field and bind listbox selection
+        self._bind_add_button_state(dog_entry, self.update_dog_button_states)
         self.s_dog_listbox.bind('<<ListboxSelect>>', self.on_dog_select)
         
         # Terrain Types Management
-        terrain_frame = tk.LabelFrame(management_container, text="Terrain Types", padx=10, pady=5)
+        terrain_frame = ttk.LabelFrame(management_container, text="Terrain Types", padding=(10, 5))
         terrain_frame.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
         
         # Treeview with scrollbar
-        tree_frame = tk.Frame(terrain_frame)
+        tree_frame, self.s_terrain_tree = ui_utils.make_scrollable(
+            terrain_frame, ttk.Treeview, columns=('Terrain',), show='tree headings',
+            height=8, selectmode='browse')
         tree_frame.pack(side="left", fill="both", expand=True)
-        
-        tree_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
-        tree_scrollbar.pack(side="right", fill="y")
-        
-        self.s_terrain_tree = ttk.Treeview(tree_frame, columns=('Terrain',), show='tree headings', 
-                                        yscrollcommand=tree_scrollbar.set, height=8, selectmode='browse')
         self.s_terrain_tree.heading('#0', text='#')
         self.s_terrain_tree.heading('Terrain', text='Terrain Type')
         self.s_terrain_tree.column('#0', width=40)
         self.s_terrain_tree.column('Terrain', width=150)
-        self.s_terrain_tree.pack(side="left", fill="both", expand=True)
-        tree_scrollbar.config(command=self.s_terrain_tree.yview)
         
-        # Populate treeview with terrain types from database
-        self.load_terrain_from_database()
+        # Populate treeview with terrain types from database (deferred)
+        # NOTE: Not loaded here - populate_setup_tab_lists() fills it once the password is loaded
         
         # Buttons for managing terrain types
-        terrain_button_frame = tk.Frame(terrain_frame)
+        terrain_button_frame = ttk.Frame(terrain_frame)
         terrain_button_frame.pack(side="right", padx=(10, 0))
         
-        tk.Label(terrain_button_frame, text="Terrain Type:").pack(anchor="w")
+        ttk.Label(terrain_button_frame, text="Terrain Type:").pack(anchor="w")
         # REMOVED: sv.new_terrain = tk.StringVar()  # StringVar already in sv module
-        terrain_entry = tk.Entry(terrain_button_frame, textvariable=sv.new_terrain, width=20)
+        self.s_terrain_entry = terrain_entry = ttk.Entry(terrain_button_frame, textvariable=sv.new_terrain, width=20)
         terrain_entry.pack(pady=2)
         terrain_entry.bind('<Return>', lambda e: self.add_terrain_type())
         
-        self.s_add_terrain_btn = tk.Button(terrain_button_frame, text="Add Terrain Type", 
-                                        command=self.add_terrain_type, width=15, state="disabled")
+        self.s_add_terrain_btn = ttk.Button(terrain_button_frame, text="Add Terrain Type", 
+                                        command=self.add_terrain_type, style="Setup.TButton", state="disabled")
         self.s_add_terrain_btn.pack(pady=2)
         
-        self.s_remove_terrain_btn = tk.Button(terrain_button_frame, text="Remove Selected", 
-                                           command=self.remove_terrain_type, width=15, state="disabled")
+        self.s_remove_terrain_btn = ttk.Button(terrain_button_frame, text="Remove Selected", 
+                                           command=self.remove_terrain_type, style="Setup.TButton", state="disabled")
         self.s_remove_terrain_btn.pack(pady=2)
         
-        self.s_move_terrain_up_btn = tk.Button(terrain_button_frame, text="Move Up", 
-                                            command=self.move_terrain_up, width=15, state="disabled")
+        self.s_move_terrain_up_btn = ttk.Button(terrain_button_frame, text="Move Up", 
+                                            command=self.move_terrain_up, style="Setup.TButton", state="disabled")
         self.s_move_terrain_up_btn.pack(pady=2)
         
-        self.s_move_terrain_down_btn = tk.Button(terrain_button_frame, text="Move Down", 
-                                              command=self.move_terrain_down, width=15, state="disabled")
+        self.s_move_terrain_down_btn = ttk.Button(terrain_button_frame, text="Move Down", 
+                                              command=self.move_terrain_down, style="Setup.TButton", state="disabled")
         self.s_move_terrain_down_btn.pack(pady=2)
         
-        tk.Button(terrain_button_frame, text="Restore Defaults", 
-                 command=self.restore_default_terrain_types, width=15).pack(pady=2)
+        ttk.Button(terrain_button_frame, text="Restore Defaults", 
+                 command=self.restore_default_terrain_types, style="Setup.TButton").pack(pady=2)
         
-        # Add trace and selection binding
-        sv.new_terrain.trace_add('write', self.update_terrain_button_states)
+        # Add key binding and selection binding
+        self._bind_add_button_state(terrain_entry, self.update_terrain_button_states)
         self.s_terrain_tree.bind('<<TreeviewSelect>>', self.on_terrain_select)
         
         # Distraction Types Management
-        distraction_frame = tk.LabelFrame(management_container, text="Distraction Types", padx=10, pady=5)
+        distraction_frame = ttk.LabelFrame(management_container, text="Distraction Types", padding=(10, 5))
         distraction_frame.grid(row=0, column=2, sticky="nsew", padx=5, pady=5)
         
         # Treeview with scrollbar
-        dist_tree_frame = tk.Frame(distraction_frame)
+        dist_tree_frame, self.s_distraction_type_tree = ui_utils.make_scrollable(
+            distraction_frame, ttk.Treeview, columns=('Distraction',), show='tree headings',
+            height=8, selectmode='browse')
         dist_tree_frame.pack(side="left", fill="both", expand=True)
-        
-        dist_tree_scrollbar = ttk.Scrollbar(dist_tree_frame, orient="vertical")
-        dist_tree_scrollbar.pack(side="right", fill="y")
-        
-        self.s_distraction_type_tree = ttk.Treeview(dist_tree_frame, columns=('Distraction',), show='tree headings', 
-                                                 yscrollcommand=dist_tree_scrollbar.set, height=8, selectmode='browse')
         self.s_distraction_type_tree.heading('#0', text='#')
         self.s_distraction_type_tree.heading('Distraction', text='Distraction Type')
         self.s_distraction_type_tree.column('#0', width=40)
         self.s_distraction_type_tree.column('Distraction', width=150)
-        self.s_distraction_type_tree.pack(side="left", fill="both", expand=True)
-        dist_tree_scrollbar.config(command=self.s_distraction_type_tree.yview)
         
-        # Populate treeview with distraction types from database
-        self.load_distraction_from_database()
+        # Populate treeview with distraction types from database (deferred)
+        # NOTE: Not loaded here - populate_setup_tab_lists() fills it once the password is loaded
         
         # Buttons for managing distraction types
-        distraction_button_frame = tk.Frame(distraction_frame)
+        distraction_button_frame = ttk.Frame(distraction_frame)
         distraction_button_frame.pack(side="right", padx=(10, 0))
         
-        tk.Label(distraction_button_frame, text="Distraction Type:").pack(anchor="w")
+        ttk.Label(distraction_button_frame, text="Distraction Type:").pack(anchor="w")
         # REMOVED: sv.new_distraction = tk.StringVar()  # StringVar already in sv module
-        distraction_entry = tk.Entry(distraction_button_frame, textvariable=sv.new_distraction, width=20)
+        self.s_distraction_entry = distraction_entry = ttk.Entry(distraction_button_frame, textvariable=sv.new_distraction, width=20)
         distraction_entry.pack(pady=2)
         distraction_entry.bind('<Return>', lambda e: self.add_distraction_type())
         
-        self.s_add_distraction_type_btn = tk.Button(distraction_button_frame, text="Add Distraction Type", 
-                                                 command=self.add_distraction_type, width=17, state="disabled")
+        self.s_add_distraction_type_btn = ttk.Button(distraction_button_frame, text="Add Distraction Type", 
+                                                 command=self.add_distraction_type, style="SetupWide.TButton", state="disabled")
         self.s_add_distraction_type_btn.pack(pady=2)
         
-        self.s_remove_distraction_type_btn = tk.Button(distraction_button_frame, text="Remove Selected", 
-                                                    command=self.remove_distraction_type, width=17, state="disabled")
+        self.s_remove_distraction_type_btn = ttk.Button(distraction_button_frame, text="Remove Selected", 
+                                                    command=self.remove_distraction_type, style="SetupWide.TButton", state="disabled")
         self.s_remove_distraction_type_btn.pack(pady=2)
         
-        self.s_move_distraction_type_up_btn = tk.Button(distraction_button_frame, text="Move Up", 
-                                                     command=self.move_distraction_up, width=17, state="disabled")
+        self.s_move_distraction_type_up_btn = ttk.Button(distraction_button_frame, text="Move Up", 
+                                                     command=self.move_distraction_up, style="SetupWide.TButton", state="disabled")
         self.s_move_distraction_type_up_btn.pack(pady=2)
         
-        self.s_move_distraction_type_down_btn = tk.Button(distraction_button_frame, text="Move Down", 
-                                                       command=self.move_distraction_down, width=17, state="disabled")
+        self.s_move_distraction_type_down_btn = ttk.Button(distraction_button_frame, text="Move Down", 
+                                                       command=self.move_distraction_down, style="SetupWide.TButton", state="disabled")
         self.s_move_distraction_type_down_btn.pack(pady=2)
         
-        tk.Button(distraction_button_frame, text="Restore Defaults", 
-                 command=self.restore_default_distraction_types, width=17).pack(pady=2)
+        ttk.Button(distraction_button_frame, text="Restore Defaults", 
+                 command=self.restore_default_distraction_types, style="SetupWide.TButton").pack(pady=2)
         
-        # Add trace and selection binding
-        sv.new_distraction.trace_add('write', self.update_distraction_type_button_states)
+        # Add key binding and selection binding
+        self._bind_add_button_state(distraction_entry, self.update_distraction_type_button_states)
         self.s_distraction_type_tree.bind('<<TreeviewSelect>>', self.on_distraction_type_select)
         
         # Configure grid weights so they expand properly
@@ -383,7 +478,7 @@ class SetupTab:
         management_container.grid_columnconfigure(2, weight=1)
         
         # Save Configuration Button
-        save_config_frame = tk.Frame(frame)
+        save_config_frame = ttk.Frame(frame)
         save_config_frame.pack(pady=20)
         
         tk.Button(save_config_frame, text="💾 Save Configuration",
@@ -391,8 +486,8 @@ class SetupTab:
                  bg="#4CAF50", fg="white", font=("Helvetica", 12, "bold"),
                  width=30, height=2).pack()
         
-        tk.Label(save_config_frame, text="Save all file paths and settings to config file",
-                font=("Helvetica", 9, "italic"), fg="gray").pack(pady=(5, 0))
+        ttk.Label(save_config_frame, text="Save all file paths and settings to config file",
+                 font=("Helvetica", 9, "italic"), foreground="gray").pack(pady=(5, 0))
     
     def setup_entry_tab(self):
         """Setup the Training Session Entry tab"""
@@ -425,6 +520,11 @@ class SetupTab:
             sv.backup_folder.set(folder)
             self.ui.machine_backup_folder = folder
 
+    def _on_db_type_click(self):
+        """Database type radiobutton clicked - update password field and Create button"""
+        self.ui.on_db_type_changed()
+        self.update_create_db_button_state()
+
     def update_create_db_button_state(self, *args):
         """Enable/disable Create Database button based on folder selection and database type"""
         db_type = sv.db_type.get()
@@ -432,14 +532,18 @@ class SetupTab:
         
         # For SQLite, require folder. For postgres/supabase, always enable
         if db_type == "sqlite":
-            self.s_create_db_btn.config(state="normal" if has_folder else "disabled")
+            state = "normal" if has_folder else "disabled"
         else:  # postgres or supabase
-            self.s_create_db_btn.config(state="normal")
+            state = "normal"
+        
+        # db_path trace fires on every keystroke - skip redundant reconfigures
+        if state == self._last_create_db_state:
+            return
+        self._last_create_db_state = state
+        self.s_create_db_btn.config(state=state)
 
     def create_database(self):
         """Create or rebuild database schema"""
-        from pathlib import Path
-        
         # Get selected database type
         db_type = sv.db_type.get()
         
@@ -472,21 +576,17 @@ class SetupTab:
                 
                 # Close any existing database connections
                 try:
-                    from database import engine
-                    engine.dispose()
+                    database.get_engine("sqlite").dispose()
                     
                     # Force garbage collection to release connections
-                    import gc
                     gc.collect()
                     
                     # Wait for OS to release file locks
-                    import time
                     time.sleep(1.0)
                     
                     sv.status.set("Closed database connections...")
                     
                     # Give OS time to release file locks (especially on Windows)
-                    import time
                     time.sleep(0.5)
                 except Exception as e:
                     print(f"Note: Could not dispose engine: {e}")
@@ -518,84 +618,77 @@ class SetupTab:
             
             # Create new SQLite database with schema
             try:
-                import sqlite3
                 conn = sqlite3.connect(str(db_path))
                 conn.close()
                 
-                # Update config.py temporarily for schema creation
-                import config
-                old_db_type = config.DB_TYPE
-                old_db_url = config.DB_CONFIG[old_db_type]["url"]
-                
-                # Temporarily point to the new database
-                config.DB_TYPE = "sqlite"
+                # Temporarily point the sqlite URL at the new database -
+                # get_engine("sqlite") builds a fresh engine for it
+                old_db_url = config.DB_CONFIG["sqlite"]["url"]
                 config.DB_CONFIG["sqlite"]["url"] = f"sqlite:///{db_path}"
-                
-                # Recreate engine with new database
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                # Create schema
-                from schema import create_tables
-                create_tables()
-                
-                # Restore original config
-                config.DB_TYPE = old_db_type
-                config.DB_CONFIG[old_db_type]["url"] = old_db_url
-                database.engine.dispose()
-                reload(database)
-                
-                sv.status.set(f"Database created: {db_path}")
-                messagebox.showinfo(
-                    "Success", 
-                    f"SQLite database created successfully!\n\n{db_path}\n\n"
-                    f"Schema initialized with training_sessions table."
-                )
-                
-                # Offer to restore from JSON backups
-                self.ui.misc_data_ops.restore_from_json_backups("sqlite")
-                
-                # Offer to load default terrain and distraction types
-                self.ui.misc_data_ops.offer_load_default_types("sqlite")
-                
-                # Update session number and UI after database recreation
-                sv.session_number.set(str(DatabaseOperations(self.ui).get_next_session_number()))
-                self.ui.selected_sessions = []
-                self.ui.selected_sessions_index = -1
-                self.ui.navigation.update_navigation_buttons()
-                # Clear form to new entry state
-                self.ui.set_date(datetime.now().strftime("%Y-%m-%d"))
-                sv.session_purpose.set("")
-                sv.field_support.set("")
-                sv.dog.set("")
-                sv.search_area_size.set("")
-                sv.num_subjects.set("")
-                sv.handler_knowledge.set("")
-                sv.weather.set("")
-                sv.temperature.set("")
-                sv.wind_direction.set("")
-                sv.wind_speed.set("")
-                sv.search_type.set("")
-                sv.drive_level.set("")
-                sv.subjects_found.set("")
-                # Update subjects_found combo state (will disable since num_subjects is blank)
-                self.ui.form_mgmt.update_subjects_found()
-                
-                # Refresh dog list on Setup tab (new database has no dogs)
-                self.refresh_dog_list()
-                
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to create database:\n{e}\n\n{type(e).__name__}")
-                import traceback
                 traceback.print_exc()
+                return
+            
+            def restore_config():
+                config.DB_CONFIG["sqlite"]["url"] = old_db_url
+                database.get_engine("sqlite")  # disposes the engine for the temporary URL
+            
+            def on_created(_result):
+                self._tables_present.pop("sqlite", None)
+                try:
+                    # Restore original config
+                    restore_config()
+                    
+                    sv.status.set(f"Database created: {db_path}")
+                    messagebox.showinfo(
+                        "Success", 
+                        f"SQLite database created successfully!\n\n{db_path}\n\n"
+                        f"Schema initialized with training_sessions table."
+                    )
+                    
+                    # Offer to restore from JSON backups
+                    self.ui.misc_data_ops.restore_from_json_backups("sqlite")
+                    
+                    # Offer to load default terrain and distraction types
+                    self.ui.misc_data_ops.offer_load_default_types("sqlite")
+                    
+                    # Update session number and UI after database recreation
+                    sv.session_number.set(str(DatabaseOperations(self.ui).get_next_session_number()))
+                    self.ui.selected_sessions = []
+                    self.ui.selected_sessions_index = -1
+                    self.ui.navigation.update_navigation_buttons()
+                    # Clear form to new entry state
+                    self._reset_entry_form()
+                    
+                    # Refresh dog list on Setup tab (new database has no dogs)
+                    self.refresh_dog_list()
+                    
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to create database:\n{e}\n\n{type(e).__name__}")
+                    traceback.print_exc()
+            
+            def on_failed(e):
+                try:
+                    restore_config()
+                except Exception:
+                    pass
+                messagebox.showerror("Error", f"Failed to create database:\n{e}\n\n{type(e).__name__}")
+            
+            # Run the DDL on a worker thread so the mainloop keeps painting;
+            # dialogs and widget updates happen in the callbacks on the Tk thread
+            run_with_working_dialog(
+                self.ui.root,
+                lambda: create_tables("sqlite"),
+                "Creating database schema...",
+                title="Creating Database",
+                on_complete=on_created,
+                on_error=on_failed
+            )
         
         else:  # postgres or supabase
             # For Supabase, check if password has been configured
             if db_type == "supabase":
-                import config
                 supabase_url = config.DB_CONFIG["supabase"]["url"]
                 if "[YOUR-PASSWORD]" in supabase_url:
                     messagebox.showerror(
@@ -609,34 +702,15 @@ class SetupTab:
             
             # For PostgreSQL/Supabase, check if tables exist and offer to rebuild
             try:
-                # Temporarily switch to the selected database type
-                import config
-                old_db_type = config.DB_TYPE
-                
-                config.DB_TYPE = db_type
-                
-                # Reload database module with new DB_TYPE
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                from schema import create_tables, drop_tables
-                from sqlalchemy import text
-                
                 # Check if training_sessions table exists
-                with database.get_connection() as conn:
-                    check_query = text("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_name = 'training_sessions'
-                        )
-                    """)
-                    
-                    result = conn.execute(check_query)
-                    table_exists = result.scalar()
-                
+                # Reuse the table list the Setup list loaders already read, if it
+                # is for this URL; otherwise one inspector lookup
+                cached = self._tables_present.get(db_type)
+                if cached is not None and cached[0][0] == database.get_db_url(db_type):
+                    table_exists = "training_sessions" in cached[1]
+                else:
+                    table_exists = inspect(database.get_engine(db_type)).has_table("training_sessions")
+
                 if table_exists:
                     result = messagebox.askyesno(
                         "Database Tables Exist",
@@ -646,354 +720,300 @@ class SetupTab:
                         icon='warning'
                     )
                     if not result:
-                        # Restore original DB_TYPE
-                        config.DB_TYPE = old_db_type
-                        database.engine.dispose()
-                        reload(database)
                         return
                     
-                    # Drop existing tables
-                    drop_tables()
-                    sv.status.set("Dropped existing tables...")
-                
-                # Create tables
-                create_tables()
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                sv.status.set(f"{db_type.title()} schema created successfully")
-                messagebox.showinfo(
-                    "Success",
-                    f"{db_type.title()} database schema created successfully!\n\n"
-                    f"Tables initialized:\n"
-                    f"  - training_sessions"
-                )
-                
-                # Offer to restore from JSON backups
-                self.ui.misc_data_ops.restore_from_json_backups(db_type)
-                
-                # Offer to load default terrain and distraction types
-                self.ui.misc_data_ops.offer_load_default_types(db_type)
-                
-                # Update session number and UI after database recreation
-                sv.session_number.set(str(DatabaseOperations(self.ui).get_next_session_number()))
-                self.ui.selected_sessions = []
-                self.ui.selected_sessions_index = -1
-                self.ui.navigation.update_navigation_buttons()
-                # Clear form to new entry state
-                self.ui.set_date(datetime.now().strftime("%Y-%m-%d"))
-                sv.session_purpose.set("")
-                sv.field_support.set("")
-                sv.dog.set("")
-                sv.search_area_size.set("")
-                sv.num_subjects.set("")
-                sv.handler_knowledge.set("")
-                sv.weather.set("")
-                sv.temperature.set("")
-                sv.wind_direction.set("")
-                sv.wind_speed.set("")
-                sv.search_type.set("")
-                sv.drive_level.set("")
-                sv.subjects_found.set("")
-                # Update subjects_found combo state (will disable since num_subjects is blank)
-                self.ui.form_mgmt.update_subjects_found()
-                
-                # Refresh dog list on Setup tab (new database has no dogs)
-                self.refresh_dog_list()
-                
+                    sv.status.set("Dropping existing tables...")
             except Exception as e:
-                # Restore original DB_TYPE on error
+                self._on_remote_schema_error(db_type, e)
+                return
+            
+            def build_schema():
+                # Drop existing tables, then create tables
+                if table_exists:
+                    drop_tables(db_type)
+                create_tables(db_type)
+            
+            def on_created(_result):
+                self._tables_present.pop(db_type, None)
                 try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
-                messagebox.showerror(
-                    "Database Error",
-                    f"Failed to create {db_type} database schema:\n\n{e}\n\n{type(e).__name__}\n\n"
-                    f"Make sure:\n"
-                    f"1. Database connection is configured in config.py\n"
-                    f"2. Password is set correctly (replace [YOUR-PASSWORD])\n"
-                    f"3. You have network access to Supabase\n"
-                    f"4. Credentials are correct"
-                )
-                import traceback
-                traceback.print_exc()
+                    sv.status.set(f"{db_type.title()} schema created successfully")
+                    messagebox.showinfo(
+                        "Success",
+                        f"{db_type.title()} database schema created successfully!\n\n"
+                        f"Tables initialized:\n"
+                        f"  - training_sessions"
+                    )
+                    
+                    # Offer to restore from JSON backups
+                    self.ui.misc_data_ops.restore_from_json_backups(db_type)
+                    
+                    # Offer to load default terrain and distraction types
+                    self.ui.misc_data_ops.offer_load_default_types(db_type)
+                    
+                    # Update session number and UI after database recreation
+                    sv.session_number.set(str(DatabaseOperations(self.ui).get_next_session_number()))
+                    self.ui.selected_sessions = []
+                    self.ui.selected_sessions_index = -1
+                    self.ui.navigation.update_navigation_buttons()
+                    # Clear form to new entry state
+                    self._reset_entry_form()
+                    
+                    # Refresh dog list on Setup tab (new database has no dogs)
+                    self.refresh_dog_list()
+                    
+                except Exception as e:
+                    self._on_remote_schema_error(db_type, e)
+            
+            # Run the DDL (network round-trips) on a worker thread so the mainloop
+            # keeps painting; dialogs and widget updates happen in the callbacks
+            run_with_working_dialog(
+                self.ui.root,
+                build_schema,
+                f"Creating {db_type} database schema...",
+                title="Creating Database",
+                on_complete=on_created,
+                on_error=lambda e: self._on_remote_schema_error(db_type, e)
+            )
     
+    def _reset_entry_form(self):
+        """Clear the Entry tab form fields after a database has been (re)created"""
+        self.ui.set_date(datetime.now().strftime("%Y-%m-%d"))
+        ui_utils.batch_set((var, "") for var in (
+            sv.session_purpose, sv.field_support, sv.dog, sv.search_area_size,
+            sv.num_subjects, sv.handler_knowledge, sv.weather, sv.temperature,
+            sv.wind_direction, sv.wind_speed, sv.search_type, sv.drive_level
+        ))
+        # Update subjects_found combo state (will disable since num_subjects is blank)
+        # - this also clears subjects_found
+        self.ui.form_mgmt.update_subjects_found()
+    
+    def _on_remote_schema_error(self, db_type, e):
+        """Report a failed postgres/supabase/mysql schema create"""
+        messagebox.showerror(
+            "Database Error",
+            f"Failed to create {db_type} database schema:\n\n{e}\n\n{type(e).__name__}\n\n"
+            f"Make sure:\n"
+            f"1. Database connection is configured in config.py\n"
+            f"2. Password is set correctly (replace [YOUR-PASSWORD])\n"
+            f"3. You have network access to Supabase\n"
+            f"4. Credentials are correct"
+        )
+        traceback.print_exception(type(e), e, e.__traceback__)
 
-    def load_locations_from_database(self):
-        """Load training locations from database into Setup tab listbox"""
-        db_type = sv.db_type.get()
+    def _submit(self, key, query, on_done, on_error):
+        """
+        Run query() on a worker thread, then on_done(result) or on_error(e) on the Tk thread
         
-        # For SQLite, check if database file exists before trying to connect
-        if db_type == "sqlite":
-            import config as config_module
-            db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-            if not os.path.exists(db_path):
-                # Database doesn't exist - clear listbox and return
-                if hasattr(self, 's_location_listbox'):
-                    self.s_location_listbox.delete(0, tk.END)
-                return
+        Only one query per key runs at a time. A request made while one is
+        running is held and started when it finishes (the newest request
+        replaces any already held), so repeated refreshes don't stack up.
+        """
+        if key in self._db_in_flight:
+            self._db_in_flight[key] = (query, on_done, on_error)
+            return
+        self._db_in_flight[key] = None
         
-        try:
-            # Temporarily switch to selected database type
-            import config
-            old_db_type = config.DB_TYPE
-            config.DB_TYPE = db_type
-            
-            # Reload database module
-            from database import engine
-            engine.dispose()
-            from importlib import reload
-            import database
-            reload(database)
-            
-            from sqlalchemy import text
-            
-            # Query training_locations table
-            with database.get_connection() as conn:
-                result = conn.execute(text("SELECT name FROM training_locations ORDER BY name"))
-                locations = [row[0] for row in result]
-            
-            # Restore original DB_TYPE
-            config.DB_TYPE = old_db_type
-            database.engine.dispose()
-            reload(database)
-            
-            # Clear and populate listbox
-            self.s_location_listbox.delete(0, tk.END)
-            for location in locations:
-                self.s_location_listbox.insert(tk.END, location)
-                
-        except Exception as e:
-            # Restore original DB_TYPE on error
+        def finished(future):
+            # Worker thread - hand the result to the mainloop
             try:
-                import config
-                import database
-                from importlib import reload
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass
-            
-            # If table doesn't exist yet, silently skip (database will be created later)
-            if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
-                # Clear the listbox
-                if hasattr(self, 's_location_listbox'):
-                    self.s_location_listbox.delete(0, tk.END)
-                # Don't print - this is expected before database is created
+                self.ui.root.after(0, lambda: self._deliver(key, future, on_done, on_error))
+            except (RuntimeError, tk.TclError):
+                # Main window closed or mainloop gone - the result is dropped, so
+                # don't leave the key looking busy
+                self._db_in_flight.pop(key, None)
+        
+        self._db_executor.submit(query).add_done_callback(finished)
+
+    def _deliver(self, key, future, on_done, on_error):
+        """Tk-thread half of _submit: run the callback, then start any held request"""
+        held = self._db_in_flight.pop(key, None)
+        try:
+            error = future.exception()
+            if error is None:
+                on_done(future.result())
             else:
-                print(f"Error loading locations: {e}")
+                on_error(error)
+        finally:
+            if held:
+                self._submit(key, *held)
 
-    def refresh_location_list(self):
-        """Refresh the location combobox in Entry tab"""
+    def shutdown(self):
+        """Stop the list-query workers (window closing) - queued queries are cancelled"""
+        self._db_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load_names_async(self, key, tables, show):
+        """
+        Load name lists off the Tk thread and pass them to show(), one list per table
+        
+        A missing database/table shows empty lists (expected before the
+        database is created); other database errors are printed, anything
+        else is re-raised so it isn't mistaken for an empty database.
+        
+        A list changed in place after this load started (_mark_list_changed) is
+        passed as None (show is skipped if that leaves nothing), so an older
+        load can't overwrite the newer widget contents.
+        """
         db_type = sv.db_type.get()
+        started = [self._list_generation.get(table, 0) for table in tables]
+        
+        def on_done(names):
+            names = [result if self._list_generation.get(table, 0) == generation else None
+                     for table, generation, result in zip(tables, started, names)]
+            if any(result is not None for result in names):
+                show(*names)
+        
+        def on_error(e):
+            if _is_missing_db_error(e):
+                self._tables_present.pop(db_type, None)
+                show(*(() for _ in tables))
+            elif isinstance(e, SQLAlchemyError):
+                print(f"Error loading {key}: {e}")
+            else:
+                raise e
         
-        # For SQLite, check if database file exists before trying to connect
-        if db_type == "sqlite":
-            import config as config_module
-            db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-            if not os.path.exists(db_path):
-                # Database doesn't exist - clear combobox and return
-                if hasattr(self.ui, 'a_location_combo'):
-                    self.ui.a_location_combo['values'] = []
-                return
+        self._submit(key, lambda: self._load_names(db_type, *tables), on_done, on_error)
+
+    def _load_names(self, db_type, *tables):
+        """
+        SELECT name FROM each table ORDER BY name, sharing one connection
         
-        try:
-            # Temporarily switch to selected database type
-            import config
-            old_db_type = config.DB_TYPE
-            config.DB_TYPE = db_type
-            
-            # Reload database module
-            from database import engine
-            engine.dispose()
-            from importlib import reload
-            import database
-            reload(database)
-            
-            from sqlalchemy import text
-            
-            # Query training_locations table
-            with database.get_connection() as conn:
-                result = conn.execute(text("SELECT name FROM training_locations ORDER BY name"))
-                locations = [row[0] for row in result]
-            
-            # Restore original DB_TYPE
-            config.DB_TYPE = old_db_type
-            database.engine.dispose()
-            reload(database)
-            
-            # Update combobox
-            if hasattr(self.ui, 'a_location_combo'):
-                self.ui.a_location_combo['values'] = locations
-                
-        except Exception as e:
-            # Restore original DB_TYPE on error
-            try:
-                import config
-                import database
-                from importlib import reload
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass
-            
-            # If table doesn't exist yet, silently skip
-            if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
-                # Clear the combobox
-                #if hasattr(self.ui, 'a_location_combo'):   ahg
-                if hasattr(self.ui, 'a_location_combo'):
-                    #self.ui.a_location_combo['values'] = []   ahg
-                    self.ui.a_location_combo['values'] = []
+        SQLite results are cached until something commits through the database
+        module or the file changes on disk, so repeated refreshes of an
+        unchanged database skip the query entirely. Server databases are
+        always re-read: another client can change them at any time, and
+        nothing here would notice.
+        
+        Returns:
+            List with a list of names per table, in the order given (shared
+            with the cache - don't modify)
+        """
+        stamp = (database.get_db_url(db_type), database.get_commit_count(),
+                 self._sqlite_file_stamp() if db_type == "sqlite" else None)
+        
+        present = self._present_tables(db_type, stamp, tables)
+        use_cache = db_type == "sqlite"
+        
+        results = {}
+        stale = []
+        for table in tables:
+            cached = self._names_cache.get((db_type, table))
+            if table not in present:
+                results[table] = ()  # Not created yet - nothing to SELECT
+            elif use_cache and cached is not None and cached[0] == stamp:
+                results[table] = cached[1]
             else:
-                print(f"Error refreshing location list: {e}")
+                stale.append(table)
+        
+        if stale:
+            with database.get_connection(db_type) as conn:
+                for table in stale:
+                    names = conn.execute(_SELECT_NAMES[table]).scalars().all()
+                    if use_cache:
+                        self._names_cache[(db_type, table)] = (stamp, names)
+                    results[table] = names
+        
+        return [results[table] for table in tables]
+
+    def _present_tables(self, db_type, stamp, tables):
+        """
+        Names of the tables that exist in the db_type database (inspector, cached)
+        
+        The set is reused until the database URL changes, or until a wanted
+        table is missing and the database may have changed since the last look
+        (always, for a server database another client can write to).
+        create_database and missing-table errors drop it explicitly.
+        """
+        cached = self._tables_present.get(db_type)
+        if (cached is None or cached[0][0] != stamp[0]
+                or (not cached[1].issuperset(tables)
+                    and (cached[0] != stamp or db_type != "sqlite"))):
+            cached = (stamp, set(inspect(database.get_engine(db_type)).get_table_names()))
+            self._tables_present[db_type] = cached
+        return cached[1]
+
+    def _sqlite_file_stamp(self):
+        """(mtime, size) of the SQLite file and its WAL - changes when another process writes"""
+        db_path = config.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
+        stamp = []
+        for path in (db_path, db_path + "-wal"):
+            try:
+                st = os.stat(path)
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def populate_setup_tab_lists(self):
+        """Load locations, dogs, terrain and distraction types over a single connection"""
+        # All four SELECTs share one connection (one checkout / handshake)
+        self._load_names_async(
+            "setup lists", ("training_locations", "dogs", "terrain_types", "distraction_types"),
+            self._show_setup_lists)
+
+    def _show_setup_lists(self, locations, dogs, terrain_types, distraction_types):
+        """Fill the Setup tab lists (and matching Entry tab comboboxes); None skips a list"""
+        if locations is not None:
+            self._set_location_names(tuple(locations))
+        if dogs is not None:
+            self._set_dog_names(tuple(dogs))
+        if terrain_types is not None:
+            ui_utils.fill_tree(self.s_terrain_tree, terrain_types)
+            if self.entry_tab_built:
+                self.ui.a_terrain_combo['values'] = terrain_types
+        if distraction_types is not None:
+            ui_utils.fill_tree(self.s_distraction_type_tree, distraction_types)
+
+    def refresh_location_list(self):
+        """Refresh the Setup tab location listbox and the Entry tab combobox"""
+        self._load_names_async("locations", ("training_locations",), self._set_location_names)
 
     def load_terrain_from_database(self):
         """Load terrain types from database into Setup tab treeview"""
-        db_type = sv.db_type.get()
-        
-        # For SQLite, check if database file exists before trying to connect
-        if db_type == "sqlite":
-            import config as config_module
-            db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-            if not os.path.exists(db_path):
-                # Database doesn't exist - clear treeview and return
-                if hasattr(self, 'terrain_tree'):
-                    self.s_terrain_tree.delete(*self.s_terrain_tree.get_children())
-                return
-        
-        try:
-            # Temporarily switch to selected database type
-            import config
-            old_db_type = config.DB_TYPE
-            config.DB_TYPE = db_type
-            
-            # Reload database module
-            from database import engine
-            engine.dispose()
-            from importlib import reload
-            import database
-            reload(database)
-            
-            from sqlalchemy import text
-            
-            # Query terrain_types table
-            with database.get_connection() as conn:
-                result = conn.execute(text("SELECT name FROM terrain_types ORDER BY name"))
-                terrain_types = [row[0] for row in result]
-            
-            # Restore original DB_TYPE
-            config.DB_TYPE = old_db_type
-            database.engine.dispose()
-            reload(database)
-            
-            # Clear and populate treeview
-            self.s_terrain_tree.delete(*self.s_terrain_tree.get_children())
-            for idx, terrain in enumerate(terrain_types, 1):
-                self.s_terrain_tree.insert('', tk.END, text=str(idx), values=(terrain,))
-            
+        def show(terrain_types):
+            ui_utils.fill_tree(self.s_terrain_tree, terrain_types)
             # Also update Entry tab terrain combo box
-            if hasattr(self.ui, 'a_terrain_combo'):
+            if self.entry_tab_built:
                 self.ui.a_terrain_combo['values'] = terrain_types
-                
-        except Exception as e:
-            # Restore original DB_TYPE on error
-            try:
-                import config
-                import database
-                from importlib import reload
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass
-            
-            # If table doesn't exist yet, silently skip
-            if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
-                # Clear the treeview
-                if hasattr(self, 'terrain_tree'):
-                    self.s_terrain_tree.delete(*self.s_terrain_tree.get_children())
-            else:
-                print(f"Error loading terrain types: {e}")
+        
+        self._load_names_async("terrain types", ("terrain_types",), show)
 
     def load_distraction_from_database(self):
         """Load distraction types from database into Setup tab treeview"""
-        db_type = sv.db_type.get()
-        
-        # For SQLite, check if database file exists before trying to connect
-        if db_type == "sqlite":
-            import config as config_module
-            db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-            if not os.path.exists(db_path):
-                # Database doesn't exist - clear treeview and return
-                if hasattr(self, 'distraction_type_tree'):
-                    self.s_distraction_type_tree.delete(*self.s_distraction_type_tree.get_children())
-                return
+        self._load_names_async(
+            "distraction types", ("distraction_types",),
+            lambda distraction_types: ui_utils.fill_tree(self.s_distraction_type_tree, distraction_types))
+
+    def _mark_list_changed(self, table):
+        """Record that table's Setup list was just updated in place, so older loads don't overwrite it"""
+        self._list_generation[table] = self._list_generation.get(table, 0) + 1
+
+    def _set_location_names(self, names):
+        """Show location names in the Setup listbox and the Entry tab combobox"""
+        self.s_locations_var.set(names)
+        if self.entry_tab_built:
+            self.ui.a_location_combo['values'] = names
+
+    @staticmethod
+    def _bind_add_button_state(entry, update_states):
+        """
+        Keep an Add button in step with its entry's text
         
-        try:
-            # Temporarily switch to selected database type
-            import config
-            old_db_type = config.DB_TYPE
-            config.DB_TYPE = db_type
-            
-            # Reload database module
-            from database import engine
-            engine.dispose()
-            from importlib import reload
-            import database
-            reload(database)
-            
-            from sqlalchemy import text
-            
-            # Query distraction_types table
-            with database.get_connection() as conn:
-                result = conn.execute(text("SELECT name FROM distraction_types ORDER BY name"))
-                distraction_types = [row[0] for row in result]
-            
-            # Restore original DB_TYPE
-            config.DB_TYPE = old_db_type
-            database.engine.dispose()
-            reload(database)
-            
-            # Clear and populate treeview
-            self.s_distraction_type_tree.delete(*self.s_distraction_type_tree.get_children())
-            for idx, distraction in enumerate(distraction_types, 1):
-                self.s_distraction_type_tree.insert('', tk.END, text=str(idx), values=(distraction,))
-                
-        except Exception as e:
-            # Restore original DB_TYPE on error
-            try:
-                import config
-                import database
-                from importlib import reload
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass
-            
-            # If table doesn't exist yet, silently skip
-            if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
-                # Clear the treeview
-                if hasattr(self, 'distraction_type_tree'):
-                    self.s_distraction_type_tree.delete(*self.s_distraction_type_tree.get_children())
-            else:
-                print(f"Error loading distraction types: {e}")
+        Typing is caught by <KeyRelease>. A cut or paste (keyboard, mouse or
+        menu) arrives as a virtual event before the Entry class binding
+        changes the text, so that update waits for idle.
+        """
+        entry.bind('<KeyRelease>', update_states)
+        for sequence in ('<<Paste>>', '<<PasteSelection>>', '<<Cut>>', '<<Clear>>'):
+            entry.bind(sequence, lambda event: entry.after_idle(update_states))
+    
+    def refresh_add_button_states(self):
+        """Update every Add button from its entry (after the entries are set from code)"""
+        for spec in self._NAME_LISTS.values():
+            getattr(self, spec.update_states)()
 
     def update_location_button_states(self, *args):
         """Enable/disable location buttons based on entry content"""
-        has_text = bool(sv.new_location.get().strip())
+        has_text = bool(self.s_location_entry.get().strip())
         self.s_add_location_btn.config(state="normal" if has_text else "disabled")
 
     def on_location_select(self, event):
@@ -1001,288 +1021,93 @@ class SetupTab:
         selection = self.s_location_listbox.curselection()
         self.s_remove_location_btn.config(state="normal" if selection else "disabled")
 
-    def add_location(self):
-        """Add a new training location to database"""
-        location = sv.new_location.get().strip()
-        if location:
-            db_type = sv.db_type.get()
-            
-            try:
-                # Temporarily switch to selected database type
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                # Reload database module
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                from sqlalchemy import text
-                
-                # Insert into training_locations table
-                with database.get_connection() as conn:
-                    conn.execute(
-                        text("INSERT INTO training_locations (name, user_name) VALUES (:name, :user_name)"),
-                        {"name": location, "user_name": ui_utils.get_username()}
-                    )
-                    conn.commit()
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                # Refresh UI
-                self.load_locations_from_database()
-                self.refresh_location_list()
-                
-                sv.new_location.set("")
-                sv.status.set(f"Added location: {location}")
-                
-            except Exception as e:
-                # Restore original DB_TYPE on error
-                try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
-                if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
-                    messagebox.showinfo("Duplicate", f"Location '{location}' already exists")
-                else:
-                    messagebox.showerror("Database Error", f"Failed to add location:\n{e}")
-                    print(f"Error adding location: {e}")
-
-    def remove_location(self):
-        """Remove selected training location from database"""
-        selection = self.s_location_listbox.curselection()
-        if selection:
-            location = self.s_location_listbox.get(selection[0])
-            
-            result = messagebox.askyesno("Confirm Delete", 
-                                        f"Delete location '{location}'?")
-            if not result:
-                return
-            
-            db_type = sv.db_type.get()
-            
-            try:
-                # Temporarily switch to selected database type
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                # Reload database module
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                from sqlalchemy import text
-                
-                # Delete from training_locations table
-                with database.get_connection() as conn:
-                    conn.execute(
-                        text("DELETE FROM training_locations WHERE name = :name"),
-                        {"name": location}
-                    )
-                    conn.commit()
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                # Refresh UI
-                self.load_locations_from_database()
-                self.refresh_location_list()
-                
-                sv.status.set(f"Removed location: {location}")
-                self.s_remove_location_btn.config(state="disabled")
-                
-            except Exception as e:
-                # Restore original DB_TYPE on error
-                try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
-                messagebox.showerror("Database Error", f"Failed to remove location:\n{e}")
-                print(f"Error removing location: {e}")
-    
-
-    def load_dogs_from_database(self):
-        """Load dog names from database into listbox"""
-        db_type = sv.db_type.get()
-        
-        # print(f"DEBUG load_dogs_from_database: db_type={db_type}")  # DEBUG
-        
-        # For SQLite, check if database file exists before trying to connect
-        if db_type == "sqlite":
-            import config as config_module
-            db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-            # print(f"DEBUG load_dogs_from_database: db_path={db_path}, exists={os.path.exists(db_path)}")  # DEBUG
-            if not os.path.exists(db_path):
-                # Database doesn't exist - clear listbox and return
-                if hasattr(self, 's_dog_listbox'):
-                    self.s_dog_listbox.delete(0, tk.END)
-                # print(f"DEBUG load_dogs_from_database: Database doesn't exist, returning")  # DEBUG
-                return
+    def _add_name(self, kind):
+        """Add the name typed into a Setup list's entry to its table (see _NAME_LISTS)"""
+        spec = self._NAME_LISTS[kind]
+        name = getattr(self, spec.entry).get().strip()
+        if not name:
+            return
         
         try:
-            # Temporarily switch to selected database type
-            import config
-            old_db_type = config.DB_TYPE
-            config.DB_TYPE = db_type
-            
-            # Reload database module
-            from database import engine
-            engine.dispose()
-            from importlib import reload
-            import database
-            reload(database)
-            
-            from sqlalchemy import text
-            
-            # Query dogs table
-            with database.get_connection() as conn:
-                result = conn.execute(text("SELECT name FROM dogs ORDER BY name"))
-                dogs = [row[0] for row in result]
-            
-            # print(f"DEBUG load_dogs_from_database: Found {len(dogs)} dogs: {dogs}")  # DEBUG
-            
-            # Restore original DB_TYPE
-            config.DB_TYPE = old_db_type
-            database.engine.dispose()
-            reload(database)
-            
-            # Clear and populate listbox
-            self.s_dog_listbox.delete(0, tk.END)
-            for dog in dogs:
-                self.s_dog_listbox.insert(tk.END, dog)
-            
-            # print(f"DEBUG load_dogs_from_database: Populated listbox with {len(dogs)} dogs")  # DEBUG
-                
+            _exec_with_dbtype(sv.db_type.get(), database.INSERT_NAME[spec.table],
+                              {"name": name, "user_name": ui_utils.get_username()})
         except Exception as e:
-            # Restore original DB_TYPE on error
-            try:
-                import config
-                import database
-                from importlib import reload
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass
-            
-            # If table doesn't exist yet, silently skip (database will be created later)
-            if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
-                # Clear the listbox
-                if hasattr(self, 's_dog_listbox'):
-                    self.s_dog_listbox.delete(0, tk.END)
-                # Don't print - this is expected before database is created
+            if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
+                messagebox.showinfo("Duplicate", f"{spec.label.capitalize()} '{name}' already exists")
             else:
-                print(f"Error loading dogs: {e}")
+                messagebox.showerror("Database Error", f"Failed to add {spec.label}:\n{e}")
+                print(f"Error adding {spec.label}: {e}")
+            return
+        
+        self._mark_list_changed(spec.table)
+        if spec.set_names:
+            # Update listbox and Entry tab combobox in place (no re-query)
+            widget = getattr(self, spec.widget)
+            getattr(self, spec.set_names)(tuple(sorted((*widget.get(0, tk.END), name))))
+        else:
+            getattr(self, spec.reload)()
+        
+        getattr(sv, spec.new_var).set("")
+        getattr(self, spec.update_states)()
+        sv.status.set(f"Added {spec.label}: {name}")
 
-    def refresh_dog_list(self):
-        """Refresh the dog combobox in Entry tab"""
-        db_type = sv.db_type.get()
-        
-        # print(f"DEBUG refresh_dog_list: db_type={db_type}")  # DEBUG
-        
-        # For SQLite, check if database file exists before trying to connect
-        if db_type == "sqlite":
-            import config as config_module
-            db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-            # print(f"DEBUG refresh_dog_list: db_path={db_path}, exists={os.path.exists(db_path)}")  # DEBUG
-            if not os.path.exists(db_path):
-                # Database doesn't exist - clear combobox/listbox and return
-                if hasattr(self.ui, 'a_dog_combo'):
-                    self.ui.a_dog_combo['values'] = []
-                if hasattr(self, 's_dog_listbox'):
-                    self.s_dog_listbox.delete(0, tk.END)
-                # print(f"DEBUG refresh_dog_list: Database doesn't exist, returning")  # DEBUG
+    def _remove_name(self, kind, note=""):
+        """Remove the selected name in a Setup list from its table (see _NAME_LISTS)"""
+        spec = self._NAME_LISTS[kind]
+        widget = getattr(self, spec.widget)
+        if spec.set_names:
+            selection = widget.curselection()
+            if not selection:
+                return
+            name = widget.get(selection[0])
+        else:
+            selection = widget.selection()
+            if not selection:
                 return
+            name = widget.item(selection[0], 'values')[0]
+        
+        if not messagebox.askyesno("Confirm Delete", f"Delete {spec.label} '{name}'?{note}"):
+            return
         
         try:
-            # Temporarily switch to selected database type
-            import config
-            old_db_type = config.DB_TYPE
-            config.DB_TYPE = db_type
-            
-            # Reload database module
-            from database import engine
-            engine.dispose()
-            from importlib import reload
-            import database
-            reload(database)
-            
-            from sqlalchemy import text
-            
-            # Query dogs table
-            with database.get_connection() as conn:
-                result = conn.execute(text("SELECT name FROM dogs ORDER BY name"))
-                dogs = [row[0] for row in result]
-            
-            # print(f"DEBUG refresh_dog_list: Found {len(dogs)} dogs: {dogs}")  # DEBUG
-            
-            # Restore original DB_TYPE
-            config.DB_TYPE = old_db_type
-            database.engine.dispose()
-            reload(database)
-            
-            # Update combobox
-            if hasattr(self.ui, 'a_dog_combo'):
-                self.ui.a_dog_combo['values'] = dogs
-                # print(f"DEBUG refresh_dog_list: Updated dog_combo with {len(dogs)} dogs")  # DEBUG
-            
-            # Also update Setup tab listbox
-            self.s_dog_listbox.delete(0, tk.END)
-            for dog in dogs:
-                self.s_dog_listbox.insert(tk.END, dog)
-            
-            # print(f"DEBUG refresh_dog_list: Updated dog_listbox with {len(dogs)} dogs")  # DEBUG
-                
+            _exec_with_dbtype(sv.db_type.get(), database.DELETE_NAME[spec.table], {"name": name})
         except Exception as e:
-            # Restore original DB_TYPE on error
-            try:
-                import config
-                import database
-                from importlib import reload
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass
-            
-            # If database/tables don't exist yet, silently skip (they'll be created later)
-            if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
-                # Clear the combobox and listbox
-                if hasattr(self.ui, 'a_dog_combo'):
-                    self.ui.a_dog_combo['values'] = []
-                if hasattr(self, 's_dog_listbox'):
-                    self.s_dog_listbox.delete(0, tk.END)
-                # Don't print error - this is expected before database is created
-            else:
-                # Unexpected error - print it
-                print(f"Error refreshing dog list: {e}")
+            messagebox.showerror("Database Error", f"Failed to remove {spec.label}:\n{e}")
+            print(f"Error removing {spec.label}: {e}")
+            return
+        
+        self._mark_list_changed(spec.table)
+        if spec.set_names:
+            # Update listbox and Entry tab combobox in place (no re-query)
+            widget.delete(selection[0])
+            getattr(self, spec.set_names)(widget.get(0, tk.END))
+        else:
+            getattr(self, spec.reload)()
+        
+        sv.status.set(f"Removed {spec.label}: {name}")
+        getattr(self, spec.remove_button).config(state="disabled")
+
+    def add_location(self):
+        """Add a new training location to database"""
+        self._add_name("location")
+
+    def remove_location(self):
+        """Remove selected training location from database"""
+        self._remove_name("location")
+
+    def refresh_dog_list(self):
+        """Refresh the Setup tab dog listbox and the Entry tab combobox"""
+        self._load_names_async("dogs", ("dogs",), self._set_dog_names)
+
+    def _set_dog_names(self, names):
+        """Show dog names in the Setup listbox and the Entry tab combobox"""
+        self.s_dogs_var.set(names)
+        if self.entry_tab_built:
+            self.ui.a_dog_combo['values'] = names
 
     def update_dog_button_states(self, *args):
         """Enable/disable dog buttons based on entry content"""
-        has_text = bool(sv.new_dog.get().strip())
+        has_text = bool(self.s_dog_entry.get().strip())
         self.s_add_dog_btn.config(state="normal" if has_text else "disabled")
 
     def on_dog_select(self, event):
@@ -1292,141 +1117,15 @@ class SetupTab:
 
     def add_dog(self):
         """Add a new dog name"""
-        dog_name = sv.new_dog.get().strip()
-        if dog_name:
-            # Check database type and selected type
-            db_type = sv.db_type.get()
-            
-            try:
-                # Temporarily switch to selected database type
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                # Reload database module
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                from sqlalchemy import text
-                
-                # Insert into dogs table with user_name
-                with database.get_connection() as conn:
-                    conn.execute(
-                        text("INSERT INTO dogs (name, user_name) VALUES (:name, :user_name)"),
-                        {"name": dog_name, "user_name": ui_utils.get_username()}
-                    )
-                    conn.commit()
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                # Update listbox
-                self.s_dog_listbox.insert(tk.END, dog_name)
-                
-                # Update dog combobox in Entry tab if it exists
-                if hasattr(self.ui, 'a_dog_combo'):
-                    self.refresh_dog_list()
-                
-                sv.new_dog.set("")
-                sv.status.set(f"Added dog: {dog_name}")
-                
-            except Exception as e:
-                # Restore original DB_TYPE on error
-                try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
-                if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
-                    messagebox.showinfo("Duplicate", f"Dog '{dog_name}' already exists")
-                else:
-                    messagebox.showerror("Database Error", f"Failed to add dog:\n{e}")
-                    print(f"Error adding dog: {e}")
+        self._add_name("dog")
 
     def remove_dog(self):
         """Remove selected dog name"""
-        selection = self.s_dog_listbox.curselection()
-        if selection:
-            dog_name = self.s_dog_listbox.get(selection[0])
-            
-            # Confirm deletion
-            result = messagebox.askyesno(
-                "Confirm Delete",
-                f"Are you sure you want to delete dog '{dog_name}'?\n\n"
-                "This will not delete training sessions for this dog."
-            )
-            if not result:
-                return
-            
-            db_type = sv.db_type.get()
-            
-            try:
-                # Temporarily switch to selected database type
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                # Reload database module
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                from sqlalchemy import text
-                
-                # Delete from dogs table
-                with database.get_connection() as conn:
-                    conn.execute(
-                        text("DELETE FROM dogs WHERE name = :name"),
-                        {"name": dog_name}
-                    )
-                    conn.commit()
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                # Update listbox
-                self.s_dog_listbox.delete(selection[0])
-                
-                # Update dog combobox in Entry tab if it exists
-                if hasattr(self.ui, 'a_dog_combo'):
-                    self.refresh_dog_list()
-                
-                sv.status.set(f"Removed dog: {dog_name}")
-                self.s_remove_dog_btn.config(state="disabled")
-                
-            except Exception as e:
-                # Restore original DB_TYPE on error
-                try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
-                messagebox.showerror("Database Error", f"Failed to remove dog:\n{e}")
-                print(f"Error removing dog: {e}")
-    
+        self._remove_name("dog", "\n\nThis will not delete training sessions for this dog.")
 
     def update_terrain_button_states(self, *args):
         """Enable/disable terrain buttons based on entry content and selection"""
-        has_text = bool(sv.new_terrain.get().strip())
+        has_text = bool(self.s_terrain_entry.get().strip())
         self.s_add_terrain_btn.config(state="normal" if has_text else "disabled")
 
     def on_terrain_select(self, event):
@@ -1439,170 +1138,47 @@ class SetupTab:
 
     def add_terrain_type(self):
         """Add a new terrain type to database"""
-        terrain = sv.new_terrain.get().strip()
-        if terrain:
-            db_type = sv.db_type.get()
-            
-            try:
-                # Temporarily switch to selected database type
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                # Reload database module
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                from sqlalchemy import text
-                
-                # Insert into terrain_types table
-                with database.get_connection() as conn:
-                    conn.execute(
-                        text("INSERT INTO terrain_types (name, user_name) VALUES (:name, :user_name)"),
-                        {"name": terrain, "user_name": ui_utils.get_username()}
-                    )
-                    conn.commit()
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                # Refresh UI
-                self.load_terrain_from_database()
-                
-                sv.new_terrain.set("")
-                sv.status.set(f"Added terrain type: {terrain}")
-                
-            except Exception as e:
-                # Restore original DB_TYPE on error
-                try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
-                if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
-                    messagebox.showinfo("Duplicate", f"Terrain type '{terrain}' already exists")
-                else:
-                    messagebox.showerror("Database Error", f"Failed to add terrain type:\n{e}")
-                    print(f"Error adding terrain type: {e}")
+        self._add_name("terrain")
 
     def remove_terrain_type(self):
         """Remove selected terrain type from database"""
-        selection = self.s_terrain_tree.selection()
-        if selection:
-            item = selection[0]
-            values = self.s_terrain_tree.item(item, 'values')
-            terrain = values[0]
-            
-            result = messagebox.askyesno("Confirm Delete", 
-                                        f"Delete terrain type '{terrain}'?")
-            if not result:
-                return
-            
-            db_type = sv.db_type.get()
-            
-            try:
-                # Temporarily switch to selected database type
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                # Reload database module
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                from sqlalchemy import text
-                
-                # Delete from terrain_types table
-                with database.get_connection() as conn:
-                    conn.execute(
-                        text("DELETE FROM terrain_types WHERE name = :name"),
-                        {"name": terrain}
-                    )
-                    conn.commit()
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                # Refresh UI
-                self.load_terrain_from_database()
-                
-                sv.status.set(f"Removed terrain type: {terrain}")
-                
-            except Exception as e:
-                # Restore original DB_TYPE on error
-                try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
-                messagebox.showerror("Database Error", f"Failed to remove terrain type:\n{e}")
-                print(f"Error removing terrain type: {e}")
+        self._remove_name("terrain")
+
+    def _move_type(self, tree, config_key, step):
+        """
+        Move the selected row of a type tree one place up (step -1) or down (+1)
+        
+        The row swaps with its on-screen neighbour and the config list swaps
+        the same two names, so the tree and the saved order never disagree.
+        """
+        selection = tree.selection()
+        if not selection:
+            return
+        item = selection[0]
+        neighbour = tree.prev(item) if step < 0 else tree.next(item)
+        if not neighbour:
+            return
+        
+        name = tree.item(item, 'values')[0]
+        other = tree.item(neighbour, 'values')[0]
+        existing = self.ui.config.get(config_key, [])
+        if name in existing and other in existing:
+            i, j = existing.index(name), existing.index(other)
+            existing[i], existing[j] = existing[j], existing[i]
+            self.ui.config[config_key] = existing
+            
+            # Swap the two rows in place (no rebuild) - the config key is also the table name
+            self._mark_list_changed(config_key)
+            ui_utils.swap_tree_rows(tree, item, neighbour)
+            tree.see(item)
 
     def move_terrain_up(self):
         """Move selected terrain type up"""
-        selection = self.s_terrain_tree.selection()
-        if selection:
-            item = selection[0]
-            values = self.s_terrain_tree.item(item, 'values')
-            terrain = values[0]
-            
-            existing = self.ui.config.get("terrain_types", [])
-            idx = existing.index(terrain)
-            if idx > 0:
-                # Swap with previous
-                existing[idx], existing[idx-1] = existing[idx-1], existing[idx]
-                self.ui.config["terrain_types"] = existing
-                
-                # Rebuild treeview
-                self.s_terrain_tree.delete(*self.s_terrain_tree.get_children())
-                for i, t in enumerate(existing, 1):
-                    new_item = self.s_terrain_tree.insert('', tk.END, text=str(i), values=(t,))
-                    if t == terrain:
-                        self.s_terrain_tree.selection_set(new_item)
-                        self.s_terrain_tree.see(new_item)
+        self._move_type(self.s_terrain_tree, "terrain_types", -1)
 
     def move_terrain_down(self):
         """Move selected terrain type down"""
-        selection = self.s_terrain_tree.selection()
-        if selection:
-            item = selection[0]
-            values = self.s_terrain_tree.item(item, 'values')
-            terrain = values[0]
-            
-            existing = self.ui.config.get("terrain_types", [])
-            idx = existing.index(terrain)
-            if idx < len(existing) - 1:
-                # Swap with next
-                existing[idx], existing[idx+1] = existing[idx+1], existing[idx]
-                self.ui.config["terrain_types"] = existing
-                
-                # Rebuild treeview
-                self.s_terrain_tree.delete(*self.s_terrain_tree.get_children())
-                for i, t in enumerate(existing, 1):
-                    new_item = self.s_terrain_tree.insert('', tk.END, text=str(i), values=(t,))
-                    if t == terrain:
-                        self.s_terrain_tree.selection_set(new_item)
-                        self.s_terrain_tree.see(new_item)
+        self._move_type(self.s_terrain_tree, "terrain_types", 1)
 
     def restore_default_terrain_types(self):
         """Restore default terrain types"""
@@ -1611,19 +1187,21 @@ class SetupTab:
             "This will replace your terrain types with the default list. Continue?"
         )
         if result:
-            self.ui.config["terrain_types"] = ui_utils.get_default_terrain_types()
-            
-            # Rebuild treeview
-            self.s_terrain_tree.delete(*self.s_terrain_tree.get_children())
-            for idx, terrain in enumerate(self.ui.config["terrain_types"], 1):
-                self.s_terrain_tree.insert('', tk.END, text=str(idx), values=(terrain,))
+            defaults = ui_utils.get_default_terrain_types()
+            # Already the default list - the tree shows it, nothing to rebuild
+            if self.ui.config.get("terrain_types") != defaults:
+                self.ui.config["terrain_types"] = defaults
+                
+                # Rebuild treeview (one delete, layout held while the rows go in)
+                self._mark_list_changed("terrain_types")
+                ui_utils.fill_tree(self.s_terrain_tree, defaults)
             
             sv.status.set("Restored default terrain types")
     
 
     def update_distraction_type_button_states(self, *args):
         """Enable/disable distraction type buttons"""
-        has_text = bool(sv.new_distraction.get().strip())
+        has_text = bool(self.s_distraction_entry.get().strip())
         self.s_add_distraction_type_btn.config(state="normal" if has_text else "disabled")
 
     def on_distraction_type_select(self, event):
@@ -1636,174 +1214,19 @@ class SetupTab:
 
     def add_distraction_type(self):
         """Add a new distraction type to database"""
-        distraction = sv.new_distraction.get().strip()
-        if distraction:
-            db_type = sv.db_type.get()
-            
-            try:
-                # Temporarily switch to selected database type
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                # Reload database module
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                from sqlalchemy import text
-                
-                # Insert into distraction_types table
-                with database.get_connection() as conn:
-                    conn.execute(
-                        text("INSERT INTO distraction_types (name, user_name) VALUES (:name, :user_name)"),
-                        {"name": distraction, "user_name": ui_utils.get_username()}
-                    )
-                    conn.commit()
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                # Refresh UI
-                self.load_distraction_from_database()
-                
-                sv.new_distraction.set("")
-                sv.status.set(f"Added distraction type: {distraction}")
-                
-            except Exception as e:
-                # Restore original DB_TYPE on error
-                try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
-                if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
-                    messagebox.showinfo("Duplicate", f"Distraction type '{distraction}' already exists")
-                else:
-                    messagebox.showerror("Database Error", f"Failed to add distraction type:\n{e}")
-                    print(f"Error adding distraction type: {e}")
-    
-                
-                sv.new_distraction.set("")
-                sv.status.set(f"Added distraction type: {distraction}")
+        self._add_name("distraction")
 
     def remove_distraction_type(self):
         """Remove selected distraction type from database"""
-        selection = self.s_distraction_type_tree.selection()
-        if selection:
-            item = selection[0]
-            values = self.s_distraction_type_tree.item(item, 'values')
-            distraction = values[0]
-            
-            result = messagebox.askyesno("Confirm Delete", 
-                                        f"Delete distraction type '{distraction}'?")
-            if not result:
-                return
-            
-            db_type = sv.db_type.get()
-            
-            try:
-                # Temporarily switch to selected database type
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                # Reload database module
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                from sqlalchemy import text
-                
-                # Delete from distraction_types table
-                with database.get_connection() as conn:
-                    conn.execute(
-                        text("DELETE FROM distraction_types WHERE name = :name"),
-                        {"name": distraction}
-                    )
-                    conn.commit()
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                # Refresh UI
-                self.load_distraction_from_database()
-                
-                sv.status.set(f"Removed distraction type: {distraction}")
-                
-            except Exception as e:
-                # Restore original DB_TYPE on error
-                try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
-                messagebox.showerror("Database Error", f"Failed to remove distraction type:\n{e}")
-                print(f"Error removing distraction type: {e}")
+        self._remove_name("distraction")
 
     def move_distraction_up(self):
         """Move selected distraction type up"""
-        selection = self.s_distraction_type_tree.selection()
-        if selection:
-            item = selection[0]
-            values = self.s_distraction_type_tree.item(item, 'values')
-            distraction = values[0]
-            
-            existing = self.ui.config.get("distraction_types", [])
-            idx = existing.index(distraction)
-            if idx > 0:
-                # Swap with previous
-                existing[idx], existing[idx-1] = existing[idx-1], existing[idx]
-                self.ui.config["distraction_types"] = existing
-                
-                # Rebuild treeview
-                self.s_distraction_type_tree.delete(*self.s_distraction_type_tree.get_children())
-                for i, d in enumerate(existing, 1):
-                    new_item = self.s_distraction_type_tree.insert('', tk.END, text=str(i), values=(d,))
-                    if d == distraction:
-                        self.s_distraction_type_tree.selection_set(new_item)
-                        self.s_distraction_type_tree.see(new_item)
+        self._move_type(self.s_distraction_type_tree, "distraction_types", -1)
 
     def move_distraction_down(self):
         """Move selected distraction type down"""
-        selection = self.s_distraction_type_tree.selection()
-        if selection:
-            item = selection[0]
-            values = self.s_distraction_type_tree.item(item, 'values')
-            distraction = values[0]
-            
-            existing = self.ui.config.get("distraction_types", [])
-            idx = existing.index(distraction)
-            if idx < len(existing) - 1:
-                # Swap with next
-                existing[idx], existing[idx+1] = existing[idx+1], existing[idx]
-                self.ui.config["distraction_types"] = existing
-                
-                # Rebuild treeview
-                self.s_distraction_type_tree.delete(*self.s_distraction_type_tree.get_children())
-                for i, d in enumerate(existing, 1):
-                    new_item = self.s_distraction_type_tree.insert('', tk.END, text=str(i), values=(d,))
-                    if d == distraction:
-                        self.s_distraction_type_tree.selection_set(new_item)
-                        self.s_distraction_type_tree.see(new_item)
+        self._move_type(self.s_distraction_type_tree, "distraction_types", 1)
 
     def restore_default_distraction_types(self):
         """Restore default distraction types"""
@@ -1812,12 +1235,14 @@ class SetupTab:
             "This will replace your distraction types with the default list. Continue?"
         )
         if result:
-            self.ui.config["distraction_types"] = ui_utils.get_default_distraction_types()
-            
-            # Rebuild treeview
-            self.s_distraction_type_tree.delete(*self.s_distraction_type_tree.get_children())
-            for idx, distraction in enumerate(self.ui.config["distraction_types"], 1):
-                self.s_distraction_type_tree.insert('', tk.END, text=str(idx), values=(distraction,))
+            defaults = ui_utils.get_default_distraction_types()
+            # Already the default list - the tree shows it, nothing to rebuild
+            if self.ui.config.get("distraction_types") != defaults:
+                self.ui.config["distraction_types"] = defaults
+                
+                # Rebuild treeview (one delete, layout held while the rows go in)
+                self._mark_list_changed("distraction_types")
+                ui_utils.fill_tree(self.s_distraction_type_tree, defaults)
             
             sv.status.set("Restored default distraction types")
     
@@ -1826,14 +1251,11 @@ class SetupTab:
         """Save all configuration settings"""
         # Check for text in entry fields that hasn't been added
         unadded_items = []
-        if sv.new_location.get().strip():
-            unadded_items.append(f"Location: '{sv.new_location.get().strip()}'")
-        if sv.new_dog.get().strip():
-            unadded_items.append(f"Dog: '{sv.new_dog.get().strip()}'")
-        if sv.new_terrain.get().strip():
-            unadded_items.append(f"Terrain: '{sv.new_terrain.get().strip()}'")
-        if sv.new_distraction.get().strip():
-            unadded_items.append(f"Distraction: '{sv.new_distraction.get().strip()}'")
+        for label, var in (("Location", sv.new_location), ("Dog", sv.new_dog),
+                           ("Terrain", sv.new_terrain), ("Distraction", sv.new_distraction)):
+            value = var.get().strip()
+            if value:
+                unadded_items.append(f"{label}: '{value}'")
         
         if unadded_items:
             message = "You have typed text that hasn't been added:\n\n" + "\n".join(unadded_items)
@@ -1846,17 +1268,13 @@ class SetupTab:
         self.ui.config["handler_name"] = sv.default_handler.get()
         self.ui.config["db_type"] = sv.db_type.get()
         
-        # Save config file
-        self.ui.save_config()
-        
-        # Save machine-specific paths
+        # Machine-specific paths
         self.ui.machine_db_path = sv.db_path.get()
         self.ui.machine_trail_maps_folder = sv.trail_maps_folder.get()
         self.ui.machine_backup_folder = sv.backup_folder.get()
-        self.ui.save_bootstrap()
         
-        # Save settings backup JSON file
-        self.ui.misc_data_ops.save_settings_backup()
+        # Save config file, bootstrap paths and settings backup JSON file
+        self.ui.save_all()
         
         # Take new snapshot after saving
         self.ui.form_mgmt.take_form_snapshot()
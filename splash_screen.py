@@ -43,12 +43,12 @@ class SplashScreen:
         self.root.geometry(f"{width}x{height}+{x}+{y}")
         
         # Create frame with border
-        frame = tk.Frame(self.root, bg='white', relief='raised', borderwidth=2)
-        frame.pack(fill='both', expand=True, padx=10, pady=10)
+        self.frame = tk.Frame(self.root, bg='white', relief='raised', borderwidth=2)
+        self.frame.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Title
         title_label = tk.Label(
-            frame, 
+            self.frame, 
             text="Air-scent Training Tracker",
             font=('Arial', 20, 'bold'),
             bg='white',
@@ -56,6 +56,17 @@ class SplashScreen:
         )
         title_label.pack(pady=(40, 10))
         
+        # Paint the window and title now; the rest is built once the main UI
+        # construction yields to the event loop
+        self.root.update()
+        self.root.after_idle(self._build_rest)
+    
+    def _build_rest(self):
+        """Build the remaining splash widgets and start the countdown"""
+        if self.closed:
+            return
+        frame = self.frame
+        
         # Version
         version_label = tk.Label(
             frame,
@@ -124,14 +135,14 @@ class SplashScreen:
         )
         countdown_label.pack(pady=5)
         
-        # Progress bar (counts down from full to empty, in tenths)
+        # Progress bar (counts down from full to empty, in half seconds)
         self.progress = ttk.Progressbar(
             frame,
             mode='determinate',
             length=300,
-            maximum=150  # 15 seconds * 10 tenths per second
+            maximum=30  # 15 seconds * 2 ticks per second
         )
-        self.progress['value'] = 150  # Start at full
+        self.progress['value'] = 30  # Start at full
         self.progress.pack(pady=10)
         
         # Buttons frame
@@ -156,11 +167,8 @@ class SplashScreen:
         )
         close_button.pack(side='left', padx=5)
         
-        # Update display
-        self.root.update()
-        
         # Start countdown updates
-        self.remaining_tenths = 150  # 15 seconds * 10 tenths
+        self.remaining_ticks = 30  # 15 seconds * 2 ticks
         self.update_countdown()
     
     def stop_countdown(self):
@@ -171,24 +179,25 @@ class SplashScreen:
         self.countdown_var.set("Countdown stopped")
     
     def update_countdown(self):
-        """Update countdown timer every tenth of a second"""
+        """Update countdown timer every half second"""
         if self.closed:
             return
         
-        if self.remaining_tenths > 0:
+        if self.remaining_ticks > 0:
             # Update progress bar
-            self.progress['value'] = self.remaining_tenths
+            self.progress['value'] = self.remaining_ticks
             
             # Update text only on whole seconds
-            seconds = self.remaining_tenths // 10
-            if self.remaining_tenths % 10 == 0:  # Only update text on whole seconds
+            seconds = self.remaining_ticks // 2
+            if self.remaining_ticks % 2 == 0:  # Only update text on whole seconds
                 if seconds > 0:
                     self.countdown_var.set(f"Auto-closing in {seconds} seconds...")
                 else:
                     self.countdown_var.set("Auto-closing now...")
             
-            self.remaining_tenths -= 1
-            self.auto_close_timer = self.root.after(100, self.update_countdown)  # Update every 0.1 seconds
+            self.remaining_ticks -= 1
+            # 2 Hz is plenty for a 15 s countdown and leaves the mainloop to the startup work
+            self.auto_close_timer = self.root.after(500, self.update_countdown)
         else:
             # Time's up, close the splash
             self.destroy()
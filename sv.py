@@ -16,23 +16,115 @@ Usage:
     data = sv.to_dict()
 """
 
+import sys
 import tkinter as tk
-from datetime import datetime
+from datetime import date as _date  # a module-level "date" would shadow sv.date (see __getattr__)
+from functools import lru_cache
+
+
+@lru_cache(maxsize=2)
+def _today_str(ordinal):
+    """YYYY-MM-DD for a date ordinal (formatted once per day)"""
+    d = _date.fromordinal(ordinal)
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"  # same as strftime("%Y-%m-%d"), no locale lookup
+
+
+def _today():
+    """Today's date as YYYY-MM-DD"""
+    return _today_str(_date.today().toordinal())
 
 
 class Stringvars:
     """Central storage for all Tkinter StringVars in the application"""
     
+    # (to_dict/from_dict key, attribute) for the session StringVars
+    _SESSION_FIELDS = (
+        # Session info
+        ('date', 'date'),
+        ('session_number', 'session_number'),
+        ('handler', 'handler'),
+        ('dog_name', 'dog'),
+        
+        # Session details
+        ('session_purpose', 'session_purpose'),
+        ('field_support', 'field_support'),
+        
+        # Search parameters
+        ('location', 'location'),
+        ('search_area_size', 'search_area_size'),
+        ('num_subjects', 'num_subjects'),
+        ('handler_knowledge', 'handler_knowledge'),
+        
+        # Weather
+        ('weather', 'weather'),
+        ('temperature', 'temperature'),
+        ('wind_direction', 'wind_direction'),
+        ('wind_speed', 'wind_speed'),
+        
+        # Search details
+        ('search_type', 'search_type'),
+        
+        # Results
+        ('drive_level', 'drive_level'),
+        ('subjects_found', 'subjects_found'),
+    )
+    
+    # Fields filled from readonly comboboxes (a handful of possible values) -
+    # interned on export so snapshot/config comparisons hit the identity check
+    _INTERNED_FIELDS = frozenset({
+        'num_subjects', 'handler_knowledge', 'weather', 'wind_direction',
+        'search_type', 'drive_level', 'db_type',
+    })
+    
+    # Variables created on first access (see __getattr__): attribute -> (class, default)
+    _LAZY_VARS = {
+        # ===== SEARCH DETAILS =====
+        'terrain': (tk.StringVar, ""),  # Current terrain dropdown selection
+        'accumulated_terrain': (tk.StringVar, ""),  # Display of accumulated terrains
+        
+        # ===== SETUP TAB - PATHS =====
+        'db_path': (tk.StringVar, ""),
+        'trail_maps_folder': (tk.StringVar, ""),
+        'backup_folder': (tk.StringVar, ""),
+        'config_path': (tk.StringVar, ""),
+        
+        # ===== SETUP TAB - DATABASE =====
+        'db_type': (tk.StringVar, "sqlite"),
+        'db_password': (tk.StringVar, ""),
+        'remember_password': (tk.BooleanVar, False),
+        'show_password': (tk.BooleanVar, False),  # For password visibility toggle
+        
+        # ===== SETUP TAB - DEFAULTS =====
+        'default_handler': (tk.StringVar, ""),
+        
+        # ===== SETUP TAB - ENTRY FIELDS =====
+        'new_location': (tk.StringVar, ""),
+        'new_dog': (tk.StringVar, ""),
+        'new_terrain': (tk.StringVar, ""),
+        'new_distraction': (tk.StringVar, ""),
+        
+        # ===== VIEW FILTERS =====
+        'view_filter': (tk.StringVar, "undeleted"),  # For soft delete feature
+        'session_status_filter': (tk.StringVar, "active"),  # Filter for session status
+        
+        # ===== STATUS BAR =====
+        'status': (tk.StringVar, "Ready"),
+    }
+    
     def __init__(self, master=None):
         """
-        Initialize all StringVars organized by category
+        Initialize the session StringVars organized by category
+        
+        The setup/path/filter/status variables in _LAZY_VARS are created
+        the first time they are used.
         
         Args:
             master: The Tkinter root window (optional, uses default if None)
         """
+        self._master = master
         
         # ===== SESSION INFORMATION =====
-        self.date = tk.StringVar(master=master, value=datetime.now().strftime("%Y-%m-%d"))
+        self.date = tk.StringVar(master=master, value=_today())
         self.session_number = tk.StringVar(master=master, value="1")
         self.handler = tk.StringVar(master=master)
         self.dog = tk.StringVar(master=master)
@@ -55,8 +147,6 @@ class Stringvars:
         
         # ===== SEARCH DETAILS =====
         self.search_type = tk.StringVar(master=master)
-        self.terrain = tk.StringVar(master=master)  # Current terrain dropdown selection
-        self.accumulated_terrain = tk.StringVar(master=master)  # Display of accumulated terrains
         
         # ===== SEARCH RESULTS =====
         self.drive_level = tk.StringVar(master=master)
@@ -69,34 +159,16 @@ class Stringvars:
         # ===== SUBJECT RESPONSES (List of dicts) =====
         # Note: This holds structured data for subject responses
         self.subject_responses = []
-        
-        # ===== SETUP TAB - PATHS =====
-        self.db_path = tk.StringVar(master=master)
-        self.trail_maps_folder = tk.StringVar(master=master)
-        self.backup_folder = tk.StringVar(master=master)
-        self.config_path = tk.StringVar(master=master)
-        
-        # ===== SETUP TAB - DATABASE =====
-        self.db_type = tk.StringVar(master=master, value="sqlite")
-        self.db_password = tk.StringVar(master=master)
-        self.remember_password = tk.BooleanVar(master=master, value=False)
-        self.show_password = tk.BooleanVar(master=master, value=False)  # For password visibility toggle
-        
-        # ===== SETUP TAB - DEFAULTS =====
-        self.default_handler = tk.StringVar(master=master)
-        
-        # ===== SETUP TAB - ENTRY FIELDS =====
-        self.new_location = tk.StringVar(master=master)
-        self.new_dog = tk.StringVar(master=master)
-        self.new_terrain = tk.StringVar(master=master)
-        self.new_distraction = tk.StringVar(master=master)
-        
-        # ===== VIEW FILTERS =====
-        self.view_filter = tk.StringVar(master=master, value="undeleted")  # For soft delete feature
-        self.session_status_filter = tk.StringVar(master=master, value="active")  # Filter for session status
-        
-        # ===== STATUS BAR =====
-        self.status = tk.StringVar(master=master, value="Ready")
+    
+    def __getattr__(self, name):
+        """Create a _LAZY_VARS variable on first access and keep it as a normal attribute"""
+        spec = type(self)._LAZY_VARS.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        var_cls, default = spec
+        var = var_cls(master=self.__dict__.get('_master'), value=default)
+        self.__dict__[name] = var
+        return var
     
     # ========================================
     # HELPER METHODS - SESSION OPERATIONS
@@ -110,7 +182,7 @@ class Stringvars:
             keep_handler: If True, preserve handler name (default: True)
             keep_dog: If True, preserve dog selection (default: True)
         """
-        self.date.set(datetime.now().strftime("%Y-%m-%d"))
+        self.date.set(_today())
         self.session_number.set("")
         
         if not keep_handler:
@@ -147,7 +219,12 @@ class Stringvars:
         self.subject_responses.clear()
     
     def clear_setup_entry_fields(self):
-        """Clear all entry fields on setup tab"""
+        """
+        Clear all entry fields on setup tab
+        
+        The Add buttons follow the entries' key/paste events only - call
+        SetupTab.refresh_add_button_states() afterwards.
+        """
         self.new_location.set("")
         self.new_dog.set("")
         self.new_terrain.set("")
@@ -164,42 +241,16 @@ class Stringvars:
         Returns:
             dict: All session field values
         """
-        return {
-            # Session info
-            'date': self.date.get(),
-            'session_number': self.session_number.get(),
-            'handler': self.handler.get(),
-            'dog_name': self.dog.get(),
-            
-            # Session details
-            'session_purpose': self.session_purpose.get(),
-            'field_support': self.field_support.get(),
-            
-            # Search parameters
-            'location': self.location.get(),
-            'search_area_size': self.search_area_size.get(),
-            'num_subjects': self.num_subjects.get(),
-            'handler_knowledge': self.handler_knowledge.get(),
-            
-            # Weather
-            'weather': self.weather.get(),
-            'temperature': self.temperature.get(),
-            'wind_direction': self.wind_direction.get(),
-            'wind_speed': self.wind_speed.get(),
-            
-            # Search details
-            'search_type': self.search_type.get(),
-            
-            # Results
-            'drive_level': self.drive_level.get(),
-            'subjects_found': self.subjects_found.get(),
-            
-            # Terrain (list)
-            'terrain_list': self.terrain_list.copy(),
-            
-            # Subject responses (list of dicts)
-            'subject_responses': self.subject_responses.copy()
-        }
+        data = {key: getattr(self, attr).get() for key, attr in self._SESSION_FIELDS}
+        for key in self._INTERNED_FIELDS.intersection(data):
+            data[key] = sys.intern(data[key])
+        
+        # Terrain (list)
+        data['terrain_list'] = self.terrain_list.copy()
+        
+        # Subject responses (list of dicts)
+        data['subject_responses'] = self.subject_responses.copy()
+        return data
     
     def from_dict(self, data):
         """
@@ -208,40 +259,19 @@ class Stringvars:
         Args:
             data: Dictionary with session field values
         """
-        # Session info
-        self.date.set(data.get('date', ''))
-        self.session_number.set(str(data.get('session_number', '')))
-        self.handler.set(data.get('handler', ''))
-        self.dog.set(data.get('dog_name', ''))
+        # Only write fields whose value differs - a write also updates the
+        # bound widgets and fires any traces on the variable
+        for key, attr in self._SESSION_FIELDS:
+            var = getattr(self, attr)
+            value = data.get(key, '')
+            if str(value) != var.get():
+                var.set(value)
         
-        # Session details
-        self.session_purpose.set(data.get('session_purpose', ''))
-        self.field_support.set(data.get('field_support', ''))
-        
-        # Search parameters
-        self.location.set(data.get('location', ''))
-        self.search_area_size.set(data.get('search_area_size', ''))
-        self.num_subjects.set(data.get('num_subjects', ''))
-        self.handler_knowledge.set(data.get('handler_knowledge', ''))
-        
-        # Weather
-        self.weather.set(data.get('weather', ''))
-        self.temperature.set(data.get('temperature', ''))
-        self.wind_direction.set(data.get('wind_direction', ''))
-        self.wind_speed.set(data.get('wind_speed', ''))
-        
-        # Search details
-        self.search_type.set(data.get('search_type', ''))
-        
-        # Results
-        self.drive_level.set(data.get('drive_level', ''))
-        self.subjects_found.set(data.get('subjects_found', ''))
-        
-        # Terrain (list)
-        self.terrain_list = data.get('terrain_list', []).copy()
+        # Terrain (list) - refilled in place, so references to it stay valid
+        self.terrain_list[:] = data.get('terrain_list') or ()
         
         # Subject responses (list of dicts)
-        self.subject_responses = data.get('subject_responses', []).copy()
+        self.subject_responses[:] = data.get('subject_responses') or ()
     
     # ========================================
     # VALIDATION METHODS
@@ -254,20 +284,25 @@ class Stringvars:
         Returns:
             tuple: (is_valid, error_message)
         """
-        if not self.date.get():
+        # Each field is read once - the checks all see the same values
+        date = self.date.get()
+        session_number = self.session_number.get()
+        dog = self.dog.get()
+        
+        if not date:
             return False, "Date is required"
         
-        if not self.session_number.get():
+        if not session_number:
             return False, "Session number is required"
         
         try:
-            session_num = int(self.session_number.get())
+            session_num = int(session_number)
             if session_num < 1:
                 return False, "Session number must be at least 1"
         except ValueError:
             return False, "Session number must be a valid number"
         
-        if not self.dog.get():
+        if not dog:
             return False, "Dog name is required"
         
         return True, ""
@@ -276,23 +311,36 @@ class Stringvars:
     # COMPARISON METHODS
     # ========================================
     
+    @staticmethod
+    def _pack(values):
+        """Pack strings end to end, each behind a 4-byte length"""
+        buf = bytearray()
+        for value in values:
+            raw = value.encode('utf-8')
+            buf += len(raw).to_bytes(4, 'little')
+            buf += raw
+        return bytes(buf)
+    
     def get_state_string(self):
         """
-        Get string representation of current state for comparison
+        Get a snapshot of the current state for comparison
+        
+        The session fields and the terrain/subject response lists are packed
+        into one bytes value. Comparing two snapshots is a single bytes
+        compare, and unlike a hash it can't report a false match.
         
         Returns:
-            str: Pipe-separated values for change detection
+            bytes: Opaque state snapshot for change detection
         """
-        data = self.to_dict()
-        parts = [str(data.get(key, '')) for key in sorted(data.keys())]
-        return "|".join(parts)
+        fields = self._pack(getattr(self, attr).get() for _key, attr in self._SESSION_FIELDS)
+        return fields + self._pack((repr(self.terrain_list), repr(self.subject_responses)))
     
     def has_changes_from(self, snapshot):
         """
         Check if current state differs from snapshot
         
         Args:
-            snapshot: Previously saved state string from get_state_string()
+            snapshot: Previously saved state snapshot from get_state_string()
         
         Returns:
             bool: True if state has changed
@@ -311,7 +359,7 @@ class Stringvars:
             dict: Configuration values
         """
         return {
-            'db_type': self.db_type.get(),
+            'db_type': sys.intern(self.db_type.get()),
             'db_path': self.db_path.get(),
             'trail_maps_folder': self.trail_maps_folder.get(),
             'backup_folder': self.backup_folder.get(),
@@ -342,6 +390,28 @@ class Stringvars:
 #   sv.initialize(self.root)
 sv = None
 
+# Names of sv's Tk variables copied into this module, so module-style
+# access (import sv; sv.date.get()) is a plain global lookup rather than a
+# call to the module __getattr__ below
+_promoted = set()
+
+
+def _promote(name, value):
+    """Copy one of sv's Tk variables into the module namespace"""
+    if isinstance(value, tk.Variable):
+        globals()[name] = value
+        _promoted.add(name)
+
+
+def _promote_all():
+    """Promote the variables sv has created so far (lazy ones follow on first access)"""
+    for name in _promoted:
+        globals().pop(name, None)
+    _promoted.clear()
+    for name, value in vars(sv).items():
+        if not name.startswith('_'):
+            _promote(name, value)
+
 
 def initialize(master=None):
     """
@@ -360,6 +430,7 @@ def initialize(master=None):
     global sv
     if sv is None:
         sv = Stringvars(master=master)
+        _promote_all()
     return sv
 
 
@@ -371,6 +442,7 @@ def reset_all(master=None):
     """Reset global sv to fresh instance (useful for testing)"""
     global sv
     sv = Stringvars(master=master)
+    _promote_all()
 
 
 def get_session_data():
@@ -385,11 +457,15 @@ def __getattr__(name):
     Allow accessing sv instance attributes directly from module
     
     This allows: sv.date.get() instead of sv.sv.date.get()
-    Works by forwarding attribute access to the sv instance.
+    Works by forwarding attribute access to the sv instance. Tk variables
+    are promoted to module globals on the way, so this only runs on the
+    first access to each (and for methods/lists).
     """
     if sv is None:
         raise RuntimeError(f"sv not initialized. Call initialize(root) before accessing {name}")
-    return getattr(sv, name)
+    value = getattr(sv, name)
+    _promote(name, value)
+    return value
 
 
 def load_session_data(data):
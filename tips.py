@@ -2,63 +2,158 @@
 Tooltip utility for tkinter widgets
 """
 import tkinter as tk
+import weakref
 from tkinter import ttk
 
 
+# Tooltip widgets get this bindtag; its Enter/Leave/Button bindings are made
+# once per Tcl interpreter instead of three bind() calls per widget
+_BINDTAG = "Tooltip"
+_bound_tk = None  # Interpreter the class bindings were made in
+
+
+def _tip_for(event):
+    """The ToolTip attached to the event's widget, if any"""
+    return getattr(event.widget, "_tooltip", None)
+
+
+def _on_enter(event):
+    tip = _tip_for(event)
+    if tip:
+        tip.schedule_show()
+
+
+def _on_leave(event):
+    tip = _tip_for(event)
+    if tip:
+        tip.hide()
+
+
+def _bind_class(widget):
+    """Make the Tooltip class bindings, once per interpreter"""
+    global _bound_tk
+    if _bound_tk is not widget.tk:
+        widget.bind_class(_BINDTAG, "<Enter>", _on_enter)
+        widget.bind_class(_BINDTAG, "<Leave>", _on_leave)
+        widget.bind_class(_BINDTAG, "<Button>", _on_leave)  # Hide on click
+        widget.bind_class(_BINDTAG, "<Destroy>", _on_leave)
+        _bound_tk = widget.tk
+
+
 class ToolTip:
     """Create a tooltip for a widget with configurable delay"""
+    
+    # One tooltip window shared by all tooltips - (Toplevel, Label), built on
+    # first show and withdrawn/re-shown after that instead of recreated
+    _pool = None
+    _active = None  # ToolTip currently shown in the shared window
+    # The one scheduled show - (ToolTip, widget, after id) - entering another
+    # widget replaces it, so there is never more than one timer pending
+    _pending = None
+    
     def __init__(self, widget, text, delay=750):
-        self.widget = widget
+        # Weak, so a tooltip kept alive elsewhere doesn't keep a destroyed widget
+        self._widget_ref = weakref.ref(widget)
         self.text = text
         self.delay = delay  # Delay in milliseconds
-        self.tooltip = None
-        self.timer = None
         
-        widget.bind("<Enter>", self.schedule_show)
-        widget.bind("<Leave>", self.hide)
-        widget.bind("<Button>", self.hide)  # Hide on click
+        # Enter/Leave/Button are handled by the shared Tooltip bindtag
+        _bind_class(widget)
+        widget._tooltip = self
+        tags = widget.bindtags()
+        if _BINDTAG not in tags:
+            widget.bindtags(tags + (_BINDTAG,))
+    
+    @property
+    def widget(self):
+        """The widget this tooltip belongs to (None once it has been collected)"""
+        return self._widget_ref()
     
     def schedule_show(self, event=None):
         """Schedule tooltip to show after delay"""
+        ToolTip._cancel_pending()  # Replaces any other tooltip's scheduled show
         self.hide()  # Cancel any existing tooltip
-        self.timer = self.widget.after(self.delay, self.show)
+        widget = self.widget
+        if widget is not None:
+            ToolTip._pending = (self, widget, widget.after(self.delay, self._show_pending))
+    
+    @staticmethod
+    def _cancel_pending():
+        """Cancel the scheduled show, if any"""
+        if ToolTip._pending:
+            _tip, widget, after_id = ToolTip._pending
+            ToolTip._pending = None
+            widget.after_cancel(after_id)
+    
+    def _show_pending(self):
+        """Timer callback - the scheduled show has fired"""
+        ToolTip._pending = None
+        self.show()
+    
+    @staticmethod
+    def prepare(widget):
+        """
+        Build the shared tooltip window ahead of the first hover
+        
+        Creating a Toplevel while a tkcalendar DateEntry is on screen is slow,
+        so the app calls this once the UI has settled instead of paying for it
+        on the first tooltip shown.
+        """
+        ToolTip._window(widget)
+    
+    @staticmethod
+    def _window(widget):
+        """Get the shared tooltip window and label, creating them (withdrawn) on first use"""
+        if ToolTip._pool is None or not ToolTip._pool[0].winfo_exists():
+            # Child of the root window so it outlives whichever widget asked first
+            tooltip = tk.Toplevel(widget.nametowidget("."))
+            tooltip.withdraw()
+            tooltip.wm_overrideredirect(True)
+            
+            # Create label for the tooltip text
+            label = tk.Label(tooltip, 
+                            background="#ffffe0", 
+                            foreground="black",
+                            relief="solid", 
+                            borderwidth=1, 
+                            font=("Arial", 9),
+                            padx=8, 
+                            pady=5)
+            label.pack()
+            ToolTip._pool = (tooltip, label)
+        return ToolTip._pool
     
     def show(self):
         """Display the tooltip"""
-        if self.tooltip:
+        widget = self.widget
+        if ToolTip._active is self or widget is None:
             return
         
         # Get widget position
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-        
-        # Create tooltip window
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
+        x = widget.winfo_rootx() + 20
+        y = widget.winfo_rooty() + widget.winfo_height() + 5
         
-        # Create label with tooltip text
-        label = tk.Label(self.tooltip, text=self.text, 
-                        background="#ffffe0", 
-                        foreground="black",
-                        relief="solid", 
-                        borderwidth=1, 
-                        font=("Arial", 9),
-                        padx=8, 
-                        pady=5)
-        label.pack()
+        # Move the shared window here with this tooltip's text
+        tooltip, label = self._window(widget)
+        label.config(text=self.text)
+        tooltip.wm_geometry(f"+{x}+{y}")
+        tooltip.deiconify()
+        tooltip.lift()
+        ToolTip._active = self
     
     def hide(self, event=None):
         """Hide the tooltip"""
         # Cancel scheduled show
-        if self.timer:
-            self.widget.after_cancel(self.timer)
-            self.timer = None
+        if ToolTip._pending and ToolTip._pending[0] is self:
+            ToolTip._cancel_pending()
         
-        # Destroy tooltip window
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        # Withdraw the shared window if it is showing this tooltip
+        if ToolTip._active is self:
+            ToolTip._active = None
+            try:
+                ToolTip._pool[0].withdraw()
+            except tk.TclError:
+                pass  # Window already destroyed (app closing)
 
 
 class ConditionalToolTip(ToolTip):
@@ -5,9 +5,9 @@ Contains all tkinter interface code
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinterdnd2 import DND_FILES, TkinterDnD
-from tkcalendar import DateEntry
 import json
 import os
+import re
 from pathlib import Path
 from datetime import datetime
 from getpass import getuser
@@ -18,17 +18,13 @@ from ui_misc2 import Misc2Operations
 from setup_tab import SetupTab
 from ui_form_management import FormManagement
 from ui_navigation import Navigation
-from ui_database import DatabaseOperations
-from ui_file_operations import FileOperations
 from about_dialog import show_about
 from tips import ToolTip, ConditionalToolTip
-from ui_utils import get_username, get_default_terrain_types, get_default_distraction_types
+from ui_utils import get_username, get_default_terrain_types, get_default_distraction_types, write_json_atomic
 from ui_database import get_db_manager
 from ui_misc_data_ops import MiscDataOperations
 from working_dialog import WorkingDialog, run_with_working_dialog
 import sv  # Import sv module (not 'from sv import sv')
-from ui_database import get_db_manager
-from ui_misc_data_ops import MiscDataOperations
 
 
 class AirScentingUI:
@@ -124,7 +120,11 @@ class AirScentingUI:
         # Track if we need to maximize
         self.is_maximized = False
         
-        if available_height < window_height:
+        saved_geometry = self.get_saved_geometry(screen_width, screen_height)
+        if saved_geometry:
+            # Same size and position as when the window was last closed
+            self.root.geometry(saved_geometry)
+        elif available_height < window_height:
             # Screen too small - maximize window
             self.is_maximized = True
             # Set geometry first, then maximize (works better on some systems)
@@ -180,9 +180,9 @@ class AirScentingUI:
         self.notebook.add(self.setup_tab, text="Setup")
         self.notebook.add(self.entry_tab, text="Training Session Entry")
         
-        # Setup the tabs
+        # Setup the tabs - only the Setup tab (shown first) before the window
+        # paints; the Entry tab is built right after (see deiconify below)
         self.setup_setup_tab()
-        self.setup_entry_tab()
         
         # Select initial tab based on database existence
         self.root.after(250,self.misc_data_ops.select_initial_tab)
@@ -192,36 +192,8 @@ class AirScentingUI:
                             bd=1, relief=tk.SUNKEN, anchor=tk.W)
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Schedule session number update AFTER password is loaded (happens at 100ms)
-        # This prevents database calls before authentication is ready
-        # def update_initial_session():
-        #     loaded_dog = sv.dog.get()
-        #     if loaded_dog:
-        #         next_session = DatabaseOperations(self).get_next_session_number(loaded_dog)
-        #         sv.session_number.set(str(next_session))
-        #         sv.status.set(f"Ready - {loaded_dog} - Next session: #{next_session}")
-        #         # Update navigation button states
-        #         self.navigation.update_navigation_buttons()
-
-        def update_initial_session():
-            loaded_dog = sv.dog.get()
-            if loaded_dog:
-                # Get computed next number based on active filter
-                db_ops = DatabaseOperations(self)
-                status_filter = sv.session_status_filter.get()
-                filtered_sessions = db_ops.get_all_sessions_for_dog(loaded_dog, status_filter)
-                next_computed = len(filtered_sessions) + 1
-                
-                sv.session_number.set(str(next_computed))
-                print(f"DEBUG update_initial_session: set to computed {next_computed}")
-                sv.status.set(f"Ready - {loaded_dog} - Next session: #{next_computed}")
-                # Update navigation button states
-                self.navigation.update_navigation_buttons() 
-
-        # Delay until after password AND database data are loaded
-        # Password: 100ms, Database data: 500ms, Session update: 600ms
-        print(f"DEBUG: About to schedule update_initial_session, current dog={sv.dog.get()}, session={sv.session_number.get()}")  # ADD THIS
-        self.root.after(600, update_initial_session)
+        # The session number / status for the last dog are set by
+        # load_initial_database_data once it has loaded that dog (step2)
         
         # Track form state for unsaved changes detection
         self.form_snapshot = ""
@@ -237,6 +209,11 @@ class AirScentingUI:
         # This allows splash screen countdown to begin immediately
         self.root.update()
         
+        # Build the Entry tab now the window is on screen. Still synchronous,
+        # so it is complete before any of the after() callbacks above can run
+        self.setup_entry_tab()
+        self.setup_tab_mgr.entry_tab_built = True
+        
         # Schedule initial database loading AFTER password is loaded
         # Password loads at 100ms (on_db_type_changed), so we wait until 500ms
         # This allows event loop to run and splash countdown to animate
@@ -245,6 +222,9 @@ class AirScentingUI:
         # Take initial snapshot after UI is ready
         self.root.after(100, self.form_mgmt.take_form_snapshot)
         
+        # Build the shared tooltip window once startup work is done
+        self.root.after(1000, lambda: ToolTip.prepare(self.root))
+        
         # Set up window close handler
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
@@ -282,35 +262,59 @@ class AirScentingUI:
             self.a_save_session_btn.config(text=text)
     def load_bootstrap(self):
         """Load machine-specific paths from bootstrap file"""
+        # Kept so save_bootstrap can update it without re-reading the file
+        self.bootstrap = {"config_folder_path": str(self.config_file.parent)}
         if self.bootstrap_file.exists():
             try:
-                with open(self.bootstrap_file, 'r') as f:
+                with open(self.bootstrap_file, 'r', encoding='utf-8') as f:
                     bootstrap = json.load(f)
                     self.machine_db_path = bootstrap.get("db_file_path", "")
                     self.machine_trail_maps_folder = bootstrap.get("trail_maps_folder", "")
                     self.machine_backup_folder = bootstrap.get("backup_folder", "")
+                    self.bootstrap = bootstrap
             except:
                 pass
     
     def save_bootstrap(self):
         """Save machine-specific paths to bootstrap file"""
-        # Get existing bootstrap data
-        bootstrap = {"config_folder_path": str(self.config_file.parent)}
-        if self.bootstrap_file.exists():
-            try:
-                with open(self.bootstrap_file, 'r') as f:
-                    bootstrap = json.load(f)
-            except:
-                pass
-        
-        # Update with current machine paths
+        # Update the data read by load_bootstrap with current machine paths
+        bootstrap = self.bootstrap
         bootstrap["db_file_path"] = self.machine_db_path
         bootstrap["trail_maps_folder"] = self.machine_trail_maps_folder
         bootstrap["backup_folder"] = self.machine_backup_folder
         
         # Save to bootstrap file
-        with open(self.bootstrap_file, 'w') as f:
-            json.dump(bootstrap, f, indent=2)
+        write_json_atomic(self.bootstrap_file, bootstrap, indent=2)
+    
+    def get_saved_geometry(self, screen_width, screen_height):
+        """
+        Get the window geometry saved at the last close, if it still fits the screen
+        
+        Returns:
+            Geometry string ("WxH+X+Y") or None to use the default sizing
+        """
+        match = re.fullmatch(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)", self.bootstrap.get("window_geometry", ""))
+        if not match:
+            return None
+        width, height, x, y = map(int, match.groups())
+        # Screen resolution may have changed since - keep the window reachable
+        if width > screen_width or height > screen_height:
+            return None
+        if not (0 <= x <= screen_width - 100 and 0 <= y <= screen_height - 100):
+            return None
+        return match.group(0)
+    
+    def save_window_geometry(self):
+        """Save the window size and position to the bootstrap file (machine-specific)"""
+        try:
+            if self.root.state() != "normal":
+                return  # Maximized/minimized - let the next start size it afresh
+            # Only the geometry changes - self.bootstrap still holds what was
+            # last saved, so unsaved Setup tab paths are not written here
+            self.bootstrap["window_geometry"] = self.root.geometry()
+            write_json_atomic(self.bootstrap_file, self.bootstrap, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save window geometry: {e}")
     
     def create_menu_bar(self):
         """Create the application menu bar"""
@@ -339,7 +343,7 @@ class AirScentingUI:
         
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
                     saved = json.load(f)
                     # Add terrain_types if not present
                     if "terrain_types" not in saved:
@@ -358,8 +362,13 @@ class AirScentingUI:
     
     def save_config(self):
         """Save configuration to file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        write_json_atomic(self.config_file, self.config, indent=2)
+    
+    def save_all(self):
+        """Save config, machine-specific paths and the settings backup (each file written once)"""
+        self.save_config()
+        self.save_bootstrap()
+        self.misc_data_ops.save_settings_backup()
     
     def setup_setup_tab(self):
         """Setup the Setup tab - delegate to SetupTab module"""
@@ -367,6 +376,10 @@ class AirScentingUI:
     
     def setup_entry_tab(self):
         """Setup the Training Session Entry tab"""
+        # tkcalendar pulls in babel's locale data - import it here, after the
+        # splash screen is up, rather than at module load
+        from tkcalendar import DateEntry
+        
         # Create scrollable frame
         canvas = tk.Canvas(self.entry_tab)
         scrollbar = ttk.Scrollbar(self.entry_tab, orient="vertical", command=canvas.yview)
@@ -951,17 +964,17 @@ class AirScentingUI:
         
         # Import the export module
         import export_pdf
+        import database
         
-        # Get database connection function
+        # Get database connection function (on the engine for the selected type)
+        db_type = sv.db_type.get()
         def get_connection():
-            import config
-            from database import engine
-            return engine.connect()
+            return database.get_connection(db_type)
         
         # Show export dialog
         export_pdf.show_export_dialog(
             parent=self.root,
-            db_type=sv.db_type.get(),
+            db_type=db_type,
             current_dog=sv.dog.get(),
             get_connection_func=get_connection,
             backup_folder=sv.backup_folder.get().strip(),
@@ -1079,9 +1092,9 @@ class AirScentingUI:
         """Delegate to Setup tab manager"""
         return self.setup_tab_mgr.create_database()
 
-    def load_locations_from_database(self):
+    def populate_setup_tab_lists(self):
         """Delegate to Setup tab manager"""
-        self.setup_tab_mgr.load_locations_from_database()
+        self.setup_tab_mgr.populate_setup_tab_lists()
 
     def refresh_location_list(self):
         """Delegate to Setup tab manager"""
@@ -1125,10 +1138,6 @@ class AirScentingUI:
         """Delegate to Setup tab manager"""
         self.setup_tab_mgr.remove_location()
 
-    def load_dogs_from_database(self):
-        """Delegate to Setup tab manager"""
-        self.setup_tab_mgr.load_dogs_from_database()
-
     def refresh_dog_list(self):
         """Delegate to Setup tab manager"""
         self.setup_tab_mgr.refresh_dog_list()
@@ -1212,6 +1221,8 @@ class AirScentingUI:
     def on_closing(self):
         """Handle window close event"""
         if self.form_mgmt.check_unsaved_changes("exit"):
+            self.save_window_geometry()
+            self.setup_tab_mgr.shutdown()
             self.root.destroy()
     
     def on_tab_changed(self, event):
@@ -1260,100 +1271,30 @@ class AirScentingUI:
         db_type = sv.db_type.get()
         
         # For SQLite, check if database file exists BEFORE trying to connect
+        database_exists = True
         if db_type == "sqlite":
             import config as config_module
             db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
             if not os.path.exists(db_path):
                 # Database file doesn't exist
                 database_exists = False
-            else:
-                # File exists - check if tables exist
-                try:
-                    import config
-                    old_db_type = config.DB_TYPE
-                    config.DB_TYPE = db_type
-                    
-                    from database import engine
-                    engine.dispose()
-                    from importlib import reload
-                    import database
-                    reload(database)
-                    
-                    from sqlalchemy import text
-                    
-                    # Try to query the dogs table
-                    with database.get_connection() as conn:
-                        conn.execute(text("SELECT COUNT(*) FROM dogs"))
-                    
-                    # Restore original DB_TYPE
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                    
-                    database_exists = True
-                    
-                except Exception as e:
-                    # Restore original DB_TYPE on error
-                    try:
-                        import config
-                        import database
-                        from importlib import reload
-                        config.DB_TYPE = old_db_type
-                        database.engine.dispose()
-                        reload(database)
-                    except:
-                        pass
-                    
-                    if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
-                        database_exists = False
-                    else:
-                        # Some other error - allow switching but log it
-                        print(f"Error checking database: {e}")
-                        database_exists = True
-        else:
-            # For PostgreSQL/Supabase, try to connect and query
+        
+        if database_exists:
+            # File exists (or networked database) - try to query the dogs table
+            # on the engine for db_type
             try:
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                from database import engine
-                engine.dispose()
-                from importlib import reload
                 import database
-                reload(database)
-                
                 from sqlalchemy import text
                 
-                # Try to query the dogs table
-                with database.get_connection() as conn:
+                with database.get_connection(db_type) as conn:
                     conn.execute(text("SELECT COUNT(*) FROM dogs"))
                 
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-                
-                database_exists = True
-                
             except Exception as e:
-                # Restore original DB_TYPE on error
-                try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                
                 if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
                     database_exists = False
                 else:
                     # Some other error - allow switching but log it
                     print(f"Error checking database: {e}")
-                    database_exists = True
         
         # Check required folders - get directly from sv
         backup_folder = sv.backup_folder.get().strip()
@@ -7,8 +7,16 @@ import os
 from sqlalchemy import text
 from datetime import datetime
 import config
-from database import engine, get_connection
-from ui_utils import get_username, get_default_terrain_types, get_default_distraction_types
+from database import (dispose_engines, get_connection, get_engine, INSERT_NAME, DELETE_NAME,
+                      INSERT_SELECTED_TERRAIN, INSERT_SUBJECT_RESPONSE)
+from ui_utils import get_username, DEFAULT_TERRAIN_TYPES, DEFAULT_DISTRACTION_TYPES
+
+
+# Type-list INSERTs that carry a sort_order (built once)
+_INSERT_SORTED_TYPE = {
+    table: text(f"INSERT INTO {table} (name, user_name, sort_order) VALUES (:name, :user_name, :sort_order)")
+    for table in ("terrain_types", "distraction_types")
+}
 
 
 class DatabaseManager:
@@ -26,27 +34,6 @@ class DatabaseManager:
         # For postgres/supabase, assume exists if we can connect
         return True
     
-    def _switch_db_context(self):
-        """Switch to the configured database type and return old type"""
-        old_db_type = config.DB_TYPE
-        config.DB_TYPE = self.db_type
-        
-        # Reload database module
-        engine.dispose()
-        from importlib import reload
-        import database
-        reload(database)
-        
-        return old_db_type
-    
-    def _restore_db_context(self, old_db_type):
-        """Restore the original database type"""
-        config.DB_TYPE = old_db_type
-        engine.dispose()
-        from importlib import reload
-        import database
-        reload(database)
-    
     # ===== SETTINGS =====
     
     def save_setting(self, key, value):
@@ -55,9 +42,7 @@ class DatabaseManager:
             return
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 # Try to update first
                 result = conn.execute(
                     text("UPDATE settings SET value = :value, updated_at = CURRENT_TIMESTAMP WHERE key = :key"),
@@ -70,13 +55,8 @@ class DatabaseManager:
                         text("INSERT INTO settings (key, value) VALUES (:key, :value)"),
                         {"key": key, "value": value}
                     )
-                
-                conn.commit()
-            
-            self._restore_db_context(old_db_type)
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "no such table" not in str(e).lower() and "does not exist" not in str(e).lower():
                 print(f"Error saving database setting '{key}': {e}")
     
@@ -86,21 +66,16 @@ class DatabaseManager:
             return default
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(
                     text("SELECT value FROM settings WHERE key = :key"),
                     {"key": key}
                 )
                 row = result.fetchone()
             
-            self._restore_db_context(old_db_type)
-            
             return row[0] if row else default
                 
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
                 return default
             else:
@@ -120,21 +95,16 @@ class DatabaseManager:
             return 1
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 max_result = conn.execute(
                     text("SELECT MAX(session_number) FROM training_sessions WHERE dog_name = :dog_name"),
                     {"dog_name": dog_name}
                 )
                 max_num = max_result.scalar()
             
-            self._restore_db_context(old_db_type)
-            
             return (max_num or 0) + 1
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             
             if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
                 return 1
@@ -153,9 +123,7 @@ class DatabaseManager:
             (success: bool, message: str, session_id: int or None)
         """
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 # Check if session exists
                 result = conn.execute(
                     text("SELECT id FROM training_sessions WHERE session_number = :session_number AND dog_name = :dog_name"),
@@ -224,12 +192,9 @@ class DatabaseManager:
                     session_id = result.scalar()
                     message = f"Session #{session_data['session_number']} saved successfully!"
             
-            self._restore_db_context(old_db_type)
-            
             return True, message, session_id
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error saving session: {e}")
             return False, f"Database error: {e}", None
     
@@ -246,9 +211,7 @@ class DatabaseManager:
         dog_name = dog_name.strip()
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(
                     text("""
                         SELECT id, date, handler, session_purpose, field_support, dog_name, location,
@@ -268,9 +231,6 @@ class DatabaseManager:
                     print(f"DEBUG: row[6] (location) = '{row[6]}'")
                     print(f"DEBUG: Full row = {row}")
                 
-            
-            self._restore_db_context(old_db_type)
-            
             if row:
                 return {
                     "id": row[0],
@@ -297,7 +257,6 @@ class DatabaseManager:
             return None
                 
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error loading session: {e}")
             return None
     
@@ -309,22 +268,16 @@ class DatabaseManager:
         dog_name = dog_name.strip()
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 for session_num in session_numbers:
                     conn.execute(
                         text("DELETE FROM training_sessions WHERE session_number = :session_number AND dog_name = :dog_name"),
                         {"session_number": session_num, "dog_name": dog_name}
                     )
-                conn.commit()
-            
-            self._restore_db_context(old_db_type)
             
             return True, f"Deleted {len(session_numbers)} session(s)"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error deleting sessions: {e}")
             return False, f"Database error: {e}"
     
@@ -345,9 +298,7 @@ class DatabaseManager:
         dog_name = dog_name.strip()
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 conn.execute(
                     text("""
                         UPDATE training_sessions 
@@ -356,14 +307,10 @@ class DatabaseManager:
                     """),
                     {"status": new_status, "session_number": session_number, "dog_name": dog_name}
                 )
-                conn.commit()
-            
-            self._restore_db_context(old_db_type)
             
             return True
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error updating session status: {e}")
             return False
     
@@ -383,8 +330,6 @@ class DatabaseManager:
         dog_name = dog_name.strip()
         
         try:
-            old_db_type = self._switch_db_context()
-            
             # Build WHERE clause based on status filter
             if status_filter == 'active':
                 status_where = "AND (status = 'active' OR status IS NULL)"
@@ -393,7 +338,7 @@ class DatabaseManager:
             else:  # 'both'
                 status_where = ""
             
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(
                     text(f"""
                         SELECT session_number, date, handler, dog_name
@@ -405,12 +350,9 @@ class DatabaseManager:
                 )
                 sessions = result.fetchall()
             
-            self._restore_db_context(old_db_type)
-            
             return sessions
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
                 return []
             else:
@@ -434,7 +376,7 @@ class DatabaseManager:
         dog_name = dog_name.strip()
         
         try:
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 conn.execute(
                     text("""
                         UPDATE training_sessions 
@@ -443,7 +385,6 @@ class DatabaseManager:
                     """),
                     {"status": new_status, "session_number": session_number, "dog_name": dog_name}
                 )
-                conn.commit()
             
             return True
             
@@ -467,7 +408,7 @@ class DatabaseManager:
         dog_name = dog_name.strip()
         
         try:
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(
                     text("""
                         SELECT status 
@@ -504,8 +445,6 @@ class DatabaseManager:
         dog_name = dog_name.strip()
         
         try:
-            old_db_type = self._switch_db_context()
-            
             # Build WHERE clause based on status filter
             if status_filter == 'active':
                 status_where = "AND (status = 'active' OR status IS NULL)"
@@ -514,7 +453,7 @@ class DatabaseManager:
             else:  # 'both'
                 status_where = ""
             
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 # Count sessions with same dog, matching status, with date <= given date
                 result = conn.execute(
                     text(f"""
@@ -528,13 +467,10 @@ class DatabaseManager:
                 )
                 count = result.scalar()
             
-            self._restore_db_context(old_db_type)
-            
             # Return count as ordinal position (minimum 1)
             return count if count > 0 else 1
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
                 return 1
             else:
@@ -546,56 +482,45 @@ class DatabaseManager:
     def save_selected_terrains(self, session_id, terrain_list):
         """Save selected terrains for a session"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 # Delete existing
                 conn.execute(
                     text("DELETE FROM selected_terrains WHERE session_id = :session_id"),
                     {"session_id": session_id}
                 )
                 
-                # Insert new
-                for terrain_name in terrain_list:
-                    conn.execute(
-                        text("""
-                            INSERT INTO selected_terrains (session_id, terrain_name, user_name)
-                            VALUES (:session_id, :terrain_name, :user_name)
-                        """),
-                        {
-                            "session_id": session_id,
-                            "terrain_name": terrain_name,
-                            "user_name": get_username()
-                        }
-                    )
-                
-                conn.commit()
+                # Insert new - one executemany
+                user_name = get_username()
+                rows = [
+                    {
+                        "session_id": session_id,
+                        "terrain_name": terrain_name,
+                        "user_name": user_name
+                    }
+                    for terrain_name in terrain_list
+                ]
+                if rows:
+                    conn.execute(INSERT_SELECTED_TERRAIN, rows)
             
-            self._restore_db_context(old_db_type)
             return True
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error saving selected terrains: {e}")
             return False
     
     def load_selected_terrains(self, session_id):
         """Load selected terrains for a session"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(
                     text("SELECT terrain_name FROM selected_terrains WHERE session_id = :session_id ORDER BY terrain_name"),
                     {"session_id": session_id}
                 )
-                terrains = [row[0] for row in result]
+                terrains = result.scalars().all()
             
-            self._restore_db_context(old_db_type)
             return terrains
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error loading selected terrains: {e}")
             return []
     
@@ -604,48 +529,39 @@ class DatabaseManager:
     def save_subject_responses(self, session_id, responses_list):
         """Save subject responses for a session"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 # Delete existing
                 conn.execute(
                     text("DELETE FROM subject_responses WHERE session_id = :session_id"),
                     {"session_id": session_id}
                 )
                 
-                # Insert new
-                for response in responses_list:
-                    if response.get("tfr") or response.get("refind"):
-                        conn.execute(
-                            text("""
-                                INSERT INTO subject_responses (session_id, subject_number, tfr, refind, user_name)
-                                VALUES (:session_id, :subject_number, :tfr, :refind, :user_name)
-                            """),
-                            {
-                                "session_id": session_id,
-                                "subject_number": response["subject_number"],
-                                "tfr": response.get("tfr", ""),
-                                "refind": response.get("refind", ""),
-                                "user_name": get_username()
-                            }
-                        )
-                
-                conn.commit()
+                # Insert new (only subjects with a response) - one executemany
+                user_name = get_username()
+                rows = [
+                    {
+                        "session_id": session_id,
+                        "subject_number": response["subject_number"],
+                        "tfr": response.get("tfr", ""),
+                        "refind": response.get("refind", ""),
+                        "user_name": user_name
+                    }
+                    for response in responses_list
+                    if response.get("tfr") or response.get("refind")
+                ]
+                if rows:
+                    conn.execute(INSERT_SUBJECT_RESPONSE, rows)
             
-            self._restore_db_context(old_db_type)
             return True
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error saving subject responses: {e}")
             return False
     
     def load_subject_responses(self, session_id):
         """Load subject responses for a session"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(
                     text("""
                         SELECT subject_number, tfr, refind 
@@ -664,11 +580,9 @@ class DatabaseManager:
                     for row in result
                 ]
             
-            self._restore_db_context(old_db_type)
             return responses
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error loading subject responses: {e}")
             return []
     
@@ -680,17 +594,13 @@ class DatabaseManager:
             return []
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(text("SELECT name FROM dogs ORDER BY name"))
-                dogs = [row[0] for row in result]
+                dogs = result.scalars().all()
             
-            self._restore_db_context(old_db_type)
             return dogs
                 
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
                 return []
             else:
@@ -704,20 +614,15 @@ class DatabaseManager:
             return False, "Dog name cannot be empty"
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 conn.execute(
-                    text("INSERT INTO dogs (name, user_name) VALUES (:name, :user_name)"),
+                    INSERT_NAME["dogs"],
                     {"name": dog_name, "user_name": get_username()}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Added dog: {dog_name}"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
                 return False, f"Dog '{dog_name}' already exists"
             else:
@@ -727,20 +632,15 @@ class DatabaseManager:
     def remove_dog(self, dog_name):
         """Remove a dog from the database"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 conn.execute(
-                    text("DELETE FROM dogs WHERE name = :name"),
+                    DELETE_NAME["dogs"],
                     {"name": dog_name}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Removed dog: {dog_name}"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error removing dog: {e}")
             return False, f"Database error: {e}"
     
@@ -752,17 +652,13 @@ class DatabaseManager:
             return []
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(text("SELECT name FROM training_locations ORDER BY name"))
-                locations = [row[0] for row in result]
+                locations = result.scalars().all()
             
-            self._restore_db_context(old_db_type)
             return locations
                 
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
                 return []
             else:
@@ -776,20 +672,15 @@ class DatabaseManager:
             return False, "Location cannot be empty"
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 conn.execute(
-                    text("INSERT INTO training_locations (name, user_name) VALUES (:name, :user_name)"),
+                    INSERT_NAME["training_locations"],
                     {"name": location, "user_name": get_username()}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Added location: {location}"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
                 return False, f"Location '{location}' already exists"
             else:
@@ -799,20 +690,15 @@ class DatabaseManager:
     def remove_location(self, location):
         """Remove a training location"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 conn.execute(
-                    text("DELETE FROM training_locations WHERE name = :name"),
+                    DELETE_NAME["training_locations"],
                     {"name": location}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Removed location: {location}"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error removing location: {e}")
             return False, f"Database error: {e}"
     
@@ -824,17 +710,13 @@ class DatabaseManager:
             return []
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(text("SELECT name FROM terrain_types ORDER BY sort_order, name"))
-                terrain_types = [row[0] for row in result]
+                terrain_types = result.scalars().all()
             
-            self._restore_db_context(old_db_type)
             return terrain_types
                 
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
                 return []
             else:
@@ -848,24 +730,19 @@ class DatabaseManager:
             return False, "Terrain type cannot be empty"
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 # Get next sort_order (max + 1)
                 result = conn.execute(text("SELECT COALESCE(MAX(sort_order), -1) + 1 FROM terrain_types"))
                 next_order = result.scalar()
                 
                 conn.execute(
-                    text("INSERT INTO terrain_types (name, user_name, sort_order) VALUES (:name, :user_name, :sort_order)"),
+                    _INSERT_SORTED_TYPE["terrain_types"],
                     {"name": terrain, "user_name": get_username(), "sort_order": next_order}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Added terrain type: {terrain}"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
                 return False, f"Terrain type '{terrain}' already exists"
             else:
@@ -875,29 +752,22 @@ class DatabaseManager:
     def remove_terrain_type(self, terrain):
         """Remove a terrain type"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 conn.execute(
-                    text("DELETE FROM terrain_types WHERE name = :name"),
+                    DELETE_NAME["terrain_types"],
                     {"name": terrain}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Removed terrain type: {terrain}"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error removing terrain type: {e}")
             return False, f"Database error: {e}"
     
     def move_terrain_up(self, terrain):
         """Move terrain type up in sort order"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 # Get current item's sort_order
                 result = conn.execute(
                     text("SELECT sort_order FROM terrain_types WHERE name = :name"),
@@ -905,7 +775,6 @@ class DatabaseManager:
                 )
                 row = result.fetchone()
                 if not row:
-                    self._restore_db_context(old_db_type)
                     return False, f"Terrain type '{terrain}' not found"
                 
                 current_order = row[0]
@@ -918,7 +787,6 @@ class DatabaseManager:
                 prev_row = result.fetchone()
                 
                 if not prev_row:
-                    self._restore_db_context(old_db_type)
                     return False, "Already at top"
                 
                 prev_name, prev_order = prev_row
@@ -932,22 +800,17 @@ class DatabaseManager:
                     text("UPDATE terrain_types SET sort_order = :new_order WHERE name = :name"),
                     {"new_order": current_order, "name": prev_name}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Moved '{terrain}' up"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error moving terrain type up: {e}")
             return False, f"Database error: {e}"
     
     def move_terrain_down(self, terrain):
         """Move terrain type down in sort order"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 # Get current item's sort_order
                 result = conn.execute(
                     text("SELECT sort_order FROM terrain_types WHERE name = :name"),
@@ -955,7 +818,6 @@ class DatabaseManager:
                 )
                 row = result.fetchone()
                 if not row:
-                    self._restore_db_context(old_db_type)
                     return False, f"Terrain type '{terrain}' not found"
                 
                 current_order = row[0]
@@ -968,7 +830,6 @@ class DatabaseManager:
                 next_row = result.fetchone()
                 
                 if not next_row:
-                    self._restore_db_context(old_db_type)
                     return False, "Already at bottom"
                 
                 next_name, next_order = next_row
@@ -982,43 +843,49 @@ class DatabaseManager:
                     text("UPDATE terrain_types SET sort_order = :new_order WHERE name = :name"),
                     {"new_order": current_order, "name": next_name}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Moved '{terrain}' down"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error moving terrain type down: {e}")
             return False, f"Database error: {e}"
     
-    def restore_default_terrain_types(self):
-        """Replace all terrain types with defaults"""
+    def replace_types(self, table_name, names, label=None):
+        """
+        Replace every row of terrain_types/distraction_types with names
+        
+        One transaction: a DELETE, then the names in list order (as their
+        sort_order) as a single executemany.
+        
+        Args:
+            table_name: "terrain_types" or "distraction_types"
+            names: Type names in display order
+            label: Kind of type for the messages (defaults to the table's)
+        
+        Returns:
+            (success, message)
+        """
+        label = label or table_name.replace("_", " ")
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
-                # Delete all existing
-                conn.execute(text("DELETE FROM terrain_types"))
-                
-                # Insert defaults with proper sort_order
-                defaults = get_default_terrain_types()
-                for idx, terrain in enumerate(defaults):
-                    conn.execute(
-                        text("INSERT INTO terrain_types (name, user_name, sort_order) VALUES (:name, :user_name, :sort_order)"),
-                        {"name": terrain, "user_name": get_username(), "sort_order": idx}
-                    )
-                
-                conn.commit()
+            with get_engine(self.db_type).begin() as conn:
+                conn.execute(text(f"DELETE FROM {table_name}"))
+                user_name = get_username()
+                conn.execute(
+                    _INSERT_SORTED_TYPE[table_name],
+                    [{"name": name, "user_name": user_name, "sort_order": idx}
+                     for idx, name in enumerate(names)]
+                )
             
-            self._restore_db_context(old_db_type)
-            return True, f"Restored {len(defaults)} default terrain types"
+            return True, f"Restored {len(names)} {label}"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
-            print(f"Error restoring default terrain types: {e}")
+            print(f"Error restoring {label}: {e}")
             return False, f"Database error: {e}"
     
+    def restore_default_terrain_types(self):
+        """Replace all terrain types with defaults"""
+        return self.replace_types("terrain_types", DEFAULT_TERRAIN_TYPES, "default terrain types")
+    
     # ===== DISTRACTION TYPES =====
     
     def load_distraction_types(self):
@@ -1027,17 +894,13 @@ class DatabaseManager:
             return []
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_connection(self.db_type) as conn:
                 result = conn.execute(text("SELECT name FROM distraction_types ORDER BY sort_order, name"))
-                distraction_types = [row[0] for row in result]
+                distraction_types = result.scalars().all()
             
-            self._restore_db_context(old_db_type)
             return distraction_types
                 
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "no such table" in str(e).lower() or "does not exist" in str(e).lower():
                 return []
             else:
@@ -1051,24 +914,19 @@ class DatabaseManager:
             return False, "Distraction type cannot be empty"
         
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 # Get next sort_order (max + 1)
                 result = conn.execute(text("SELECT COALESCE(MAX(sort_order), -1) + 1 FROM distraction_types"))
                 next_order = result.scalar()
                 
                 conn.execute(
-                    text("INSERT INTO distraction_types (name, user_name, sort_order) VALUES (:name, :user_name, :sort_order)"),
+                    _INSERT_SORTED_TYPE["distraction_types"],
                     {"name": distraction, "user_name": get_username(), "sort_order": next_order}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Added distraction type: {distraction}"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
                 return False, f"Distraction type '{distraction}' already exists"
             else:
@@ -1078,29 +936,22 @@ class DatabaseManager:
     def remove_distraction_type(self, distraction):
         """Remove a distraction type"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 conn.execute(
-                    text("DELETE FROM distraction_types WHERE name = :name"),
+                    DELETE_NAME["distraction_types"],
                     {"name": distraction}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Removed distraction type: {distraction}"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error removing distraction type: {e}")
             return False, f"Database error: {e}"
     
     def move_distraction_up(self, distraction):
         """Move distraction type up in sort order"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 # Get current item's sort_order
                 result = conn.execute(
                     text("SELECT sort_order FROM distraction_types WHERE name = :name"),
@@ -1108,7 +959,6 @@ class DatabaseManager:
                 )
                 row = result.fetchone()
                 if not row:
-                    self._restore_db_context(old_db_type)
                     return False, f"Distraction type '{distraction}' not found"
                 
                 current_order = row[0]
@@ -1121,7 +971,6 @@ class DatabaseManager:
                 prev_row = result.fetchone()
                 
                 if not prev_row:
-                    self._restore_db_context(old_db_type)
                     return False, "Already at top"
                 
                 prev_name, prev_order = prev_row
@@ -1135,22 +984,17 @@ class DatabaseManager:
                     text("UPDATE distraction_types SET sort_order = :new_order WHERE name = :name"),
                     {"new_order": current_order, "name": prev_name}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Moved '{distraction}' up"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error moving distraction type up: {e}")
             return False, f"Database error: {e}"
     
     def move_distraction_down(self, distraction):
         """Move distraction type down in sort order"""
         try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
+            with get_engine(self.db_type).begin() as conn:
                 # Get current item's sort_order
                 result = conn.execute(
                     text("SELECT sort_order FROM distraction_types WHERE name = :name"),
@@ -1158,7 +1002,6 @@ class DatabaseManager:
                 )
                 row = result.fetchone()
                 if not row:
-                    self._restore_db_context(old_db_type)
                     return False, f"Distraction type '{distraction}' not found"
                 
                 current_order = row[0]
@@ -1171,7 +1014,6 @@ class DatabaseManager:
                 next_row = result.fetchone()
                 
                 if not next_row:
-                    self._restore_db_context(old_db_type)
                     return False, "Already at bottom"
                 
                 next_name, next_order = next_row
@@ -1185,42 +1027,16 @@ class DatabaseManager:
                     text("UPDATE distraction_types SET sort_order = :new_order WHERE name = :name"),
                     {"new_order": current_order, "name": next_name}
                 )
-                conn.commit()
             
-            self._restore_db_context(old_db_type)
             return True, f"Moved '{distraction}' down"
             
         except Exception as e:
-            self._restore_db_context(old_db_type)
             print(f"Error moving distraction type down: {e}")
             return False, f"Database error: {e}"
     
     def restore_default_distraction_types(self):
         """Replace all distraction types with defaults"""
-        try:
-            old_db_type = self._switch_db_context()
-            
-            with get_connection() as conn:
-                # Delete all existing
-                conn.execute(text("DELETE FROM distraction_types"))
-                
-                # Insert defaults with proper sort_order
-                defaults = get_default_distraction_types()
-                for idx, distraction in enumerate(defaults):
-                    conn.execute(
-                        text("INSERT INTO distraction_types (name, user_name, sort_order) VALUES (:name, :user_name, :sort_order)"),
-                        {"name": distraction, "user_name": get_username(), "sort_order": idx}
-                    )
-                
-                conn.commit()
-            
-            self._restore_db_context(old_db_type)
-            return True, f"Restored {len(defaults)} default distraction types"
-            
-        except Exception as e:
-            self._restore_db_context(old_db_type)
-            print(f"Error restoring default distraction types: {e}")
-            return False, f"Database error: {e}"
+        return self.replace_types("distraction_types", DEFAULT_DISTRACTION_TYPES, "default distraction types")
 
 
 
@@ -1358,7 +1174,10 @@ class DatabaseOperations:
         Returns:
             bool: True if successful, False otherwise
         """
-        return self.db_manager.update_session_status(session_number, dog_name, new_status)
+        success = self.db_manager.update_session_status(session_number, dog_name, new_status)
+        if success:
+            self.ui.misc_data_ops.forget_next_session_numbers(dog_name)
+        return success
     
     def get_session_status(self, session_number, dog_name):
         """Get the status of a specific session
@@ -1387,7 +1206,10 @@ class DatabaseOperations:
     
     def delete_sessions(self, session_numbers, dog_name):
         """Delete multiple sessions"""
-        return self.db_manager.delete_sessions(session_numbers, dog_name)
+        success, message = self.db_manager.delete_sessions(session_numbers, dog_name)
+        if success:
+            self.ui.misc_data_ops.forget_next_session_numbers(dog_name.strip())
+        return success, message
 
     def dispose_all_engines(self):
         """
@@ -1397,19 +1219,8 @@ class DatabaseOperations:
         Useful when database password changes.
         """
         try:
-            # Import here to avoid circular imports
-            from database import engine
-            import config
-            from importlib import reload
-            import database as db_module
-            
-            # Dispose the main engine
-            engine.dispose()
-            
-            # Reload database module to pick up new configuration
-            reload(db_module)
-            
-            print("[OK] All database engines disposed and reloaded")
+            dispose_engines()
+            print("[OK] All database engines disposed")
             
         except Exception as e:
             print(f"[WARN] Error disposing engines: {e}")
@@ -18,7 +18,7 @@ class FormManagement:
             ui: Reference to AirScentingUI instance
         """
         self.ui = ui
-        self.form_snapshot = ""  # Stores snapshot of form state for change detection
+        self.form_snapshot = None  # Snapshot of form state (tuple) for change detection
     
     # ========================================
     # FORM STATE MANAGEMENT
@@ -26,13 +26,14 @@ class FormManagement:
     
     def take_form_snapshot(self):
         """Take a snapshot of the current form state"""
-        self.form_snapshot = self.get_form_state_string()
+        self.form_snapshot = self.get_form_state()
     
-    def get_form_state_string(self):
-        """Get a string representation of all form fields for comparison"""
+    def get_form_state(self):
+        """Get a tuple of all form field values for comparison"""
         from sv import sv
         
-        parts = [
+        # Plain tuple - compared field by field, nothing joined into one string
+        return (
             sv.db_type.get(),
             sv.db_path.get(),
             sv.trail_maps_folder.get(),
@@ -44,16 +45,14 @@ class FormManagement:
             sv.new_terrain.get(),
             sv.new_distraction.get(),
             # Include lists from config
-            ", ".join(sorted(self.ui.config.get("training_locations", []))),
-            ", ".join(self.ui.config.get("terrain_types", [])),
-            ", ".join(self.ui.config.get("distraction_types", []))
-        ]
-        return "|".join(parts)
+            tuple(sorted(self.ui.config.get("training_locations", []))),
+            tuple(self.ui.config.get("terrain_types", [])),
+            tuple(self.ui.config.get("distraction_types", []))
+        )
     
     def has_unsaved_changes(self):
         """Check if the form has unsaved changes"""
-        current_state = self.get_form_state_string()
-        return current_state != self.form_snapshot
+        return self.get_form_state() != self.form_snapshot
     
     def check_unsaved_changes(self, action_name="proceed"):
         """
@@ -439,12 +438,10 @@ class FormManagement:
             n = int(num_subjects)
             # Generate values: "0 out of n", "1 out of n", ..., "n out of n"
             values = [f"{i} out of {n}" for i in range(n + 1)]
-            self.ui.a_subjects_found_combo['values'] = values
-            self.ui.a_subjects_found_combo['state'] = 'readonly'
+            self.ui.a_subjects_found_combo.configure(values=values, state='readonly')
             # Clear current selection when choices change
             sv.subjects_found.set("")
         else:
             # No number selected, disable and clear the subjects_found combobox
-            self.ui.a_subjects_found_combo['values'] = []
-            self.ui.a_subjects_found_combo['state'] = 'disabled'
+            self.ui.a_subjects_found_combo.configure(values=[], state='disabled')
             sv.subjects_found.set("")
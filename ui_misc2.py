@@ -212,6 +212,9 @@ class Misc2Operations:
             if working_dialog:
                 working_dialog.close(delay_ms=200)
 
+        # This dog's cached startup session number is out of date now
+        self.ui.misc_data_ops.forget_next_session_numbers(dog_name)
+
         # Save last handler name to config
         if handler:
             self.ui.config["last_handler_name"] = handler
@@ -2,18 +2,90 @@
 Miscellaneous Data Operations for Air-Scenting Logger UI
 Handles initialization, backups, restore, and default data loading
 """
+import functools
 import os
+import re
 import json
+import hashlib
+import sqlite3
 import tkinter as tk
 from tkinter import messagebox
 from pathlib import Path
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from sqlalchemy import text
-from ui_utils import get_username, get_default_terrain_types, get_default_distraction_types
+import config
+import database
+from ui_utils import get_username, get_default_terrain_types, get_default_distraction_types, write_json_atomic
 from ui_database import DatabaseOperations, get_db_manager
 from working_dialog import WorkingDialog
 import sv
 
+# Characters not allowed in a backup file name (replaced with "_")
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-]')
+
+# Name lists in airscenting_settings.json - (table / settings key, summary label)
+_SETTINGS_NAME_TABLES = (
+    ("dogs", "dog(s)"),
+    ("training_locations", "location(s)"),
+    ("terrain_types", "terrain type(s)"),
+    ("distraction_types", "distraction type(s)"),
+)
+
+# Backup restore SQL (built once, run as one executemany per table)
+_RESTORE_SESSION_INSERT = text("""
+    INSERT INTO training_sessions 
+    (date, session_number, handler, session_purpose, field_support, dog_name, location,
+     search_area_size, num_subjects, handler_knowledge, weather, temperature, 
+     wind_direction, wind_speed, search_type, drive_level, subjects_found, comments, image_files, user_name)
+    VALUES (:date, :session_number, :handler, :session_purpose, :field_support, :dog_name, :location,
+            :search_area_size, :num_subjects, :handler_knowledge, :weather, :temperature, 
+            :wind_direction, :wind_speed, :search_type, :drive_level, :subjects_found, :comments, :image_files, :user_name)
+""")
+_SELECT_SESSION_KEYS = text("SELECT session_number, dog_name FROM training_sessions")
+_SELECT_SESSION_IDS = text("SELECT id, session_number, dog_name FROM training_sessions")
+
+
+def _read_json_file(path):
+    """Load a JSON file - returns the exception instead of raising (for executor.map)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        return e
+
+
+def _require_backup_folder(interactive, failed=None):
+    """
+    Decorator for methods that work on the backup folder
+    
+    Reads and checks sv.backup_folder once, then calls the method with the
+    folder as a Path after self. If it is unset or missing the method is
+    skipped and `failed` returned - with a warning dialog when interactive
+    (user-triggered restores), a console warning otherwise (automatic backups).
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            backup_folder = sv.backup_folder.get().strip()
+            if not backup_folder:
+                if interactive:
+                    messagebox.showwarning("No Backup Folder", "Please select a backup folder first")
+                return failed  # Nothing configured - automatic backups are skipped
+            
+            backup_path = Path(backup_folder)
+            if not backup_path.exists():
+                if interactive:
+                    messagebox.showwarning("Invalid Folder", f"Backup folder does not exist:\n{backup_folder}")
+                else:
+                    print(f"Warning: Backup folder does not exist: {backup_folder}")
+                return failed
+            
+            return method(self, backup_path, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class MiscDataOperations:
     """Handles miscellaneous data operations: initialization, backups, restore"""
@@ -29,54 +101,24 @@ class MiscDataOperations:
         
         def step1():
             self.ensure_db_ready()
-            self.ui.load_locations_from_database()
+            # Locations, dogs, terrain and distraction types in one round-trip
+            # (also fills the Entry tab dog/location/terrain comboboxes)
+            self.ui.populate_setup_tab_lists()
             self.ui.root.after(50, step2)  # Schedule next step
         
         def step2():
-            self.ui.load_dogs_from_database()
-            self.ui.root.after(50, step3)
-        
-        def step3():
-            self.ui.load_terrain_from_database()
-            self.ui.root.after(50, step4)
-        
-        def step4():
-            self.ui.load_distraction_from_database()
-            self.ui.root.after(50, step5)
-        
-        def step5():
             # Load last selected dog from database
             try:
                 last_dog = DatabaseOperations(self.ui).load_db_setting("last_dog_name", "")
                 if last_dog:
                     sv.dog.set(last_dog)
                     # Update session number for this dog (on_dog_changed not triggered by programmatic set)
-                    # Use computed next number based on filter
-                    status_filter = sv.session_status_filter.get()
-                    filtered_sessions = DatabaseOperations(self.ui).get_all_sessions_for_dog(last_dog, status_filter)
-                    next_computed = len(filtered_sessions) + 1
-                    sv.session_number.set(str(next_computed))
+                    self._set_initial_session_number(last_dog)
             except Exception as e:
                 print(f"Could not load last dog: {e}")
-            self.ui.root.after(50, step6)
-        
-        def step6():
-            # Refresh Entry tab comboboxes if they exist
-            if hasattr(self.ui, 'a_dog_combo'):
-                self.ui.refresh_dog_list()
-            self.ui.root.after(50, step7)
-        
-        def step7():
-            if hasattr(self.ui, 'a_location_combo'):
-                self.ui.refresh_location_list()
-            self.ui.root.after(50, step8)
-        
-        def step8():
-            if hasattr(self.ui, 'a_terrain_combo'):
-                self.ui.refresh_terrain_list()
-            self.ui.root.after(50, step9)
+            self.ui.root.after(50, step3)
         
-        def step9():
+        def step3():
             # Update navigation buttons now that dog and session are loaded
             if hasattr(self.ui, 'a_prev_session_btn'):
                 self.ui.navigation.update_navigation_buttons()
@@ -84,88 +126,149 @@ class MiscDataOperations:
         # Start the chain
         step1()
     
+    def _database_key(self, db_type):
+        """
+        Key identifying the database select_initial_tab last found tables in
+        
+        SQLite: file path plus file identity (device/inode), so a deleted and
+        recreated file misses. Not mtime - every session save (and the WAL
+        checkpoint at exit) touches that, so it would never hit.
+        Networked: db_type plus a hash of the URL (never the URL itself - it
+        carries the password). Returns None if there is no (non-empty) SQLite file.
+        """
+        if db_type == "sqlite":
+            db_path = config.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
+            try:
+                st = os.stat(db_path)
+            except OSError:
+                return None
+            if not st.st_size:
+                return None
+            return f"sqlite:{os.path.abspath(db_path)}:{st.st_dev}:{st.st_ino}"
+        url_hash = hashlib.sha256(database.get_db_url(db_type).encode()).hexdigest()[:16]
+        return f"{db_type}:{url_hash}"
+    
+    def _probe_database(self, db_type):
+        """Check that the database for db_type is reachable and has the session table"""
+        # Catalog lookups - answers "does the table exist" without touching its rows
+        if db_type == "sqlite":
+            query = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'training_sessions'"
+        elif db_type == "mysql":
+            query = ("SELECT 1 FROM information_schema.tables "
+                     "WHERE table_schema = DATABASE() AND table_name = 'training_sessions'")
+        else:  # postgres or supabase
+            query = "SELECT 1 WHERE to_regclass('training_sessions') IS NOT NULL"
+        try:
+            with database.get_connection(db_type) as conn:
+                return conn.execute(text(query)).first() is not None
+        except:
+            # If connection or query fails, database doesn't have proper tables
+            return False
+    
+    def _set_initial_session_number(self, dog):
+        """
+        Show the next session number for the dog loaded at startup
+        
+        The number computed at the last startup (kept in the bootstrap file
+        per database/filter/dog, dropped when that dog's sessions change - see
+        forget_next_session_numbers) is shown straight away. The real count -
+        len of the filtered session list + 1 - runs on the Setup tab's worker
+        thread and replaces it, unless the user has moved on in the meantime.
+        """
+        status_filter = sv.session_status_filter.get()
+        cache_key = f"{sv.db_type.get()}/{status_filter}/{dog}"
+        counters = self.ui.bootstrap.setdefault("next_session_numbers", {})
+        cached = counters.get(cache_key)
+        if cached:
+            sv.session_number.set(str(cached))
+            sv.status.set(f"Ready - {dog} - Next session: #{cached}")
+        shown = sv.session_number.get()
+        
+        db_ops = DatabaseOperations(self.ui)
+        
+        def on_done(filtered_sessions):
+            # Use computed next number based on filter
+            next_computed = len(filtered_sessions) + 1
+            if sv.dog.get() == dog and sv.session_number.get() == shown:
+                # A snapshot taken while the cached number showed would flag the
+                # correction as an unsaved change - retake it if the form is untouched
+                form_mgmt = self.ui.form_mgmt
+                untouched = form_mgmt.get_form_state() == form_mgmt.form_snapshot
+                sv.session_number.set(str(next_computed))
+                if untouched:
+                    form_mgmt.take_form_snapshot()
+                sv.status.set(f"Ready - {dog} - Next session: #{next_computed}")
+                if hasattr(self.ui, 'a_prev_session_btn'):
+                    self.ui.navigation.update_navigation_buttons()
+            if counters.get(cache_key) != next_computed:
+                counters[cache_key] = next_computed
+                self._save_next_session_numbers()
+        
+        self.ui.setup_tab_mgr._submit(
+            "initial_session", lambda: db_ops.get_all_sessions_for_dog(dog, status_filter), on_done,
+            lambda e: print(f"Could not compute session number for {dog}: {e}"))
+    
+    def forget_next_session_numbers(self, dog=None, db_type=None):
+        """
+        Drop the cached startup session numbers for dog (all dogs if None)
+        in db_type (default: the current database), after its sessions were
+        saved, deleted or restored - the next startup recounts instead of
+        showing a stale number
+        """
+        counters = self.ui.bootstrap.get("next_session_numbers")
+        if not counters:
+            return
+        db_type = db_type or sv.db_type.get()
+        stale = [key for key in counters
+                 if key.split("/", 2)[0] == db_type and (dog is None or key.split("/", 2)[2] == dog)]
+        if stale:
+            for key in stale:
+                del counters[key]
+            self._save_next_session_numbers()
+    
+    def _save_next_session_numbers(self):
+        """Write the cached startup session numbers to the bootstrap file"""
+        try:
+            # Only the counters change - ui.bootstrap still holds what was last
+            # saved, so unsaved Setup tab edits are not written here
+            write_json_atomic(self.ui.bootstrap_file, self.ui.bootstrap, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save session numbers: {e}")
+    
     def select_initial_tab(self):
         """Select initial tab based on database existence"""
         db_type = sv.db_type.get()
-        database_exists = False
         
-        # Check if database exists
-        if db_type == "sqlite":
-            # For SQLite, check if database file exists
-            import config as config_module
-            db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-            if os.path.exists(db_path):
-                # Check if it has tables (not just an empty file)
-                try:
-                    import config
-                    old_db_type = config.DB_TYPE
-                    config.DB_TYPE = db_type
-                    
-                    from database import engine
-                    engine.dispose()
-                    from importlib import reload
-                    import database
-                    reload(database)
-                    
-                    # Try to query a table
-                    with database.get_connection() as conn:
-                        conn.execute(text("SELECT COUNT(*) FROM training_sessions"))
-                    
-                    database_exists = True
-                    
-                    # Restore original DB_TYPE
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    # If query fails, database doesn't have proper tables
-                    try:
-                        import config
-                        import database
-                        from importlib import reload
-                        config.DB_TYPE = old_db_type
-                        database.engine.dispose()
-                        reload(database)
-                    except:
-                        pass
-                    database_exists = False
+        # A database that had tables last launch (same file/URL) is taken on
+        # trust; anything else is probed. Only positive results are cached -
+        # a missing database is cheap to detect and may be created any time.
+        db_key = self._database_key(db_type)
+        if db_key is None:
+            self._show_initial_tab(False)
+        elif self.ui.config.get("last_known_db_with_tables") == db_key:
+            self._show_initial_tab(True)
         else:
-            # For PostgreSQL/Supabase, try to connect and query
-            try:
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                # Try to query a table
-                with database.get_connection() as conn:
-                    conn.execute(text("SELECT COUNT(*) FROM training_sessions"))
-                
-                database_exists = True
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                # If connection or query fails, database doesn't exist
+            # Probe on the Setup tab's worker thread - for networked databases
+            # this is the first connect (TCP/TLS handshake), which then also
+            # leaves a warm pooled connection for the startup loads
+            def on_done(database_exists):
+                if not database_exists:
+                    return  # Stay on the Setup tab (already default)
+                self.ui.config["last_known_db_with_tables"] = db_key
                 try:
-                    import config
-                    import database
-                    from importlib import reload
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except:
-                    pass
-                database_exists = False
-        
-        # Select appropriate tab
+                    self.ui.save_config()
+                except Exception as e:
+                    print(f"Warning: Could not save config: {e}")
+                # Don't pull the user off a tab they have already picked
+                if self.ui.notebook.index(self.ui.notebook.select()) == 0:
+                    self._show_initial_tab(True)
+            
+            self.ui.setup_tab_mgr._submit(
+                "initial_tab", lambda: self._probe_database(db_type), on_done,
+                lambda e: print(f"Error checking database: {e}"))
+    
+    def _show_initial_tab(self, database_exists):
+        """Select the Entry tab if the database exists, otherwise the Setup tab"""
         if database_exists:
             # Database exists - show Training Session Entry tab
             self.ui.notebook.select(self.ui.entry_tab)
@@ -175,26 +278,16 @@ class MiscDataOperations:
             self.ui.notebook.select(self.ui.setup_tab)
             self.ui.previous_tab_index = 0
     
-    def save_session_to_json(self, session_data):
+    @_require_backup_folder(interactive=False)
+    def save_session_to_json(self, backup_path, session_data):
         """Save session data to JSON backup file"""
-        backup_folder = sv.backup_folder.get().strip()
-        if not backup_folder:
-            # No backup folder configured, skip
-            return
-        
-        backup_path = Path(backup_folder)
-        if not backup_path.exists():
-            print(f"Warning: Backup folder does not exist: {backup_folder}")
-            return
-        
         # Create filename: <dogname>_session_<number>_<date>.json
         session_num = session_data.get('session_number')
         date_str = session_data.get('date', '').replace('-', '')
         dog_name = session_data.get('dog_name', 'unknown')
         
         # Sanitize dog name for filename (remove special characters)
-        import re
-        safe_dog_name = re.sub(r'[^\w\-]', '_', dog_name)
+        safe_dog_name = _UNSAFE_FILENAME_CHARS.sub('_', dog_name)
         
         filename = f"{safe_dog_name}_session_{session_num}_{date_str}.json"
         filepath = backup_path / filename
@@ -204,336 +297,92 @@ class MiscDataOperations:
             session_data['backup_timestamp'] = datetime.now().isoformat()
             
             # Write JSON file
-            with open(filepath, 'w') as f:
-                json.dump(session_data, f, indent=2, default=str)
+            write_json_atomic(filepath, session_data, indent=2, default=str)
             
             print(f"Session backup saved: {filepath}")
         except Exception as e:
             print(f"Warning: Failed to save session backup: {e}")
     
-    def save_settings_backup(self):
+    @_require_backup_folder(interactive=False)
+    def save_settings_backup(self, backup_path):
         """Save settings to JSON backup file"""
-        backup_folder = sv.backup_folder.get().strip()
-        if not backup_folder:
-            # No backup folder configured, skip
-            return
-        
-        backup_path = Path(backup_folder)
-        if not backup_path.exists():
-            print(f"Warning: Backup folder does not exist: {backup_folder}")
-            return
-        
         try:
             db_type = sv.db_type.get()
             
-            # Collect dogs from database
-            dogs = []
-            try:
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                # Check if database file exists
-                if db_type == "sqlite":
-                    import config as config_module
-                    db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-                    if os.path.exists(db_path):
-                        with database.get_connection() as conn:
-                            result = conn.execute(text("SELECT name FROM dogs ORDER BY name"))
-                            dogs = [row[0] for row in result]
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass  # If database doesn't exist yet, dogs list stays empty
-            
-            # Collect locations from database
-            locations = []
+            # Collect dogs, locations, terrain and distraction types from the
+            # database. Four plain reads from a local file - a read-only sqlite3
+            # connection is enough, no SQLAlchemy engine/pool/result machinery
+            names = {table: [] for table, _label in _SETTINGS_NAME_TABLES}
             try:
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
                 # Check if database file exists
                 if db_type == "sqlite":
-                    import config as config_module
-                    db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
+                    db_path = config.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
                     if os.path.exists(db_path):
-                        with database.get_connection() as conn:
-                            result = conn.execute(text("SELECT name FROM training_locations ORDER BY name"))
-                            locations = [row[0] for row in result]
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
+                        db_uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+                        with closing(sqlite3.connect(db_uri, uri=True)) as conn:
+                            # (sorted below, so no ORDER BY)
+                            for table in names:
+                                names[table] = [row[0] for row in conn.execute(f"SELECT name FROM {table}")]
             except:
-                pass  # If database doesn't exist yet, locations list stays empty
+                pass  # If database doesn't exist yet, the lists stay empty
             
-            # Collect terrain types from database
-            terrain_types = []
-            try:
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                # Check if database file exists
-                if db_type == "sqlite":
-                    import config as config_module
-                    db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-                    if os.path.exists(db_path):
-                        with database.get_connection() as conn:
-                            result = conn.execute(text("SELECT name FROM terrain_types ORDER BY name"))
-                            terrain_types = [row[0] for row in result]
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass  # If database doesn't exist yet, terrain_types list stays empty
-            
-            # Collect distraction types from database
-            distraction_types = []
-            try:
-                import config
-                old_db_type = config.DB_TYPE
-                config.DB_TYPE = db_type
-                
-                from database import engine
-                engine.dispose()
-                from importlib import reload
-                import database
-                reload(database)
-                
-                # Check if database file exists
-                if db_type == "sqlite":
-                    import config as config_module
-                    db_path = config_module.DB_CONFIG["sqlite"]["url"].replace("sqlite:///", "")
-                    if os.path.exists(db_path):
-                        with database.get_connection() as conn:
-                            result = conn.execute(text("SELECT name FROM distraction_types ORDER BY name"))
-                            distraction_types = [row[0] for row in result]
-                
-                # Restore original DB_TYPE
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass  # If database doesn't exist yet, distraction_types list stays empty
-            
-            # Get handler name from config
-            handler_name = self.ui.config.get("handler_name", "")
-            
-            # Create settings dictionary
-            settings = {
-                "dogs": sorted(dogs),
-                "training_locations": sorted(locations),
-                "terrain_types": sorted(terrain_types),
-                "distraction_types": sorted(distraction_types),
-                "handler_name": handler_name,
-                "backup_date": datetime.now().isoformat()
-            }
+            # Create settings dictionary - the sorted name lists, then the
+            # handler name from config
+            settings = {table: sorted(table_names) for table, table_names in names.items()}
+            settings["handler_name"] = self.ui.config.get("handler_name", "")
+            settings["backup_date"] = datetime.now().isoformat()
             
             # Save to file
             settings_path = backup_path / "airscenting_settings.json"
-            with open(settings_path, 'w') as f:
-                json.dump(settings, f, indent=2)
+            write_json_atomic(settings_path, settings, indent=2)
             
             print(f"Settings backup saved: {settings_path}")
             
         except Exception as e:
             print(f"Warning: Failed to save settings backup: {e}")
     
-    def restore_settings_from_json(self):
+    @_require_backup_folder(interactive=True)
+    def restore_settings_from_json(self, backup_path):
         """Restore settings from JSON backup file"""
-        backup_folder = sv.backup_folder.get().strip()
-        if not backup_folder:
-            messagebox.showwarning("No Backup Folder", "Please select a backup folder first")
-            return
-        
-        backup_path = Path(backup_folder)
-        if not backup_path.exists():
-            messagebox.showwarning("Invalid Folder", f"Backup folder does not exist:\n{backup_folder}")
-            return
-        
         settings_path = backup_path / "airscenting_settings.json"
         if not settings_path.exists():
             messagebox.showinfo("No Settings Backup", 
-                               f"No settings backup file found in:\n{backup_folder}\n\n"
+                               f"No settings backup file found in:\n{backup_path}\n\n"
                                f"Looking for: airscenting_settings.json")
             return
         
         try:
             # Load settings
-            with open(settings_path, 'r') as f:
-                settings = json.load(f)
+            raw = settings_path.read_bytes()
+            settings = json.loads(raw)
             
             db_type = sv.db_type.get()
+            user_name = get_username()
             
-            # Insert dogs to database
-            dogs = settings.get("dogs", [])
-            dogs_added = 0
-            
-            if dogs:
-                try:
-                    import config
-                    old_db_type = config.DB_TYPE
-                    config.DB_TYPE = db_type
-                    
-                    from database import engine
-                    engine.dispose()
-                    from importlib import reload
-                    import database
-                    reload(database)
-                    
-                    for dog_name in dogs:
-                        try:
-                            with database.get_connection() as conn:
-                                conn.execute(
-                                    text("INSERT INTO dogs (name, user_name) VALUES (:name, :user_name)"),
-                                    {"name": dog_name, "user_name": get_username()}
-                                )
-                                conn.commit()
-                            dogs_added += 1
-                        except Exception as e:
-                            if "UNIQUE constraint failed" not in str(e) and "duplicate key" not in str(e):
-                                print(f"Failed to add dog '{dog_name}': {e}")
-                    
-                    # Restore original DB_TYPE
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except Exception as e:
-                    print(f"Error restoring dogs: {e}")
-            
-            # Insert locations to database
-            locations = settings.get("training_locations", [])
-            locations_added = 0
-            
-            if locations:
-                try:
-                    import config
-                    old_db_type = config.DB_TYPE
-                    config.DB_TYPE = db_type
-                    
-                    from database import engine
-                    engine.dispose()
-                    from importlib import reload
-                    import database
-                    reload(database)
-                    
-                    for location in locations:
-                        try:
-                            with database.get_connection() as conn:
-                                conn.execute(
-                                    text("INSERT INTO training_locations (name, user_name) VALUES (:name, :user_name)"),
-                                    {"name": location, "user_name": get_username()}
-                                )
-                                conn.commit()
-                            locations_added += 1
-                        except Exception as e:
-                            if "UNIQUE constraint failed" not in str(e) and "duplicate key" not in str(e):
-                                print(f"Failed to add location '{location}': {e}")
-                    
-                    # Restore original DB_TYPE
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except Exception as e:
-                    print(f"Error restoring locations: {e}")
-            
-            # Insert terrain types to database
-            terrain_types = settings.get("terrain_types", [])
-            terrain_added = 0
-            
-            if terrain_types:
-                try:
-                    import config
-                    old_db_type = config.DB_TYPE
-                    config.DB_TYPE = db_type
-                    
-                    from database import engine
-                    engine.dispose()
-                    from importlib import reload
-                    import database
-                    reload(database)
-                    
-                    for terrain in terrain_types:
-                        try:
-                            with database.get_connection() as conn:
-                                conn.execute(
-                                    text("INSERT INTO terrain_types (name, user_name) VALUES (:name, :user_name)"),
-                                    {"name": terrain, "user_name": get_username()}
-                                )
-                                conn.commit()
-                            terrain_added += 1
-                        except Exception as e:
-                            if "UNIQUE constraint failed" not in str(e) and "duplicate key" not in str(e):
-                                print(f"Failed to add terrain type '{terrain}': {e}")
-                    
-                    # Restore original DB_TYPE
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except Exception as e:
-                    print(f"Error restoring terrain types: {e}")
-            
-            # Insert distraction types to database
-            distraction_types = settings.get("distraction_types", [])
-            distraction_added = 0
-            
-            if distraction_types:
-                try:
-                    import config
-                    old_db_type = config.DB_TYPE
-                    config.DB_TYPE = db_type
-                    
-                    from database import engine
-                    engine.dispose()
-                    from importlib import reload
-                    import database
-                    reload(database)
-                    
-                    for distraction in distraction_types:
-                        try:
-                            with database.get_connection() as conn:
-                                conn.execute(
-                                    text("INSERT INTO distraction_types (name, user_name) VALUES (:name, :user_name)"),
-                                    {"name": distraction, "user_name": get_username()}
-                                )
-                                conn.commit()
-                            distraction_added += 1
-                        except Exception as e:
-                            if "UNIQUE constraint failed" not in str(e) and "duplicate key" not in str(e):
-                                print(f"Failed to add distraction type '{distraction}': {e}")
-                    
-                    # Restore original DB_TYPE
-                    config.DB_TYPE = old_db_type
-                    database.engine.dispose()
-                    reload(database)
-                except Exception as e:
-                    print(f"Error restoring distraction types: {e}")
+            # The same backup file already restored into the same database
+            # (see _database_key) would add nothing - check before redoing it
+            restore_stamp = {
+                "settings_hash": hashlib.sha256(raw).hexdigest(),
+                "database": self._database_key(db_type),
+            }
+            if self.ui.config.get("last_restored_settings") == restore_stamp:
+                if not messagebox.askyesno(
+                        "Already Restored",
+                        "This settings backup has already been restored to this database.\n\n"
+                        "Restore it again?"):
+                    return
+            
+            # Insert dogs, locations, terrain and distraction types to database -
+            # one executemany per table, all in one transaction; names already
+            # present are skipped
+            try:
+                added = database.bulk_add_name_lists(
+                    {table: settings.get(table, []) for table, _label in _SETTINGS_NAME_TABLES},
+                    user_name, db_type)
+                self.ui.config["last_restored_settings"] = restore_stamp
+            except Exception as e:
+                print(f"Error restoring names: {e}")
+                added = {}
             
             # Save handler name to config
             if "handler_name" in settings:
@@ -542,32 +391,15 @@ class MiscDataOperations:
             
             self.ui.save_config()
             
-            # Refresh UI
-            self.ui.load_dogs_from_database()
-            if hasattr(self.ui, 'a_dog_combo'):
-                self.ui.refresh_dog_list()
-            
-            self.ui.load_locations_from_database()
-            if hasattr(self.ui, 'a_location_combo'):
-                self.ui.refresh_location_list()
-            
-            # Reload terrain and distraction lists from database
-            self.ui.load_terrain_from_database()
-            self.ui.load_distraction_from_database()
-            # Also refresh Entry tab terrain combobox
-            if hasattr(self.ui, 'a_terrain_combo'):
-                self.ui.refresh_terrain_list()
+            # Refresh UI - dogs, locations, terrain and distraction lists in one round-trip
+            # (also fills the Entry tab dog/location/terrain comboboxes)
+            self.ui.populate_setup_tab_lists()
             
             # Show summary
             msg = "Settings restored successfully!\n\n"
-            if dogs_added > 0:
-                msg += f"Added {dogs_added} dog(s)\n"
-            if locations_added > 0:
-                msg += f"Added {locations_added} location(s)\n"
-            if terrain_added > 0:
-                msg += f"Added {terrain_added} terrain type(s)\n"
-            if distraction_added > 0:
-                msg += f"Added {distraction_added} distraction type(s)\n"
+            for table, label in _SETTINGS_NAME_TABLES:
+                if added.get(table, 0) > 0:
+                    msg += f"Added {added[table]} {label}\n"
             if "handler_name" in settings:
                 msg += f"Restored handler name: {settings['handler_name']}\n"
             
@@ -577,25 +409,123 @@ class MiscDataOperations:
             messagebox.showerror("Restore Error", f"Failed to restore settings:\n{e}")
             print(f"Error restoring settings: {e}")
     
-    def restore_from_json_backups(self, db_type):
+    def _session_restore_rows(self, session_data, user_name):
+        """
+        Build the INSERT parameters for one session backup (see save_session_to_json)
+        
+        Returns:
+            (session row, terrain rows, subject response rows) - the child rows
+            get their session_id once the session is inserted
+        """
+        row_user_name = session_data.get('user_name') or user_name
+        
+        # Convert image_files list to JSON string if present
+        image_files = session_data.get('image_files', [])
+        image_files_json = json.dumps(image_files) if isinstance(image_files, list) else (image_files or "")
+        
+        session_row = {
+            "date": session_data.get('date'),
+            "session_number": session_data.get('session_number'),
+            "handler": session_data.get('handler'),
+            "session_purpose": session_data.get('session_purpose'),
+            "field_support": session_data.get('field_support'),
+            "dog_name": session_data.get('dog_name'),
+            "location": session_data.get('location'),
+            "search_area_size": session_data.get('search_area_size'),
+            "num_subjects": session_data.get('num_subjects'),
+            "handler_knowledge": session_data.get('handler_knowledge'),
+            "weather": session_data.get('weather'),
+            "temperature": session_data.get('temperature'),
+            "wind_direction": session_data.get('wind_direction'),
+            "wind_speed": session_data.get('wind_speed'),
+            "search_type": session_data.get('search_type'),
+            "drive_level": session_data.get('drive_level'),
+            "subjects_found": session_data.get('subjects_found'),
+            "comments": session_data.get('comments', ''),
+            "image_files": image_files_json,
+            "user_name": row_user_name
+        }
+        terrain_rows = [
+            {"terrain_name": terrain_name, "user_name": row_user_name}
+            for terrain_name in session_data.get('selected_terrains', [])
+        ]
+        response_rows = [
+            {
+                "subject_number": response.get('subject_number'),
+                "tfr": response.get('tfr'),
+                "refind": response.get('refind'),
+                "user_name": row_user_name
+            }
+            for response in session_data.get('subject_responses', [])
+            if isinstance(response, dict)
+        ]
+        return session_row, terrain_rows, response_rows
+    
+    def _insert_restored_sessions(self, db_type, sessions):
+        """
+        Insert restored sessions and their terrains/subject responses in one transaction
+        
+        Each table gets a single executemany. Sessions whose number/dog pair is
+        already taken (in the database or earlier in the list) are skipped, as
+        the UNIQUE constraint would reject them. Any other error rolls back the
+        whole batch and is raised.
+        
+        Args:
+            db_type: Database to restore into
+            sessions: (session row, terrain rows, response rows) from _session_restore_rows
+        
+        Returns:
+            Number of sessions inserted
+        """
+        with database.get_engine(db_type).begin() as conn:
+            # session_number is matched as text - backups may hold it as a string
+            taken = {(str(number), dog) for number, dog in conn.execute(_SELECT_SESSION_KEYS)}
+            batch = []
+            for session in sessions:
+                key = (str(session[0]["session_number"]), session[0]["dog_name"])
+                if key in taken:
+                    print(f"Skipping session {key[0]} ({key[1]}) - already in the database")
+                    continue
+                taken.add(key)
+                batch.append(session)
+            if not batch:
+                return 0
+            
+            conn.execute(_RESTORE_SESSION_INSERT,
+                         [session_row for session_row, _terrains, _responses in batch])
+            
+            # One SELECT maps the new rows back to their ids (MySQL has no RETURNING)
+            session_ids = {(str(number), dog): session_id
+                           for session_id, number, dog in conn.execute(_SELECT_SESSION_IDS)}
+            terrain_rows = []
+            response_rows = []
+            for session_row, terrains, responses in batch:
+                session_id = session_ids[(str(session_row["session_number"]), session_row["dog_name"])]
+                terrain_rows.extend({**row, "session_id": session_id} for row in terrains)
+                response_rows.extend({**row, "session_id": session_id} for row in responses)
+            
+            if terrain_rows:
+                conn.execute(database.INSERT_SELECTED_TERRAIN, terrain_rows)
+            if response_rows:
+                conn.execute(database.INSERT_SUBJECT_RESPONSE, response_rows)
+        return len(batch)
+    
+    @_require_backup_folder(interactive=True, failed=False)
+    def restore_from_json_backups(self, backup_path, db_type):
         """Restore database from JSON backup files"""
-        backup_folder = sv.backup_folder.get().strip()
-        if not backup_folder:
-            messagebox.showwarning("No Backup Folder", "No backup folder configured")
-            return False
-        
-        backup_path = Path(backup_folder)
-        if not backup_path.exists():
-            messagebox.showwarning("Invalid Folder", f"Backup folder does not exist:\n{backup_folder}")
-            return False
-        
         # Find all session JSON files (both old and new format)
         # Old format: session_<number>_<date>.json
         # New format: <dogname>_session_<number>_<date>.json
-        json_files = list(backup_path.glob("*session_*.json"))
+        # scandir hands back the names without a stat per entry; dot files
+        # (write_json_atomic's temp files) are skipped
+        with os.scandir(backup_path) as entries:
+            json_files = [Path(entry.path) for entry in entries
+                          if "session_" in entry.name and entry.name.endswith(".json")
+                          and not entry.name.startswith(".")
+                          and entry.is_file(follow_symlinks=False)]
         if not json_files:
             messagebox.showinfo("No Backups Found", 
-                               f"No session backup files found in:\n{backup_folder}")
+                               f"No session backup files found in:\n{backup_path}")
             return False
         
         # Ask user to confirm restore
@@ -619,25 +549,24 @@ class MiscDataOperations:
             working_dialog = None
         
         try:
-            import config
-            old_db_type = config.DB_TYPE
-            config.DB_TYPE = db_type
-            
-            from database import engine
-            engine.dispose()
-            from importlib import reload
-            import database
-            reload(database)
-            
             restored_count = 0
             failed_count = 0
+            user_name = get_username()  # Fallback for backups with no (or an empty) user_name
             dog_names = set()  # Collect unique dog names
             location_names = set()  # Collect unique location names
             
-            for json_file in sorted(json_files):
+            # Pass 1: read every backup into row parameters - nothing touches the
+            # database yet, so a file that won't parse only fails itself. The files
+            # are read on a few threads so their open/read latency overlaps (network
+            # folders especially); map() keeps them in file order.
+            sessions = []  # (session row, terrain rows, subject response rows)
+            json_files = sorted(json_files)
+            with ThreadPoolExecutor(max_workers=8, thread_name_prefix="restore-read") as executor:
+                loaded = list(executor.map(_read_json_file, json_files))
+            for json_file, session_data in zip(json_files, loaded):
                 try:
-                    with open(json_file, 'r') as f:
-                        session_data = json.load(f)
+                    if isinstance(session_data, Exception):
+                        raise session_data
                     
                     # Collect dog name for later insertion
                     dog_name = session_data.get('dog_name')
@@ -649,148 +578,50 @@ class MiscDataOperations:
                     if location:
                         location_names.add(location)
                     
-                    # Insert into database
-                    with database.get_connection() as conn:
-                        # Convert image_files list to JSON string if present
-                        image_files = session_data.get('image_files', [])
-                        image_files_json = json.dumps(image_files) if isinstance(image_files, list) else (image_files or "")
-                        
-                        conn.execute(
-                            text("""
-                                INSERT INTO training_sessions 
-                                (date, session_number, handler, session_purpose, field_support, dog_name, location,
-                                 search_area_size, num_subjects, handler_knowledge, weather, temperature, 
-                                 wind_direction, wind_speed, search_type, drive_level, subjects_found, comments, image_files, user_name)
-                                VALUES (:date, :session_number, :handler, :session_purpose, :field_support, :dog_name, :location,
-                                        :search_area_size, :num_subjects, :handler_knowledge, :weather, :temperature, 
-                                        :wind_direction, :wind_speed, :search_type, :drive_level, :subjects_found, :comments, :image_files, :user_name)
-                            """),
-                            {
-                                "date": session_data.get('date'),
-                                "session_number": session_data.get('session_number'),
-                                "handler": session_data.get('handler'),
-                                "session_purpose": session_data.get('session_purpose'),
-                                "field_support": session_data.get('field_support'),
-                                "dog_name": session_data.get('dog_name'),
-                                "location": session_data.get('location'),
-                                "search_area_size": session_data.get('search_area_size'),
-                                "num_subjects": session_data.get('num_subjects'),
-                                "handler_knowledge": session_data.get('handler_knowledge'),
-                                "weather": session_data.get('weather'),
-                                "temperature": session_data.get('temperature'),
-                                "wind_direction": session_data.get('wind_direction'),
-                                "wind_speed": session_data.get('wind_speed'),
-                                "search_type": session_data.get('search_type'),
-                                "drive_level": session_data.get('drive_level'),
-                                "subjects_found": session_data.get('subjects_found'),
-                                "comments": session_data.get('comments', ''),
-                                "image_files": image_files_json,
-                                "user_name": session_data.get('user_name', get_username())
-                            }
-                        )
-                        conn.commit()
-                        
-                        # Get the session_id we just inserted (for terrains and subject responses)
-                        result = conn.execute(
-                            text("SELECT id FROM training_sessions WHERE session_number = :session_number AND dog_name = :dog_name"),
-                            {"session_number": session_data.get('session_number'), "dog_name": session_data.get('dog_name')}
-                        )
-                        session_row = result.fetchone()
-                        
-                        if session_row:
-                            session_id = session_row[0]
-                            
-                            # Insert selected terrains if present in JSON
-                            selected_terrains = session_data.get('selected_terrains', [])
-                            for terrain_name in selected_terrains:
-                                conn.execute(
-                                    text("""
-                                        INSERT INTO selected_terrains (session_id, terrain_name, user_name)
-                                        VALUES (:session_id, :terrain_name, :user_name)
-                                    """),
-                                    {
-                                        "session_id": session_id,
-                                        "terrain_name": terrain_name,
-                                        "user_name": session_data.get('user_name', get_username())
-                                    }
-                                )
-                            
-                            # Insert subject responses if present in JSON
-                            subject_responses = session_data.get('subject_responses', [])
-                            for response in subject_responses:
-                                if isinstance(response, dict):
-                                    conn.execute(
-                                        text("""
-                                            INSERT INTO subject_responses (session_id, subject_number, tfr, refind, user_name)
-                                            VALUES (:session_id, :subject_number, :tfr, :refind, :user_name)
-                                        """),
-                                        {
-                                            "session_id": session_id,
-                                            "subject_number": response.get('subject_number'),
-                                            "tfr": response.get('tfr'),
-                                            "refind": response.get('refind'),
-                                            "user_name": session_data.get('user_name', get_username())
-                                        }
-                                    )
-                            
-                            conn.commit()
-                    
-                    restored_count += 1
+                    sessions.append(self._session_restore_rows(session_data, user_name))
                     
                 except Exception as e:
                     print(f"Failed to restore {json_file.name}: {e}")
                     failed_count += 1
             
-            # Now insert all unique dog names into dogs table
+            # Pass 2: insert every session and its child rows in one transaction.
+            # If the batch fails (a row the database rejects), fall back to one
+            # transaction per session so only the bad ones are lost.
+            try:
+                restored_count = self._insert_restored_sessions(db_type, sessions)
+                failed_count += len(sessions) - restored_count
+            except Exception as e:
+                print(f"Batch restore failed, restoring sessions one at a time: {e}")
+                for session in sessions:
+                    try:
+                        restored = self._insert_restored_sessions(db_type, [session])
+                    except Exception as e:
+                        print(f"Failed to restore session {session[0]['session_number']} "
+                              f"({session[0]['dog_name']}): {e}")
+                        restored = 0
+                    restored_count += restored
+                    failed_count += 1 - restored
+            
+            if restored_count:
+                self.forget_next_session_numbers(db_type=db_type)
+            
+            # Now insert all unique dog and location names - one executemany each,
+            # names already in the table (UNIQUE) are skipped
             dogs_added = 0
-            for dog_name in sorted(dog_names):
-                try:
-                    with database.get_connection() as conn:
-                        conn.execute(
-                            text("INSERT INTO dogs (name, user_name) VALUES (:name, :user_name)"),
-                            {"name": dog_name, "user_name": get_username()}
-                        )
-                        conn.commit()
-                    dogs_added += 1
-                except Exception as e:
-                    # Dog might already exist (UNIQUE constraint), that's OK
-                    if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
-                        pass  # Duplicate is OK, continue with next dog
-                    else:
-                        pass  # Other errors are logged but don't stop the process
+            try:
+                dogs_added = database.bulk_add_names("dogs", sorted(dog_names), user_name, db_type)
+            except Exception as e:
+                print(f"Failed to add dogs: {e}")
             
-            # Now insert all unique location names into training_locations table
             locations_added = 0
-            for location in sorted(location_names):
-                try:
-                    with database.get_connection() as conn:
-                        conn.execute(
-                            text("INSERT INTO training_locations (name, user_name) VALUES (:name, :user_name)"),
-                            {"name": location, "user_name": get_username()}
-                        )
-                        conn.commit()
-                    locations_added += 1
-                except Exception as e:
-                    # Location might already exist (UNIQUE constraint), that's OK
-                    if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
-                        pass  # Duplicate is OK, continue with next location
-                    else:
-                        pass  # Other errors are logged but don't stop the process
-            
-            # Restore original DB_TYPE
-            config.DB_TYPE = old_db_type
-            database.engine.dispose()
-            reload(database)
-            
-            # Refresh dog list in UI
-            self.ui.load_dogs_from_database()
-            if hasattr(self.ui, 'a_dog_combo'):
-                self.ui.refresh_dog_list()
-            
-            # Refresh location list in UI
-            self.ui.load_locations_from_database()
-            if hasattr(self.ui, 'a_location_combo'):
-                self.ui.refresh_location_list()
+            try:
+                locations_added = database.bulk_add_names("training_locations", sorted(location_names), user_name, db_type)
+            except Exception as e:
+                print(f"Failed to add locations: {e}")
+            
+            # Refresh dog and location lists in UI (Setup listboxes and Entry comboboxes)
+            self.ui.refresh_dog_list()
+            self.ui.refresh_location_list()
             
             # Also try to restore from settings backup if it exists
             settings_restored = False
@@ -800,45 +631,25 @@ class MiscDataOperations:
             settings_path = backup_path / "airscenting_settings.json"
             if settings_path.exists():
                 try:
-                    with open(settings_path, 'r') as f:
+                    with open(settings_path, 'r', encoding='utf-8') as f:
                         settings = json.load(f)
                     
-                    # Insert terrain types
-                    terrain_types = settings.get("terrain_types", [])
-                    for terrain in terrain_types:
-                        try:
-                            with database.get_connection() as conn:
-                                conn.execute(
-                                    text("INSERT INTO terrain_types (name, user_name) VALUES (:name, :user_name)"),
-                                    {"name": terrain, "user_name": get_username()}
-                                )
-                                conn.commit()
-                            terrain_added += 1
-                        except Exception as e:
-                            if "UNIQUE constraint failed" not in str(e) and "duplicate key" not in str(e):
-                                print(f"Failed to add terrain type '{terrain}': {e}")
+                    # Insert terrain and distraction types
+                    try:
+                        terrain_added = database.bulk_add_names(
+                            "terrain_types", settings.get("terrain_types", []), user_name, db_type)
+                    except Exception as e:
+                        print(f"Failed to add terrain types: {e}")
                     
-                    # Insert distraction types
-                    distraction_types = settings.get("distraction_types", [])
-                    for distraction in distraction_types:
-                        try:
-                            with database.get_connection() as conn:
-                                conn.execute(
-                                    text("INSERT INTO distraction_types (name, user_name) VALUES (:name, :user_name)"),
-                                    {"name": distraction, "user_name": get_username()}
-                                )
-                                conn.commit()
-                            distraction_added += 1
-                        except Exception as e:
-                            if "UNIQUE constraint failed" not in str(e) and "duplicate key" not in str(e):
-                                print(f"Failed to add distraction type '{distraction}': {e}")
+                    try:
+                        distraction_added = database.bulk_add_names(
+                            "distraction_types", settings.get("distraction_types", []), user_name, db_type)
+                    except Exception as e:
+                        print(f"Failed to add distraction types: {e}")
                     
-                    # Refresh UI
+                    # Refresh UI (the terrain load also fills the Entry tab combobox)
                     self.ui.load_terrain_from_database()
                     self.ui.load_distraction_from_database()
-                    # Also refresh Entry tab terrain combobox
-                    if hasattr(self.ui, 'a_terrain_combo'):
-                        self.ui.refresh_terrain_list()
                     
                     settings_restored = True
                     
@@ -866,17 +677,6 @@ class MiscDataOperations:
                 return False
             
         except Exception as e:
-            # Restore original DB_TYPE on error
-            try:
-                import config
-                import database
-                from importlib import reload
-                config.DB_TYPE = old_db_type
-                database.engine.dispose()
-                reload(database)
-            except:
-                pass
-            
             messagebox.showerror("Restore Error", f"Failed to restore sessions:\n{e}")
             import traceback
             traceback.print_exc()
@@ -918,13 +718,9 @@ class MiscDataOperations:
                 working_dialog.close(delay_ms=200)
         
         # Refresh UI - both Setup tab AND Entry tab
-        self.ui.load_terrain_from_database()  # Setup tab treeview
+        self.ui.load_terrain_from_database()  # Setup tab treeview + Entry tab terrain combobox
         self.ui.load_distraction_from_database()  # Setup tab treeview
         
-        # CRITICAL: Also refresh Entry tab comboboxes!
-        if hasattr(self.ui, 'a_terrain_combo'):
-            self.ui.refresh_terrain_list()  # Entry tab terrain combobox
-        
         # Show summary
         if terrain_success and distraction_success:
             messagebox.showinfo("Success", 
@@ -2,29 +2,165 @@
 Utility Functions for Air-Scenting Logger
 Helper functions used throughout the application
 """
+import json
+import os
+import tempfile
+from functools import lru_cache
 from getpass import getuser
+from tkinter import ttk
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False  # Optional - the json module is used instead
 
 
+@lru_cache(maxsize=1)
 def get_username():
-    """Get the current system username"""
+    """Get the current system username (looked up once per process)"""
     try:
         return getuser()
     except:
         return "unknown"
 
 
+# Default type lists - built once at import, copied by the getters
+DEFAULT_TERRAIN_TYPES = (
+    "Urban", "Rural", "Forest", "Scrub", "Desert", "Sandy", "Rocky", 
+    "City park", "Meadow", "Dense brush", "Many cacti", "Stream", 
+    "Roadway", "Marsh", "Mixed", "Industrial", "Residential"
+)
+
+DEFAULT_DISTRACTION_TYPES = (
+    "Critter", "Horse", "Loud noise", "Motorcycle", "Hikers", 
+    "Cow", "Vehicle"
+)
+
+
 def get_default_terrain_types():
-    """Get the default terrain type list"""
-    return [
-        "Urban", "Rural", "Forest", "Scrub", "Desert", "Sandy", "Rocky", 
-        "City park", "Meadow", "Dense brush", "Many cacti", "Stream", 
-        "Roadway", "Marsh", "Mixed", "Industrial", "Residential"
-    ]
+    """Get the default terrain type list (a fresh list - callers may reorder it)"""
+    return list(DEFAULT_TERRAIN_TYPES)
 
 
 def get_default_distraction_types():
-    """Get the default distraction type list"""
-    return [
-        "Critter", "Horse", "Loud noise", "Motorcycle", "Hikers", 
-        "Cow", "Vehicle"
-    ]
+    """Get the default distraction type list (a fresh list - callers may reorder it)"""
+    return list(DEFAULT_DISTRACTION_TYPES)
+
+
+def json_bytes(data, indent=None, default=None):
+    """
+    Serialize data to UTF-8 JSON bytes (with orjson when it is installed)
+    
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print if set (orjson only indents by 2, whatever the value)
+        default: Called for objects JSON can't serialize (e.g. str)
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=option)
+    return json.dumps(data, indent=indent, default=default).encode("utf-8")
+
+
+def write_json_atomic(path, data, indent=None, default=None):
+    """
+    Write data to a JSON file in one go
+    
+    The JSON goes to a temp file in the same folder, which then replaces
+    the target, so a crash mid-write never leaves a truncated file behind.
+    The file is UTF-8 - read it back with encoding="utf-8".
+    
+    Args:
+        path: Target file path
+        data: JSON-serializable data
+        indent, default: As for json_bytes
+    """
+    payload = json_bytes(data, indent=indent, default=default)
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def batch_set(pairs):
+    """
+    Set several Tk variables in one pass
+    
+    Variables that already hold the target value are skipped, so they
+    don't generate a Tcl write event (and any attached traces don't fire).
+    
+    Args:
+        pairs: Iterable of (variable, value) tuples
+    """
+    for var, value in pairs:
+        if var.get() != value:
+            var.set(value)
+
+
+def make_scrollable(parent, widget_cls, **kw):
+    """
+    Build a list-style widget with an attached vertical scrollbar
+    
+    Args:
+        parent: Parent widget
+        widget_cls: Widget class to create (e.g. tk.Listbox, ttk.Treeview)
+        **kw: Extra options passed to widget_cls
+    
+    Returns:
+        (container, widget) - pack/grid the container, use the widget
+    """
+    container = ttk.Frame(parent)
+    scrollbar = ttk.Scrollbar(container, orient="vertical")
+    scrollbar.pack(side="right", fill="y")
+    widget = widget_cls(container, yscrollcommand=scrollbar.set, **kw)
+    widget.pack(side="left", fill="both", expand=True)
+    scrollbar.config(command=widget.yview)
+    return container, widget
+
+
+def fill_tree(tree, names):
+    """
+    Replace all rows of a numbered single-column Treeview
+    
+    Clears the old rows in one call and holds the column display while the
+    new rows go in, so the tree lays out once instead of per insert. Rows
+    get their number as iid ("1", "2", ...) rather than a Tk-generated id.
+    
+    Args:
+        tree: ttk.Treeview with a '#' tree column and one value column
+        names: Row values in display order (numbered from 1)
+    """
+    tree.delete(*tree.get_children())
+    display = tree.cget("displaycolumns")
+    tree.configure(displaycolumns=())
+    try:
+        for idx, name in enumerate(names, 1):
+            row = str(idx)
+            tree.insert('', 'end', iid=row, text=row, values=(name,))
+    finally:
+        tree.configure(displaycolumns=display)
+
+
+def swap_tree_rows(tree, item, other):
+    """
+    Swap two rows of a numbered Treeview (see fill_tree) in place
+    
+    The rows trade positions and row numbers; the rest of the tree is
+    left alone, so a move is a few Tk calls however long the list is.
+    """
+    item_text = tree.item(item, 'text')
+    tree.item(item, text=tree.item(other, 'text'))
+    tree.item(other, text=item_text)
+    item_index = tree.index(item)
+    tree.move(item, '', tree.index(other))
+    tree.move(other, '', item_index)